@@ -0,0 +1 @@
+"""asv-style benchmarks for unstruwwel-py (see ``benchmarks/run.py``)."""
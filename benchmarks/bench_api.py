@@ -0,0 +1,85 @@
+"""End-to-end unstruwwel(), pandas column and guess_language() throughput."""
+
+from .corpora import REALISTIC, repetitive, synthetic
+
+from unstruwwel_py import guess_language, unstruwwel, unstruwwel_batch
+from unstruwwel_py.cache import DEFAULT_CACHE_SIZE, cache_clear, set_cache_size
+
+
+class EndToEnd:
+    params = (["en", "de", "fr"], ["time-span", "iso-format", "object"])
+    param_names = ["language", "scheme"]
+
+    def setup(self, lang, scheme):
+        set_cache_size(0)
+        self.texts = synthetic(lang, 2_000)
+
+    def teardown(self, lang, scheme):
+        set_cache_size(DEFAULT_CACHE_SIZE)
+
+    def time_unstruwwel(self, lang, scheme):
+        unstruwwel(self.texts, lang, scheme=scheme)
+
+    def time_unstruwwel_batch(self, lang, scheme):
+        unstruwwel_batch(self.texts, lang, scheme=scheme)
+
+
+class RepetitiveColumn:
+    params = ["en", "de", "fr"]
+    param_names = ["language"]
+
+    def setup(self, lang):
+        self.texts = repetitive(lang, 20_000)
+
+    def time_cached(self, lang):
+        cache_clear()
+        unstruwwel(self.texts, lang)
+
+    def time_dedupe(self, lang):
+        set_cache_size(0)
+        try:
+            unstruwwel(self.texts, lang, dedupe=True)
+        finally:
+            set_cache_size(DEFAULT_CACHE_SIZE)
+
+
+class DataFrameColumn:
+    params = ["en", "de", "fr"]
+    param_names = ["language"]
+
+    def setup(self, lang):
+        try:
+            import pandas as pd
+        except ImportError:
+            raise NotImplementedError("pandas is not installed")
+        from unstruwwel_py.accessor import parse_series
+
+        self.parse_series = parse_series
+        self.series = pd.Series(synthetic(lang, 20_000))
+        cache_clear()
+
+    def time_objects(self, lang):
+        # The round trip the accessor replaces
+        for p in unstruwwel(list(self.series), lang, scheme="object"):
+            (p.time_span, p.iso_format, p.fuzzy)
+
+    def time_accessor(self, lang):
+        self.parse_series(self.series, lang)
+
+
+class GuessLanguage:
+    params = ["en", "de", "fr"]
+    param_names = ["language"]
+
+    def setup(self, lang):
+        self.texts = [t for t in REALISTIC[lang] if not t[:1].isdigit()]
+
+    def time_guess_per_string(self, lang):
+        for t in self.texts:
+            try:
+                guess_language([t])
+            except ValueError:
+                pass
+
+    def time_guess_column(self, lang):
+        guess_language(self.texts)
@@ -0,0 +1,31 @@
+"""Start-up cost: importing the package and the first auto-language parse.
+
+Each benchmark runs a fresh interpreter; compare against ``time_python``
+for the bare interpreter start-up.
+"""
+
+import os
+import subprocess
+import sys
+
+_FIRST_PARSE = "import unstruwwel_py; unstruwwel_py.unstruwwel('gegossen um 1900')"
+
+
+def _run(code, **env):
+    subprocess.run([sys.executable, "-c", code], check=True, env={**os.environ, **env})
+
+
+class ImportTime:
+    repeat = 3
+
+    def time_python(self):
+        _run("pass")
+
+    def time_import(self):
+        _run("import unstruwwel_py")
+
+    def time_first_parse_lingua(self):
+        _run(_FIRST_PARSE, UNSTRUWWEL_NO_LINGUA="0")
+
+    def time_first_parse_no_lingua(self):
+        _run(_FIRST_PARSE, UNSTRUWWEL_NO_LINGUA="1")
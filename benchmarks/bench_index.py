@@ -0,0 +1,90 @@
+"""IntervalIndex construction and range queries over many time spans."""
+
+import random
+
+from unstruwwel_py import IntervalIndex
+
+SIZE = 200_000
+
+
+def _spans(n):
+    rng = random.Random(0)
+    spans = []
+    for _ in range(n):
+        s = rng.randint(1000, 1950)
+        kind = rng.random()
+        if kind < 0.05:
+            spans.append((float("-inf"), s))
+        elif kind < 0.1:
+            spans.append((s, float("inf")))
+        else:
+            spans.append((s, s + rng.choice([0, 0, 9, 99])))
+    return spans
+
+
+class IndexBuild:
+    def setup(self):
+        self.spans = _spans(SIZE)
+
+    def time_from_results(self):
+        IntervalIndex.from_results(self.spans)
+
+
+def _arrays():
+    try:
+        import numpy as np
+    except ImportError:
+        raise NotImplementedError("numpy is not installed")
+    from unstruwwel_py.columnar import TimeSpanArrays
+
+    start, end = np.array(_spans(SIZE)).T
+    zeros = np.zeros(SIZE, dtype=np.int8)
+    return TimeSpanArrays(start, end, zeros, zeros, np.arange(SIZE))
+
+
+class IndexBuildArrays:
+    def setup(self):
+        self.arrays = _arrays()
+
+    def time_from_arrays(self):
+        IntervalIndex.from_arrays(self.arrays)
+
+
+class IndexQuery:
+    def setup(self):
+        self.index = IntervalIndex.from_results(_spans(SIZE))
+        rng = random.Random(1)
+        self.years = [rng.randint(1000, 1950) for _ in range(200)]
+
+    def time_overlapping(self):
+        for y in self.years:
+            self.index.overlapping(y, y + 10)
+
+    def time_at(self):
+        for y in self.years:
+            self.index.at(y)
+
+    def time_before(self):
+        for y in self.years:
+            self.index.before(y - 800)
+
+
+class IndexQueryArrays:
+    """IndexQuery on an index built from arrays, and a full NumPy scan."""
+
+    def setup(self):
+        self.arrays = _arrays()
+        self.index = IntervalIndex.from_arrays(self.arrays)
+        rng = random.Random(1)
+        self.years = [rng.randint(1000, 1950) for _ in range(200)]
+
+    time_overlapping = IndexQuery.time_overlapping
+    time_at = IndexQuery.time_at
+    time_before = IndexQuery.time_before
+
+    def time_overlapping_scan(self):
+        import numpy as np
+
+        start, end = self.arrays.start, self.arrays.end
+        for y in self.years:
+            np.flatnonzero((start <= y + 10) & (end >= y))
@@ -0,0 +1,32 @@
+"""Memory held by parse results (bytes per object, via tracemalloc)."""
+
+import gc
+import tracemalloc
+
+from unstruwwel_py import unstruwwel
+
+N = 100_000
+
+
+def _bytes_per_item(make):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        items = make()
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return size / len(items)
+
+
+class ResultMemory:
+    unit = "bytes/result"
+
+    def setup(self):
+        self.texts = ["ca. 1920", "19. Jh.", "vor 1800", "1760er Jahre"] * (N // 4)
+
+    def track_object_scheme(self):
+        return _bytes_per_item(lambda: unstruwwel(self.texts, "de", scheme="object"))
+
+    def track_time_span_scheme(self):
+        return _bytes_per_item(lambda: unstruwwel(self.texts, "de"))
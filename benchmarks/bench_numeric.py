@@ -0,0 +1,44 @@
+"""Numeric fast path versus the regex parsers."""
+
+import random
+
+from unstruwwel_py.cache import DEFAULT_CACHE_SIZE, set_cache_size
+from unstruwwel_py.core import _parse_single, _parse_text
+from unstruwwel_py.resources import get_language_spec
+
+
+def numeric_corpus(n=10_000, seed=0):
+    rng = random.Random(seed)
+    out = []
+    for _ in range(n):
+        y = rng.randint(100, 2020)
+        kind = rng.random()
+        if kind < 0.7:
+            out.append(str(y))
+        elif kind < 0.8:
+            out.append(f"-{y}")
+        else:
+            out.append(f"{y}/{str(y + rng.randint(1, 9))[-2:]}")
+    return out
+
+
+class NumericFastPath:
+    def setup(self):
+        set_cache_size(0)
+        self.spec = get_language_spec("en")
+        self.texts = numeric_corpus()
+
+    def teardown(self):
+        set_cache_size(DEFAULT_CACHE_SIZE)
+
+    def time_fast_path(self):
+        for t in self.texts:
+            _parse_single(t, "en", "time-span")
+
+    def time_regex_path(self):
+        for t in self.texts:
+            _parse_text(t, t, self.spec, "time-span")
+
+    def time_fast_path_language_none(self):
+        for t in self.texts:
+            _parse_single(t, None, "time-span")
@@ -0,0 +1,59 @@
+"""Per-parser throughput on inputs each parser is meant to match."""
+
+from unstruwwel_py.core import _PARSERS
+from unstruwwel_py.keywords import fuzzy_from_hits
+from unstruwwel_py.scan import scan_text
+from unstruwwel_py.parsers.intervals import parse_multi_dates
+from unstruwwel_py.resources import get_language_spec
+
+INPUTS = {
+    "decade": ("en", ["1840s", "1760s", "1550s"]),
+    "year_interval": ("en", ["1752/60", "1701/1702", "1850/9"]),
+    "before_after": ("en", ["before 1856", "after June 1860", "before winter 1700"]),
+    "season": ("en", ["autumn 1945", "winter 1620", "spring 1700"]),
+    "month_year": ("de", ["märz 1755", "juli 1882", "dezember 1799"]),
+    "day_month_year": ("en", ["august 11, 1958", "january 1, 1856"]),
+    "century": ("de", ["19. jh.", "5. jh. v. chr", "ca. 1. hälfte 2. jh."]),
+    "date": ("en", ["1856", "-450", "999"]),
+}
+
+MULTI_INPUTS = [
+    "(guss vor 1906) 1897",
+    "13. juli 1882 - 15. juli 1882",
+    "nach dem sommer 1750 - vor 1800",
+]
+
+REPEAT = 500
+
+
+class ParserThroughput:
+    params = sorted(INPUTS)
+    param_names = ["parser"]
+
+    def setup(self, name):
+        lang, texts = INPUTS[name]
+        spec = get_language_spec(lang)
+        self.parse = _PARSERS[name]
+        calls = []
+        for t in texts:
+            scan = scan_text(t.lower(), spec)
+            calls.append(
+                (t, t.lower(), spec, spec.patterns, fuzzy_from_hits(scan.hits), scan)
+            )
+        self.calls = calls * REPEAT
+
+    def time_parse(self, name):
+        parse = self.parse
+        for args in self.calls:
+            parse(*args)
+
+
+class MultiDates:
+    def setup(self):
+        spec = get_language_spec("de")
+        calls = [(t, spec.patterns, spec, 0, scan_text(t, spec)) for t in MULTI_INPUTS]
+        self.calls = calls * REPEAT
+
+    def time_parse_multi_dates(self):
+        for args in self.calls:
+            parse_multi_dates(*args)
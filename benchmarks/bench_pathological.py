@@ -0,0 +1,42 @@
+"""Worst-case latency on inputs that make backtracking regexes go quadratic.
+
+Each input is a few characters of date syntax padded with a long run of
+whitespace, which the century patterns rescan from every start position
+under Python's ``re``. With ``re2`` or an input length limit the time per
+input stays bounded.
+"""
+
+from unstruwwel_py import set_input_limits, set_regex_engine, unstruwwel
+from unstruwwel_py.cache import DEFAULT_CACHE_SIZE, set_cache_size
+
+INPUTS = {
+    "ordinal_spaces": lambda n: "1." + " " * n + "x",
+    "century_spaces": lambda n: "19 " + " " * n + "jh" + " " * n + "v",
+}
+
+MAX_LENGTH = 1_000
+
+
+class Pathological:
+    params = (sorted(INPUTS), [1_000, 4_000], ["re", "re2", "max-length"])
+    param_names = ["input", "size", "guard"]
+    repeat = 3
+
+    def setup(self, name, size, guard):
+        set_cache_size(0)
+        if guard == "re2":
+            try:
+                set_regex_engine("re2")
+            except ImportError:
+                raise NotImplementedError("google-re2 is not installed")
+        elif guard == "max-length":
+            set_input_limits(max_length=MAX_LENGTH)
+        self.texts = [INPUTS[name](size)]
+
+    def teardown(self, name, size, guard):
+        set_regex_engine("re")
+        set_input_limits()
+        set_cache_size(DEFAULT_CACHE_SIZE)
+
+    def time_unstruwwel(self, name, size, guard):
+        unstruwwel(self.texts, "de")
@@ -0,0 +1,134 @@
+"""Benchmark corpora: realistic catalogue values and synthetic generators."""
+
+import random
+
+REALISTIC = {
+    "en": [
+        "1856",
+        "1752/60",
+        "1840s",
+        "mid-1880s",
+        "June 1963",
+        "August 11, 1958",
+        "ca. 1920",
+        "before 1856",
+        "after June 1860",
+        "Autumn 1945",
+        "Winter 1620",
+        "5th century b.c.",
+        "late 16th century",
+        "circa 18th century",
+        "last third 17th cent",
+        "1st half 5th century",
+        "probably 1750",
+        "1897 (before 1906)",
+        "unknown",
+    ],
+    "de": [
+        "1856",
+        "19. Jh.",
+        "5. Jh. v. Chr",
+        "1760er Jahre",
+        "etwa 1550er Jahre",
+        "undatiert",
+        "wohl nach 1923",
+        "spätestens 1750er Jahre",
+        "(Guss vor 1906) 1897",
+        "13. Juli 1882 - 15. Juli 1882",
+        "vor dem Sommer 1907",
+        "nach Frühling 1755",
+        "ca. 1. Hälfte 2. Jh.",
+        "ca. 2. Jh. v. Chr",
+        "März 1755",
+        "um 1900",
+        "letztes Drittel 17. Jh.",
+    ],
+    "fr": [
+        "1856",
+        "vers 1750",
+        "avant 1800",
+        "après 1800",
+        "janvier 1750",
+        "hiver 1620",
+        "1750/60",
+        "première moitié 18e siècle",
+        "dernier tiers 17e siècle",
+        "(vers 1750) 1760",
+    ],
+}
+
+_TEMPLATES = {
+    "en": [
+        "{y}",
+        "{y}/{yy}",
+        "{d}0s",
+        "ca. {y}",
+        "before {y}",
+        "after {month} {y}",
+        "{month} {y}",
+        "{season} {y}",
+        "{c}th century",
+        "last third {c}th cent",
+        "({y}) {y2}",
+    ],
+    "de": [
+        "{y}",
+        "{d}0er Jahre",
+        "um {y}",
+        "vor {y}",
+        "nach dem {season} {y}",
+        "{month} {y}",
+        "{c}. Jh.",
+        "1. Hälfte {c}. Jh.",
+        "(Guss vor {y}) {y2}",
+        "{day}. {month} {y} - {day}. {month} {y}",
+    ],
+    "fr": [
+        "{y}",
+        "vers {y}",
+        "avant {y}",
+        "après {y}",
+        "{month} {y}",
+        "{season} {y}",
+        "{c}e siècle",
+    ],
+}
+
+_MONTHS = {
+    "en": ["January", "March", "June", "October"],
+    "de": ["Januar", "März", "Juli", "Oktober"],
+    "fr": ["janvier", "mars", "juillet", "octobre"],
+}
+_SEASONS = {
+    "en": ["Spring", "Summer", "Autumn", "Winter"],
+    "de": ["Frühling", "Sommer", "Herbst", "Winter"],
+    "fr": ["printemps", "été", "automne", "hiver"],
+}
+
+
+def synthetic(lang, n=5_000, seed=0):
+    """``n`` generated date strings for ``lang`` (deterministic per seed)."""
+    rng = random.Random(seed)
+    templates = _TEMPLATES[lang]
+    out = []
+    for _ in range(n):
+        y = rng.randint(1000, 1950)
+        out.append(
+            rng.choice(templates).format(
+                y=y,
+                y2=y + rng.randint(1, 40),
+                yy=str(y + rng.randint(1, 9))[-2:],
+                d=y // 10,
+                c=rng.randint(11, 19),
+                day=rng.randint(1, 28),
+                month=rng.choice(_MONTHS[lang]),
+                season=rng.choice(_SEASONS[lang]),
+            )
+        )
+    return out
+
+
+def repetitive(lang, n=5_000, seed=0):
+    """``n`` values drawn from the realistic list, like a catalogue column."""
+    rng = random.Random(seed)
+    return [rng.choice(REALISTIC[lang]) for _ in range(n)]
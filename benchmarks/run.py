@@ -0,0 +1,110 @@
+"""Run the asv-style benchmarks without asv.
+
+Every ``bench_*.py`` module in this package is scanned for classes with
+``time_*`` methods (timed) and ``track_*`` methods (which return the value
+to record, in the class's ``unit``); ``params``/``param_names``, ``setup``
+and ``teardown`` follow asv conventions (including skipping a benchmark by
+raising ``NotImplementedError`` in ``setup``), so the same files also work
+under asv. Usage::
+
+    python -m benchmarks.run                      # all benchmarks
+    python -m benchmarks.run -k century           # name filter
+    python -m benchmarks.run --json results.json  # save timings
+    python -m benchmarks.run --compare base.json  # flag regressions
+
+With ``--compare`` the exit status is 1 when any benchmark is slower than
+the baseline by more than ``--threshold`` (default 1.2x).
+"""
+
+import argparse
+import importlib
+import itertools
+import json
+import pkgutil
+import sys
+import timeit
+from pathlib import Path
+
+
+def discover():
+    """Yield ``(name, cls, method, params)`` for every benchmark."""
+    pkg = Path(__file__).resolve().parent
+    for info in sorted(pkgutil.iter_modules([str(pkg)]), key=lambda m: m.name):
+        if not info.name.startswith("bench_"):
+            continue
+        module = importlib.import_module(f"{__package__}.{info.name}")
+        for cls_name in sorted(vars(module)):
+            cls = getattr(module, cls_name)
+            if not isinstance(cls, type) or cls.__module__ != module.__name__:
+                continue
+            params = getattr(cls, "params", None)
+            if params is None:
+                combos = [()]
+            elif params and isinstance(params[0], (list, tuple)):
+                combos = list(itertools.product(*params))
+            else:
+                combos = [(p,) for p in params]
+            methods = [m for m in vars(cls) if m.startswith(("time_", "track_"))]
+            for method in sorted(methods):
+                for combo in combos:
+                    label = f"{info.name[6:]}.{cls_name}.{method}"
+                    if combo:
+                        label += "(" + ", ".join(map(str, combo)) + ")"
+                    yield label, cls, method, combo
+
+
+def measure(cls, method, combo, repeat):
+    bench = cls()
+    if hasattr(bench, "setup"):
+        bench.setup(*combo)
+    try:
+        fn = getattr(bench, method)
+        if method.startswith("track_"):
+            return fn(*combo)
+        repeat = getattr(bench, "repeat", repeat)
+        return min(timeit.repeat(lambda: fn(*combo), number=1, repeat=repeat))
+    finally:
+        if hasattr(bench, "teardown"):
+            bench.teardown(*combo)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-k", dest="filter", help="only names containing this")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", help="write timings to this file")
+    parser.add_argument("--compare", help="baseline timings from --json")
+    parser.add_argument("--threshold", type=float, default=1.2)
+    args = parser.parse_args(argv)
+
+    base = json.loads(Path(args.compare).read_text()) if args.compare else {}
+    results = {}
+    regressions = 0
+    for label, cls, method, combo in discover():
+        if args.filter and args.filter not in label:
+            continue
+        try:
+            value = measure(cls, method, combo, args.repeat)
+        except NotImplementedError:
+            print(f"{label:<70} {'skipped':>10}", flush=True)
+            continue
+        results[label] = value
+        if method.startswith("track_"):
+            line = f"{label:<70} {value:10.2f} {getattr(cls, 'unit', '')}"
+        else:
+            line = f"{label:<70} {value * 1e3:10.2f} ms"
+        if label in base:
+            ratio = value / base[label]
+            line += f"  {ratio:5.2f}x"
+            if ratio > args.threshold:
+                line += "  REGRESSION"
+                regressions += 1
+        print(line, flush=True)
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2, sort_keys=True))
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,13 +1,44 @@
-from .core import unstruwwel, get_item
+from .core import (
+    unstruwwel,
+    unstruwwel_batch,
+    iter_unstruwwel,
+    Parser,
+    get_item,
+    set_input_limits,
+    get_input_limits,
+)
 from .periods import Year, Decade, Century, Periods
-from .lang import guess_language
+from .lang import guess_language, preload_detector, set_lingua_enabled
+from .cache import cache_info, cache_clear, set_cache_size
+from .resources import set_regex_engine, get_regex_engine
+from .columnar import TimeSpanArrays, unstruwwel_array
+from .extract import DateMatch, extract_dates, iter_dates
+from .index import IntervalIndex
 
 __all__ = [
     "unstruwwel",
+    "unstruwwel_batch",
+    "iter_unstruwwel",
+    "Parser",
     "get_item",
     "Year",
     "Decade",
     "Century",
     "Periods",
     "guess_language",
+    "preload_detector",
+    "set_lingua_enabled",
+    "cache_info",
+    "cache_clear",
+    "set_cache_size",
+    "set_input_limits",
+    "get_input_limits",
+    "set_regex_engine",
+    "get_regex_engine",
+    "TimeSpanArrays",
+    "unstruwwel_array",
+    "DateMatch",
+    "extract_dates",
+    "iter_dates",
+    "IntervalIndex",
 ]
@@ -0,0 +1,197 @@
+"""pandas and Arrow integration.
+
+Importing this module registers a ``Series.unstruwwel`` accessor when pandas
+is installed::
+
+    import unstruwwel_py.accessor  # noqa: F401
+
+    df[["start", "end", "iso", "fuzzy", "express"]] = df["date"].unstruwwel.parse(
+        language="de"
+    )
+
+:func:`parse_arrow` does the same for a ``pyarrow.Array`` and returns a
+``StructArray``. Both parse every distinct value of the column once and
+build the result columns without creating per-row Python objects.
+"""
+
+from __future__ import annotations
+
+from typing import Any, List, NamedTuple, Optional, Sequence
+
+from .core import PERIOD_SCHEME, _check_language, _parse_single, _rows_to_list
+from .lang import guess_column_language
+from .resources import get_language_spec
+
+FIELDS = ("start", "end", "iso", "fuzzy", "express")
+
+
+class _Columns(NamedTuple):
+    start: Any  # float64 ndarray
+    end: Any  # float64 ndarray
+    iso: Any  # object ndarray
+    fuzzy: Any  # int8 ndarray
+    express: Any  # int8 ndarray
+    row: Any  # intp ndarray; input row of each entry
+
+
+def _parse_codes(
+    codes: Any, uniques: Sequence[Any], language: Optional[str], explode: bool
+) -> _Columns:
+    """Parse ``uniques`` and expand their results to the rows in ``codes``.
+
+    ``codes`` holds, for each input row, the index of its value in
+    ``uniques`` or -1 for missing values. Without ``explode`` each row gets
+    its first result; with it, multi-date rows contribute one entry per date.
+    """
+    import numpy as np
+
+    texts = [v if v is None or isinstance(v, str) else str(v) for v in uniques]
+    if language is None:
+        language, _ = guess_column_language(texts)
+    _check_language(language, "time-span")
+    spec = get_language_spec(language)
+
+    def parse(t: Optional[str]) -> Any:
+        return _parse_single(t, language, PERIOD_SCHEME, spec)
+
+    # Flat per-unique results; the extra last slot is the NA row used for
+    # missing values (code -1)
+    nan = float("nan")
+    counts: List[int] = []
+    start: List[float] = []
+    end: List[float] = []
+    iso: List[Optional[str]] = []
+    fuzzy: List[int] = []
+    express: List[int] = []
+    for t in texts + [None]:
+        periods = _rows_to_list(parse(t))
+        counts.append(len(periods))
+        for p in periods:
+            if p is None:
+                start.append(nan)
+                end.append(nan)
+                iso.append(None)
+                fuzzy.append(0)
+                express.append(0)
+                continue
+            lo, hi = p.time_span
+            start.append(lo)
+            end.append(hi)
+            iso.append(p.iso_format)
+            fuzzy.append(p.fuzzy)
+            express.append(p.express)
+
+    codes = np.asarray(codes, dtype=np.intp)
+    n_counts = np.array(counts, dtype=np.intp)
+    offsets = np.concatenate(([0], np.cumsum(n_counts)[:-1]))
+    # -1 indexes the NA slot appended last
+    first = offsets[codes]
+    if explode:
+        reps = n_counts[codes]
+        row = np.repeat(np.arange(len(codes), dtype=np.intp), reps)
+        within = np.arange(len(row), dtype=np.intp) - np.repeat(
+            np.cumsum(reps) - reps, reps
+        )
+        take = np.repeat(first, reps) + within
+    else:
+        row = np.arange(len(codes), dtype=np.intp)
+        take = first
+
+    return _Columns(
+        np.array(start, dtype=np.float64)[take],
+        np.array(end, dtype=np.float64)[take],
+        np.array(iso, dtype=object)[take],
+        np.array(fuzzy, dtype=np.int8)[take],
+        np.array(express, dtype=np.int8)[take],
+        row,
+    )
+
+
+def parse_series(
+    series: Any, language: Optional[str] = None, explode: bool = False
+) -> Any:
+    """Parse a pandas Series of date strings into a DataFrame.
+
+    Args:
+        series: Series of strings; missing values give NA rows
+        language: Language code, or None to guess it once for the column
+        explode: Emit one row per date for multi-date values, repeating the
+            index (as ``Series.explode`` does); otherwise keep the first date
+
+    Returns:
+        DataFrame with columns ``start``, ``end`` (float, ``-inf``/``inf``
+        for open ends, NaN for no date), ``iso``, ``fuzzy`` and ``express``
+    """
+    import pandas as pd
+
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    cols = _parse_codes(codes, list(uniques), language, explode)
+    index = series.index[cols.row] if explode else series.index
+    return pd.DataFrame(
+        {name: getattr(cols, name) for name in FIELDS}, index=index, copy=False
+    )
+
+
+def parse_arrow(
+    array: Any, language: Optional[str] = None, explode: bool = False
+) -> Any:
+    """Parse a ``pyarrow`` string array into a ``StructArray``.
+
+    Args:
+        array: ``pyarrow.Array`` or ``ChunkedArray`` of strings
+        language: Language code, or None to guess it once for the column
+        explode: Emit one entry per date for multi-date values and add a
+            ``row`` field with the input position; otherwise keep the first
+            date
+
+    Returns:
+        StructArray with fields ``start``, ``end`` (float64, null for no
+        date), ``iso`` (string), ``fuzzy`` and ``express`` (int8)
+    """
+    import numpy as np
+    import pyarrow as pa
+
+    if isinstance(array, pa.ChunkedArray):
+        array = array.combine_chunks()
+    encoded = array.dictionary_encode()
+    codes = encoded.indices.fill_null(-1).to_numpy(zero_copy_only=False)
+    cols = _parse_codes(codes, encoded.dictionary.to_pylist(), language, explode)
+
+    missing = np.isnan(cols.start)
+    arrays = [
+        pa.array(cols.start, mask=missing),
+        pa.array(cols.end, mask=missing),
+        pa.array(cols.iso, type=pa.string()),
+        pa.array(cols.fuzzy),
+        pa.array(cols.express),
+    ]
+    names = list(FIELDS)
+    if explode:
+        arrays.append(pa.array(cols.row, type=pa.int64()))
+        names.append("row")
+    return pa.StructArray.from_arrays(arrays, names=names)
+
+
+class UnstruwwelAccessor:
+    """``Series.unstruwwel`` accessor (see :func:`parse_series`)."""
+
+    def __init__(self, series: Any) -> None:
+        self._series = series
+
+    def parse(self, language: Optional[str] = None, explode: bool = False) -> Any:
+        return parse_series(self._series, language, explode)
+
+
+def register_accessor() -> None:
+    """Register ``Series.unstruwwel``; called on import when pandas exists."""
+    import pandas as pd
+
+    pd.api.extensions.register_series_accessor("unstruwwel")(UnstruwwelAccessor)
+
+
+try:
+    import pandas  # noqa: F401
+except ImportError:  # pragma: no cover - depends on environment
+    pass
+else:
+    register_accessor()
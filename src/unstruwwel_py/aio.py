@@ -0,0 +1,46 @@
+"""asyncio front end for parsing inside event loops."""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Executor
+from typing import List, Optional, Sequence, Union
+
+from .core import Result, _check_language
+from .parallel import _parse_chunk
+
+DEFAULT_CHUNKSIZE = 1_000
+
+
+async def aunstruwwel(
+    texts: Optional[Union[str, Sequence[Optional[str]]]],
+    language: Optional[str] = None,
+    scheme: str = "time-span",
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    executor: Optional[Executor] = None,
+) -> List[Result]:
+    """Async counterpart of :func:`~unstruwwel_py.core.unstruwwel`.
+
+    The input is parsed in chunks of ``chunksize`` items on ``executor``
+    (the loop's default thread pool when None), so the event loop keeps
+    serving other tasks between and during chunks. For a process pool use
+    :func:`~unstruwwel_py.parallel.process_pool`: a plain
+    ``ProcessPoolExecutor`` does not pass the regex engine and input limits
+    on to spawned workers. Cancelling the awaiting task stops before the next
+    chunk; the chunk in flight is finished by the executor and discarded.
+    """
+    if texts is None or isinstance(texts, str):
+        texts = [texts]
+    _check_language(language, scheme)
+    if chunksize < 1:
+        raise ValueError("chunksize must be >= 1")
+
+    loop = asyncio.get_running_loop()
+    out: List[Result] = []
+    for i in range(0, len(texts), chunksize):
+        rows = await loop.run_in_executor(
+            executor, _parse_chunk, texts[i : i + chunksize], language, scheme
+        )
+        for row in rows:
+            out.extend(row)
+    return out
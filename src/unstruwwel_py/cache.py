@@ -0,0 +1,92 @@
+"""Bounded LRU cache for parse results of repeated date strings."""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, NamedTuple
+
+DEFAULT_CACHE_SIZE = 4096
+
+MISSING = object()
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache:
+    """Thread-safe least-recently-used mapping with hit/miss counters.
+
+    A ``maxsize`` of 0 disables the cache: lookups always miss and nothing
+    is stored.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE) -> None:
+        if maxsize < 0:
+            raise ValueError("maxsize must be >= 0")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        """Return the cached value or :data:`MISSING`."""
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return MISSING
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            if not self.maxsize:
+                return
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def resize(self, maxsize: int) -> None:
+        if maxsize < 0:
+            raise ValueError("maxsize must be >= 0")
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._data) > maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+
+PARSE_CACHE = LRUCache()
+
+
+def set_cache_size(maxsize: int) -> None:
+    """Resize the parse result cache; 0 disables it."""
+    PARSE_CACHE.resize(maxsize)
+
+
+def cache_info() -> CacheInfo:
+    """Hit/miss statistics of the parse result cache."""
+    return PARSE_CACHE.info()
+
+
+def cache_clear() -> None:
+    """Empty the parse result cache and reset its statistics."""
+    PARSE_CACHE.clear()
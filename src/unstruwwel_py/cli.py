@@ -0,0 +1,305 @@
+"""Command-line bulk converter.
+
+Usage::
+
+    unstruwwel-py parse dates.csv --column date --language de > parsed.csv
+    zcat export.jsonl.gz | unstruwwel-py parse --format jsonl -c date -l en
+
+Input rows are read, parsed and written in batches, so files of any size
+are converted in constant memory. The parsed fields are appended to each
+row; rows with several dates are repeated once per date.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import io
+import json
+import sys
+import time
+from collections import deque
+from itertools import islice
+from typing import IO, Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .cache import PARSE_CACHE, set_cache_size
+from .core import (
+    PERIOD_SCHEME,
+    _check_language,
+    _parse_single,
+    _rows_to_list,
+    set_input_limits,
+)
+from .dates import Period
+from .resources import REGEX_ENGINES, get_language_spec, set_regex_engine
+
+FORMATS = ("csv", "tsv", "jsonl")
+# Fields appended to each row, per output scheme
+SCHEME_FIELDS = {
+    "time-span": ("start", "end"),
+    "iso-format": ("iso",),
+    "object": ("start", "end", "iso", "fuzzy", "express"),
+}
+BATCH_SIZE = 2_000
+BUFFER_SIZE = 1 << 20
+
+
+def _infer_format(path: Optional[str]) -> str:
+    if path and path != "-":
+        name = path.lower()
+        if name.endswith(".tsv"):
+            return "tsv"
+        if name.endswith((".jsonl", ".ndjson")):
+            return "jsonl"
+    return "csv"
+
+
+def _fields(p: Optional[Period]) -> Dict[str, Any]:
+    if p is None:
+        return {"start": None, "end": None, "iso": None, "fuzzy": 0, "express": 0}
+    start, end = p.time_span
+    return {
+        "start": start,
+        "end": end,
+        "iso": p.iso_format,
+        "fuzzy": p.fuzzy,
+        "express": p.express,
+    }
+
+
+def _json_value(v: Any) -> Any:
+    # JSON has no infinity: open ends are written as strings
+    if isinstance(v, float) and v in (float("inf"), -float("inf")):
+        return "inf" if v > 0 else "-inf"
+    return v
+
+
+def _csv_value(v: Any) -> Any:
+    return "" if v is None else v
+
+
+def _read_rows(
+    stream: IO[str], fmt: str
+) -> Tuple[Optional[List[str]], Iterator[Dict[str, Any]]]:
+    """Header (None for JSONL) and rows of the input."""
+    if fmt == "jsonl":
+        return None, _read_jsonl(stream)
+    reader = csv.DictReader(stream, delimiter="\t" if fmt == "tsv" else ",")
+    return list(reader.fieldnames or ()), iter(reader)
+
+
+def _read_jsonl(stream: IO[str]) -> Iterator[Dict[str, Any]]:
+    for n, line in enumerate(stream, 1):
+        if line.strip():
+            record = json.loads(line)
+            if not isinstance(record, dict):
+                raise ValueError(f"line {n}: expected a JSON object")
+            yield record
+
+
+def _batches(rows: Iterable[Dict[str, Any]], size: int) -> Iterator[List[Dict]]:
+    it = iter(rows)
+    while True:
+        batch = list(islice(it, size))
+        if not batch:
+            return
+        yield batch
+
+
+def _cell(value: Any) -> Optional[str]:
+    # Empty cells are missing values, not strings to guess a language for;
+    # JSONL may hold numbers (e.g. a bare year)
+    if value is None or isinstance(value, str):
+        return value or None
+    return str(value)
+
+
+def _parse_batches(
+    batches: Iterable[List[Dict[str, Any]]],
+    column: str,
+    language: Optional[str],
+    workers: Optional[int],
+) -> Iterator[tuple]:
+    """Yield ``(batch, per-row Periods)`` in input order."""
+
+    def texts(batch: List[Dict[str, Any]]) -> List[Optional[str]]:
+        return [_cell(r.get(column)) for r in batch]
+
+    if workers is not None and workers > 1:
+        from .parallel import iter_chunks_parallel
+
+        pending: Deque[List[Dict[str, Any]]] = deque()
+
+        def chunks() -> Iterator[List[Optional[str]]]:
+            for batch in batches:
+                pending.append(batch)
+                yield texts(batch)
+
+        for rows in iter_chunks_parallel(chunks(), language, PERIOD_SCHEME, workers):
+            yield pending.popleft(), rows
+        return
+
+    spec = get_language_spec(language) if language else None
+    for batch in batches:
+        yield (
+            batch,
+            [
+                _rows_to_list(_parse_single(t, language, PERIOD_SCHEME, spec))
+                for t in texts(batch)
+            ],
+        )
+
+
+def _open_in(path: Optional[str]) -> IO[str]:
+    if not path or path == "-":
+        # The csv module needs newline="" for line breaks inside quoted cells
+        if isinstance(sys.stdin, io.TextIOWrapper):
+            sys.stdin.reconfigure(newline="")
+        return sys.stdin
+    return open(path, newline="", encoding="utf-8", buffering=BUFFER_SIZE)
+
+
+def _open_out(path: Optional[str]) -> IO[str]:
+    if not path or path == "-":
+        return sys.stdout
+    return open(path, "w", newline="", encoding="utf-8", buffering=BUFFER_SIZE)
+
+
+def parse_command(args: argparse.Namespace) -> int:
+    _check_language(args.language, args.scheme)
+    if args.cache_size is not None:
+        set_cache_size(args.cache_size)
+    if args.regex_engine:
+        try:
+            set_regex_engine(args.regex_engine)
+        except ImportError as e:
+            raise ValueError(str(e)) from None
+    if args.max_length is not None:
+        set_input_limits(max_length=args.max_length)
+    fmt = args.format or _infer_format(args.input)
+    fields = SCHEME_FIELDS[args.scheme]
+    info_before = PARSE_CACHE.info()
+
+    n_rows = n_results = 0
+    started = time.perf_counter()
+    src = _open_in(args.input)
+    out = _open_out(args.output)
+    try:
+        header, input_rows = _read_rows(src, fmt)
+        writer = None
+        if header is not None:
+            if args.column not in header:
+                raise ValueError(f"no column {args.column!r} in input")
+            writer = csv.DictWriter(
+                out,
+                header + [f for f in fields if f not in header],
+                delimiter="\t" if fmt == "tsv" else ",",
+                lineterminator="\n",
+            )
+            writer.writeheader()
+        batches = _parse_batches(
+            _batches(input_rows, args.batch_size),
+            args.column,
+            args.language,
+            args.workers,
+        )
+        for batch, rows in batches:
+            # JSONL has no header: the first batch must have the column
+            if writer is None and not n_rows:
+                if not any(args.column in r for r in batch):
+                    raise ValueError(f"no column {args.column!r} in input")
+            records = []
+            for record, periods in zip(batch, rows):
+                for p in periods:
+                    parsed = _fields(p)
+                    records.append((record, [parsed[f] for f in fields]))
+            n_rows += len(batch)
+            n_results += len(records)
+
+            if fmt == "jsonl":
+                out.write(
+                    "".join(
+                        json.dumps(
+                            {
+                                **record,
+                                **{f: _json_value(v) for f, v in zip(fields, vals)},
+                            },
+                            ensure_ascii=False,
+                        )
+                        + "\n"
+                        for record, vals in records
+                    )
+                )
+                continue
+            writer.writerows(
+                {**record, **{f: _csv_value(v) for f, v in zip(fields, vals)}}
+                for record, vals in records
+            )
+        out.flush()
+    finally:
+        if src is not sys.stdin:
+            src.close()
+        if out is not sys.stdout:
+            out.close()
+
+    if not args.quiet:
+        elapsed = time.perf_counter() - started
+        rate = n_rows / elapsed if elapsed else float("inf")
+        summary = (
+            f"parsed {n_rows} rows ({n_results} results) in {elapsed:.2f} s, "
+            f"{rate:,.0f} rows/s"
+        )
+        if not args.workers or args.workers <= 1:
+            # Worker processes have their own caches
+            info = PARSE_CACHE.info()
+            hits = info.hits - info_before.hits
+            lookups = hits + info.misses - info_before.misses
+            summary += f", cache hit rate {hits / lookups if lookups else 0:.1%}"
+        print(summary, file=sys.stderr)
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="unstruwwel-py", description="Parse historic dates in bulk."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    p = commands.add_parser(
+        "parse",
+        help="parse a column of a CSV/TSV/JSONL file",
+        description="Parse one column of a CSV, TSV or JSONL file (or stdin) and "
+        "write the rows with the parsed fields appended.",
+    )
+    p.add_argument("input", nargs="?", help="input file (default: stdin)")
+    p.add_argument("-c", "--column", required=True, help="column with the dates")
+    p.add_argument(
+        "-l",
+        "--language",
+        choices=("en", "de", "fr"),
+        help="language of the dates (default: guessed per row, much slower)",
+    )
+    p.add_argument("-s", "--scheme", choices=tuple(SCHEME_FIELDS), default="time-span")
+    p.add_argument("-f", "--format", choices=FORMATS, help="default: from extension")
+    p.add_argument("-o", "--output", help="output file (default: stdout)")
+    p.add_argument("--workers", type=int, help="parse on this many processes")
+    p.add_argument("--cache-size", type=int, help="parse cache entries (0: off)")
+    p.add_argument("--max-length", type=int, help="leave longer values unparsed (NA)")
+    p.add_argument("--regex-engine", choices=REGEX_ENGINES, help="re2 needs google-re2")
+    p.add_argument("--batch-size", type=int, default=BATCH_SIZE, help=argparse.SUPPRESS)
+    p.add_argument("-q", "--quiet", action="store_true", help="no summary on stderr")
+    p.set_defaults(func=parse_command)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        return args.func(args)
+    except ValueError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,133 @@
+"""Columnar (NumPy) output for time spans.
+
+NumPy is an optional dependency (``pip install unstruwwel-py[arrays]``) and
+is only imported when columnar output is requested.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterable, List, NamedTuple, Optional, Union
+
+from .core import (
+    PERIOD_SCHEME,
+    _check_language,
+    _factorize,
+    _parse_single,
+    _rows_to_list,
+)
+from .dates import Period
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+class TimeSpanArrays(NamedTuple):
+    """Parallel arrays with one entry per parsed result.
+
+    ``start``/``end`` hold the same years as ``scheme="time-span"``, with
+    ``-inf``/``inf`` for open ends and ``nan`` for inputs without a date.
+    ``row`` is the index of the input each result came from; inputs with
+    several dates appear once per date.
+    """
+
+    start: np.ndarray  # float64
+    end: np.ndarray  # float64
+    fuzzy: np.ndarray  # int8: -1 approximate, 0 exact, 1 uncertain
+    express: np.ndarray  # int8: -1 before, 0 closed, 1 after
+    row: np.ndarray  # intp
+
+
+def _require_numpy():
+    try:
+        import numpy
+    except ImportError as e:  # pragma: no cover - depends on environment
+        raise ImportError(
+            "numpy is required for columnar output; "
+            "install it with 'pip install unstruwwel-py[arrays]'"
+        ) from e
+    return numpy
+
+
+def unstruwwel_array(
+    texts: Optional[Union[str, Iterable[Optional[str]]]],
+    language: Optional[str] = None,
+    dedupe: bool = False,
+    workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+) -> TimeSpanArrays:
+    """Parse ``texts`` straight into NumPy arrays (see :class:`TimeSpanArrays`).
+
+    Accepts the same options as :func:`~unstruwwel_py.core.unstruwwel`; no
+    per-row tuples or result objects are created.
+    """
+    np = _require_numpy()
+    if texts is None or isinstance(texts, str):
+        texts = [texts]
+    _check_language(language, "time-span")
+
+    if workers is not None and workers > 1:
+        from .parallel import parse_rows_parallel
+
+        texts = list(texts)
+        if dedupe:
+            uniques, codes = _factorize(texts)
+            unique_rows = parse_rows_parallel(
+                uniques, language, PERIOD_SCHEME, workers, chunksize
+            )
+            rows: Iterable[List[Optional[Period]]] = (unique_rows[c] for c in codes)
+        else:
+            rows = parse_rows_parallel(
+                texts, language, PERIOD_SCHEME, workers, chunksize
+            )
+    elif dedupe:
+        texts = list(texts)
+        uniques, codes = _factorize(texts)
+        unique_rows = [
+            _rows_to_list(_parse_single(t, language, PERIOD_SCHEME)) for t in uniques
+        ]
+        rows = (unique_rows[c] for c in codes)
+    else:
+        rows = (_rows_to_list(_parse_single(t, language, PERIOD_SCHEME)) for t in texts)
+
+    nan = float("nan")
+    inf = float("inf")
+    start: List[float] = []
+    end: List[float] = []
+    fuzzy: List[int] = []
+    express: List[int] = []
+    row: List[int] = []
+    for i, periods in enumerate(rows):
+        for p in periods:
+            row.append(i)
+            if p is None:
+                start.append(nan)
+                end.append(nan)
+                fuzzy.append(0)
+                express.append(0)
+                continue
+            sy = p.start[0]
+            ey = p.end[0]
+            if p.express < 0:
+                start.append(-inf)
+                end.append(ey)
+            elif p.express > 0:
+                start.append(sy)
+                end.append(inf)
+            elif sy <= ey:
+                start.append(sy)
+                end.append(ey)
+            else:
+                start.append(ey)
+                end.append(sy)
+            fuzzy.append(p.fuzzy)
+            express.append(p.express)
+
+    # One bulk conversion per column; element-wise ndarray writes are slower
+    # than appending to lists
+    return TimeSpanArrays(
+        np.array(start, dtype=np.float64),
+        np.array(end, dtype=np.float64),
+        np.array(fuzzy, dtype=np.int8),
+        np.array(express, dtype=np.int8),
+        np.array(row, dtype=np.intp),
+    )
@@ -1,26 +1,48 @@
 """Core parsing functionality for historical date strings."""
 
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import Any, List, Optional, Sequence, Tuple, Union
+import time
+from dataclasses import dataclass, replace
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
-from .dates import Period
-from .resources import get_language_spec
-from .lang import guess_language
+from .cache import MISSING, PARSE_CACHE
+from .dates import DATACLASS_SLOTS, Period
+from .resources import (
+    LanguagePatterns,
+    LanguageSpec,
+    default_patterns,
+    get_language_spec,
+)
+from .keywords import fuzzy_from_hits
+from .lang import guess_column_language, guess_language
 from .parsers import (
     parse_century,
     parse_decade,
     parse_date,
     parse_month_year,
     parse_day_month_year,
+    parse_numeric,
     parse_before_after,
     parse_year_interval,
     parse_season,
 )
 from .parsers.intervals import parse_multi_dates
+from .scan import TextScan, scan_text
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Parsed:
     text: str
     time_span: Tuple[Optional[float], Optional[float]]
@@ -30,6 +52,14 @@ class Parsed:
 
 Result = Union[Parsed, Tuple[Optional[float], Optional[float]]]
 
+# Output schemes of the public entry points; unstruwwel() also takes "arrays"
+SCHEMES = ("time-span", "iso-format", "object")
+
+# Internal scheme yielding the parsed Period itself (None for no date); used
+# by the columnar output. Cached Periods are shared, so callers must not
+# mutate them.
+PERIOD_SCHEME = "period"
+
 
 def get_item(x: Sequence[Any], i: int = 1) -> Any:
     """R-like helper to fetch the i-th item (1-based)."""
@@ -38,6 +68,8 @@ def get_item(x: Sequence[Any], i: int = 1) -> Any:
 
 def _emit(p: Period, scheme: str) -> Result:
     """Convert a Period to the requested output format."""
+    if scheme == PERIOD_SCHEME:
+        return p  # type: ignore[return-value]
     if scheme == "time-span":
         return (p.time_span[0], p.time_span[1])
     if scheme == "iso-format":
@@ -52,9 +84,21 @@ def unstruwwel(
     texts: Optional[Union[str, Sequence[Optional[str]]]],
     language: Optional[str] = None,
     scheme: str = "time-span",
+    dedupe: bool = False,
+    workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
 ) -> List[Result]:
     """Parse historic dates (subset) into time spans, iso-format, or objects.
 
+    With ``dedupe=True`` only the distinct input values are parsed and the
+    results are expanded back to input order, which pays off for large,
+    repetitive columns. With ``workers > 1`` the input is split into chunks
+    of ``chunksize`` items that are parsed on a process pool. The output is
+    identical either way.
+
+    ``scheme="arrays"`` returns a :class:`~unstruwwel_py.columnar.TimeSpanArrays`
+    of NumPy columns instead of a list (see :func:`unstruwwel_array`).
+
     Supported:
     - unknown/undatiert -> NA
     - plain year (incl. negatives) -> full-year span
@@ -69,37 +113,310 @@ def unstruwwel(
     if texts is None or isinstance(texts, str):
         texts = [texts]
 
+    _check_language(language, scheme, SCHEMES + ("arrays",))
+
+    if scheme == "arrays":
+        from .columnar import unstruwwel_array
+
+        return unstruwwel_array(  # type: ignore[return-value]
+            texts, language, dedupe=dedupe, workers=workers, chunksize=chunksize
+        )
+
+    if workers is not None and workers > 1:
+        from .parallel import parse_rows_parallel
+
+        texts = list(texts)
+        if dedupe:
+            uniques, codes = _factorize(texts)
+            rows = parse_rows_parallel(uniques, language, scheme, workers, chunksize)
+            return _expand(rows, codes, scheme)
+        rows = parse_rows_parallel(texts, language, scheme, workers, chunksize)
+        return [r for row in rows for r in row]
+
+    return _parse_column(
+        texts, lambda t: _parse_single(t, language, scheme), scheme, dedupe
+    )
+
+
+def unstruwwel_batch(
+    texts: Iterable[Optional[str]],
+    language: Optional[str] = None,
+    scheme: str = "time-span",
+    dedupe: bool = False,
+    row_fallback: bool = False,
+) -> List[Result]:
+    """Parse a whole column of date strings with one-off setup.
+
+    Unlike :func:`unstruwwel`, which guesses the language of every string
+    separately when ``language`` is None, the language is guessed once for
+    the whole column (falling back to English) and a single :class:`Parser`
+    is reused for all items. Results are otherwise identical to
+    :func:`unstruwwel` called with the resolved language.
+
+    With ``row_fallback=True`` a column whose language cannot be guessed
+    unambiguously is parsed with per-row detection instead.
+
+    Throughput target: with ``language=None`` at least 50x the per-item
+    loop of :func:`unstruwwel`; with an explicit language no slower than it.
+    """
+    texts = [texts] if texts is None or isinstance(texts, str) else list(texts)
+    _check_language(language, scheme)
+    if language is None:
+        language, confident = guess_column_language(texts)
+        if not confident and row_fallback:
+            return _parse_column(
+                texts, lambda t: _parse_single(t, None, scheme), scheme, dedupe
+            )
+    return Parser(language, scheme).parse_many(texts, dedupe=dedupe)
+
+
+def iter_unstruwwel(
+    texts: Iterable[Optional[str]],
+    language: Optional[str] = None,
+    scheme: str = "time-span",
+) -> Iterator[Tuple[int, Result]]:
+    """Lazily parse ``texts``, yielding ``(row_index, result)`` pairs.
+
+    Results are the same as :func:`unstruwwel`, but nothing is materialised:
+    ``texts`` is consumed one item at a time, so arbitrarily long iterables
+    (e.g. rows streamed from a file) are parsed in constant memory. Inputs
+    with several dates yield several pairs with the same row index.
+    """
+    if texts is None or isinstance(texts, str):
+        texts = [texts]
+    _check_language(language, scheme)
+    spec = get_language_spec(language) if language else None
+    return _iter_rows(texts, language, scheme, spec)
+
+
+def _iter_rows(
+    texts: Iterable[Optional[str]],
+    language: Optional[str],
+    scheme: str,
+    spec: Optional[LanguageSpec],
+) -> Iterator[Tuple[int, Result]]:
+    for i, t in enumerate(texts):
+        result = _parse_single(t, language, scheme, spec)
+        if isinstance(result, list):
+            for r in result:
+                yield i, r
+        else:
+            yield i, result
+
+
+class Parser:
+    """Parser bound to one language and output scheme.
+
+    Language resources and compiled patterns are resolved once on
+    construction, so parsing many strings only pays for the matching.
+    """
+
+    def __init__(self, language: str, scheme: str = "time-span") -> None:
+        _check_language(language, scheme)
+        self.language = language
+        self.scheme = scheme
+        self.spec = get_language_spec(language)
+
+    def parse(self, text: Optional[str]) -> Union[Result, List[Result]]:
+        """Parse one string; a list is returned for multi-date inputs."""
+        return _parse_single(text, self.language, self.scheme, self.spec)
+
+    def parse_many(
+        self, texts: Iterable[Optional[str]], dedupe: bool = False
+    ) -> List[Result]:
+        """Parse several strings into one flat result list."""
+        return _parse_column(texts, self.parse, self.scheme, dedupe)
+
+
+def _parse_column(
+    texts: Iterable[Optional[str]],
+    parse: Callable[[Optional[str]], Union[Result, List[Result]]],
+    scheme: str,
+    dedupe: bool,
+) -> List[Result]:
+    """Parse each text and flatten multi-date results into one list."""
+    out: List[Result] = []
+    if not dedupe:
+        for t in texts:
+            result = parse(t)
+            if isinstance(result, list):
+                out.extend(result)
+            else:
+                out.append(result)
+        return out
+
+    uniques, codes = _factorize(texts)
+    return _expand([_rows_to_list(parse(t)) for t in uniques], codes, scheme)
+
+
+def _rows_to_list(result: Union[Result, List[Result]]) -> List[Result]:
+    return result if isinstance(result, list) else [result]
+
+
+def _expand(rows: List[List[Result]], codes: List[int], scheme: str) -> List[Result]:
+    """Expand per-unique results back to input order (see :func:`_factorize`)."""
+    out: List[Result] = []
+    copy = scheme == "object"
+    for code in codes:
+        if copy:
+            out.extend(replace(r) for r in rows[code])
+        else:
+            out.extend(rows[code])
+    return out
+
+
+def _factorize(
+    texts: Iterable[Optional[str]],
+) -> Tuple[List[Optional[str]], List[int]]:
+    """Split ``texts`` into distinct values and an inverse index."""
+    index: Dict[Optional[str], int] = {}
+    uniques: List[Optional[str]] = []
+    codes: List[int] = []
+    for t in texts:
+        code = index.get(t)
+        if code is None:
+            code = index[t] = len(uniques)
+            uniques.append(t)
+        codes.append(code)
+    return uniques, codes
+
+
+class InputLimits(NamedTuple):
+    max_length: Optional[int]
+    time_budget: Optional[float]
+
+
+# Guards against oversized or pathological inputs; None means unlimited
+_max_length: Optional[int] = None
+_time_budget: Optional[float] = None
+
+
+def set_input_limits(
+    max_length: Optional[int] = None, time_budget: Optional[float] = None
+) -> None:
+    """Bound the work spent on any single input.
+
+    Inputs longer than ``max_length`` characters are returned as NA without
+    being parsed. ``time_budget`` (seconds) is checked between parser
+    attempts, and an input whose parsing has taken longer ends as NA (not
+    cached, as it depends on the machine's load). The multi-date scan and
+    a running regex cannot be interrupted, so the budget bounds the total
+    only together with a length limit or the ``"re2"`` engine (see
+    :func:`~unstruwwel_py.resources.set_regex_engine`). Both default to
+    None (unlimited); calling this resets whichever is not given.
+    """
+    global _max_length, _time_budget
+    if max_length is not None and max_length < 0:
+        raise ValueError("max_length must be >= 0")
+    if time_budget is not None and time_budget <= 0:
+        raise ValueError("time_budget must be > 0")
+    _max_length = max_length
+    _time_budget = time_budget
+
+
+class _OverBudget(Exception):
+    """Raised when an input exceeds the time budget; never cached."""
+
+
+def get_input_limits() -> InputLimits:
+    """The limits set by :func:`set_input_limits`."""
+    return InputLimits(_max_length, _time_budget)
+
+
+def _check_language(
+    language: Optional[str], scheme: str, schemes: Tuple[str, ...] = SCHEMES
+) -> None:
+    if scheme not in schemes:
+        raise ValueError(
+            f"invalid scheme {scheme!r}, expected one of {', '.join(schemes)}"
+        )
     # Validate language per tests: require language for object scheme
     if language is None and scheme == "object":
         raise ValueError("language is required for scheme=object")
     if language is not None and language not in {"en", "de", "fr"}:
         raise ValueError("invalid language code")
 
-    out: List[Result] = []
-    for t in texts:
-        result = _parse_single(t, language, scheme)
-        if isinstance(result, list):
-            out.extend(result)
-        else:
-            out.append(result)
-    return out
+
+def _is_unknown(t: Optional[str]) -> bool:
+    return t is None or (
+        isinstance(t, str) and t.strip().lower() in {"undatiert", "unknown"}
+    )
+
+
+def _na(t: Optional[str], scheme: str, fuzzy: int = 0) -> Result:
+    """Result for inputs without a recognisable date."""
+    if scheme == PERIOD_SCHEME:
+        return None  # type: ignore[return-value]
+    if scheme == "object":
+        return Parsed(
+            text=t or "", time_span=(None, None), iso_format=None, fuzzy=fuzzy
+        )
+    return (None, None)
 
 
 def _parse_single(
-    t: Optional[str], language: Optional[str], scheme: str
+    t: Optional[str],
+    language: Optional[str],
+    scheme: str,
+    spec: Optional[LanguageSpec] = None,
+) -> Union[Result, List[Result]]:
+    """Parse a single text input, consulting the parse result cache.
+
+    ``spec`` may be passed by callers that already resolved ``language``.
+    """
+    if _max_length is not None and isinstance(t, str) and len(t) > _max_length:
+        return _na(t, scheme)
+
+    # Bare years and year intervals skip language guessing, fuzzy scanning,
+    # the regex parsers and the cache (they would only flood it)
+    if isinstance(t, str) and t:
+        p = parse_numeric(t.strip())
+        if p is not None:
+            return _emit(p, scheme)
+
+    cache = PARSE_CACHE
+    try:
+        if not cache.maxsize:
+            return _parse_uncached(t, language, scheme, spec)
+        key = (t.strip() if isinstance(t, str) else t, language, scheme)
+        result = cache.get(key)
+        if result is MISSING:
+            result = _parse_uncached(t, language, scheme, spec)
+            cache.put(key, result)
+    except _OverBudget:
+        # Depends on the machine's load, so it must not be cached
+        return _na(t, scheme)
+    if scheme == "object":
+        # Parsed objects are mutable: never hand out the cached instances
+        if isinstance(result, list):
+            return [_copy_parsed(r, t) for r in result]
+        return _copy_parsed(result, t)
+    if isinstance(result, list):
+        # Multi-date lists would be shared with the cache as well
+        return list(result)
+    return result
+
+
+def _copy_parsed(p: Parsed, t: Optional[str]) -> Parsed:
+    # Only NA results carry the input text, which may differ in whitespace
+    if p.time_span == (None, None):
+        return replace(p, text=t or "")
+    return replace(p)
+
+
+def _parse_uncached(
+    t: Optional[str],
+    language: Optional[str],
+    scheme: str,
+    spec: Optional[LanguageSpec] = None,
 ) -> Union[Result, List[Result]]:
-    """Parse a single text input."""
     # Handle unknown/null
-    if t is None or (
-        isinstance(t, str) and t.strip().lower() in {"undatiert", "unknown"}
-    ):
-        if scheme == "object":
-            return Parsed(
-                text=t or "", time_span=(None, None), iso_format=None, fuzzy=0
-            )
-        return (None, None)
+    if _is_unknown(t):
+        return _na(t, scheme)
 
     txt = t.strip()
+    if spec is not None:
+        return _parse_text(t, txt, spec, scheme)
     lang = language
     if lang is None:
         try:
@@ -108,64 +425,96 @@ def _parse_single(
         except Exception:
             lang = "en"
 
-    low = txt.lower()
     spec = get_language_spec(lang) if lang else None
-    fuzzy = _compute_fuzzy(low, spec)
+    return _parse_text(t, txt, spec, scheme)
 
-    # Build patterns
-    mon_pat_base = (
-        spec.month_pattern()
-        if spec
-        else r"(?:january|february|march|april|may|june|july|august|september|october|november|december)"
-    )
-    mon_pat_cap = f"({mon_pat_base})"
-    sp_base = spec.season_pattern() if spec else r"(?:spring|summer|autumn|winter)"
-    sp_cap = f"({sp_base})"
-    before_pat = spec.before_pattern() if spec else r"(?:before)"
-    after_pat = spec.after_pattern() if spec else r"(?:after)"
-    season_pat = spec.season_pattern() if spec else r"(?:spring|summer|autumn|winter)"
+
+def _parse_text(
+    t: str, txt: str, spec: Optional[LanguageSpec], scheme: str
+) -> Union[Result, List[Result]]:
+    """Run the parsers on stripped text ``txt`` with a resolved spec."""
+    deadline = None
+    if _time_budget is not None:
+        deadline = time.perf_counter() + _time_budget
+    low = txt.lower()
+    scan = scan_text(low, spec)
+    fuzzy = fuzzy_from_hits(scan.hits)
+    patterns = spec.patterns if spec else default_patterns()
 
     # Try multi-date parsing first
-    multi_results = parse_multi_dates(
-        low, mon_pat_base, mon_pat_cap, before_pat, after_pat, season_pat, spec, fuzzy
-    )
+    multi_results = parse_multi_dates(low, patterns, spec, fuzzy, scan)
     if multi_results:
         return [_emit(p, scheme) for p, _ in multi_results]
 
-    # Try each parser in order
-    parsers = [
-        lambda: parse_decade(low, txt, spec, fuzzy),
-        lambda: parse_year_interval(txt, fuzzy),
-        lambda: parse_before_after(low, mon_pat_cap, season_pat, spec, fuzzy),
-        lambda: parse_season(low, sp_cap, spec, fuzzy),
-        lambda: parse_month_year(low, mon_pat_cap, spec, fuzzy),
-        lambda: parse_day_month_year(low, mon_pat_cap, spec, fuzzy),
-        lambda: parse_century(low, spec, fuzzy),
-        lambda: parse_date(low, txt, spec, fuzzy),
-    ]
-
-    for parser in parsers:
-        result = parser()
+    # Try only the parsers that can match, in priority order
+    for name in _route(txt, patterns, scan):
+        if deadline is not None and time.perf_counter() > deadline:
+            raise _OverBudget
+        result = _PARSERS[name](txt, low, spec, patterns, fuzzy, scan)
         if result is not None:
             return _emit(result, scheme)
 
     # Fallback
-    if scheme == "object":
-        return Parsed(
-            text=t or "", time_span=(None, None), iso_format=None, fuzzy=fuzzy
-        )
-    return (None, None)
+    return _na(t, scheme, fuzzy)
+
 
+# Uniform adapters: (txt, low, spec, patterns, fuzzy, scan) -> Optional[Period]
+_PARSERS: Dict[str, Callable[..., Optional[Period]]] = {
+    "decade": lambda txt, low, spec, pats, fuzzy, scan: parse_decade(
+        low, txt, spec, fuzzy, scan
+    ),
+    "year_interval": lambda txt, low, spec, pats, fuzzy, scan: parse_year_interval(
+        txt, fuzzy, scan
+    ),
+    "before_after": lambda txt, low, spec, pats, fuzzy, scan: parse_before_after(
+        low, pats, spec, fuzzy, scan
+    ),
+    "season": lambda txt, low, spec, pats, fuzzy, scan: parse_season(
+        low, pats, spec, fuzzy
+    ),
+    "month_year": lambda txt, low, spec, pats, fuzzy, scan: parse_month_year(
+        low, pats, spec, fuzzy
+    ),
+    "day_month_year": lambda txt, low, spec, pats, fuzzy, scan: parse_day_month_year(
+        low, pats, spec, fuzzy
+    ),
+    "century": lambda txt, low, spec, pats, fuzzy, scan: parse_century(
+        low, spec, fuzzy, scan
+    ),
+    "date": lambda txt, low, spec, pats, fuzzy, scan: parse_date(
+        low, txt, spec, fuzzy, scan
+    ),
+}
 
-def _compute_fuzzy(low: str, spec) -> int:
-    """Compute fuzzy marker from text."""
-    fuzzy = 0
-    if spec and any(k in low for k in spec.approximate):
-        fuzzy = -1
-    elif any(k in low for k in ["circa", "ca", "ca."]):
-        fuzzy = -1
-    if spec and any(k in low for k in spec.uncertain):
-        fuzzy = 1
-    elif any(k in low for k in ["uncertain", "perhaps", "probably"]):
-        fuzzy = 1
-    return fuzzy
+
+def _route(txt: str, patterns: LanguagePatterns, scan: TextScan) -> List[str]:
+    """Names of the parsers that can possibly match, in priority order.
+
+    Each check is a necessary condition of the corresponding parser's
+    pattern, so skipping the others never changes the result.
+    """
+    low = scan.low
+    has_alpha = scan.has_alpha
+    if not scan.has_year:
+        # Every parser but the century one needs a 3-4 digit year
+        return ["century"] if has_alpha else []
+    head = low[:1]
+    numeric_head = head.isdigit() or head == "-"
+    route = []
+    if low.endswith(("0s", "jahre")):
+        route.append("decade")
+    if numeric_head and "/" in txt:
+        route.append("year_interval")
+    if head in patterns.keyword_initials:
+        route.append("before_after")
+    if head in patterns.season_initials:
+        route.append("season")
+    if head in patterns.month_initials:
+        route.append("month_year")
+        route.append("day_month_year")
+    if has_alpha:
+        # century tokens are words, so the pattern needs a letter
+        route.append("century")
+    elif numeric_head:
+        route.append("date")
+    return route
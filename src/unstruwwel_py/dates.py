@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from typing import Optional, Tuple, List
 
+# Slotted dataclasses drop the per-instance __dict__, which matters when
+# millions of results are kept; slots=True needs Python 3.10+.
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 MONTHS = {
     "january": 1,
@@ -45,7 +50,7 @@ def iso_date(y: int, m: int, d: int) -> str:
     return f"{iso_year(y)}-{m:02d}-{d:02d}"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Period:
     start: Tuple[int, int, int]  # (y, m, d)
     end: Tuple[int, int, int]
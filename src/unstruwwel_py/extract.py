@@ -0,0 +1,174 @@
+"""Date extraction from free running text.
+
+:func:`~unstruwwel_py.core.unstruwwel` expects every input to be one short
+field holding a date. :func:`iter_dates` instead scans a text of any length,
+such as an OCR'd finding-aid paragraph, and yields each date expression it
+recognises together with its character offsets::
+
+    for d in iter_dates(paragraph, "de"):
+        print(d.start, d.end, d.text, d.result)
+
+The text is scanned once with a single per-language pattern that combines
+all supported forms; matches are converted and yielded as the scan reaches
+them.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Iterable, Iterator, List, Match, NamedTuple, Optional, Pattern
+
+from .core import Result, _check_language, _emit
+from .dates import Period, period_for_year
+from .keywords import DEFAULT_APPROXIMATE, DEFAULT_UNCERTAIN, fuzzy_from_hits
+from .lang import guess_language
+from .parsers import (
+    parse_century,
+    parse_day_month_year,
+    parse_decade,
+    parse_month_year,
+    parse_season,
+    parse_year_interval,
+)
+from .parsers.intervals import multi_date_period
+from .resources import LanguageSpec, get_language_spec
+
+
+class DateMatch(NamedTuple):
+    """One date expression found by :func:`iter_dates`.
+
+    ``text[start:end]`` of the scanned text is ``text``; ``result`` is in
+    the requested scheme.
+    """
+
+    start: int
+    end: int
+    text: str
+    result: Result
+
+
+def _alternation(tokens: Iterable[str]) -> str:
+    # Longest first, so that e.g. "ca." wins over "ca"
+    toks = sorted((t for t in tokens if t), key=len, reverse=True)
+    return "|".join(re.escape(t) for t in toks)
+
+
+def build_extraction_pattern(spec: LanguageSpec) -> Pattern[str]:
+    """Compile the combined extraction pattern for ``spec``.
+
+    Each branch is a named group (see :func:`_convert`); at one position the
+    first branch that matches wins, so more specific forms come first.
+    """
+    pats = spec.patterns
+    branches = []
+    last = _alternation(spec.last_tokens)
+    last_prefix = rf"(?:(?:{last})\s+)?" if last else ""
+    for frac_re, _, _ in pats.century_fractions:
+        branches.append(rf"{last_prefix}{frac_re.pattern}")
+    if pats.century is not None:
+        branches.append(pats.century.pattern)
+    century = "|".join(branches)
+    parts = [rf"(?P<century>{century})"] if century else []
+    parts += [
+        # German dates and before/after expressions (named by kind)
+        pats.multi_date.pattern,
+        rf"(?P<day_month_year>{pats.day_month_year.pattern})",
+        rf"(?P<month_year>{pats.month_year.pattern})",
+        rf"(?P<season_year>{pats.season_year.pattern})",
+        r"(?P<decade>\d{3}0s|\d{4}er\s+jahre)",
+        r"(?P<interval>\d{3,4}/\d{1,4})",
+        r"(?P<year>-?\d{3,4})",
+    ]
+    fuzzy = _alternation(
+        spec.approximate | spec.uncertain | set(DEFAULT_APPROXIMATE + DEFAULT_UNCERTAIN)
+    )
+    # Expressions start at a word boundary and never end inside a number
+    return re.compile(
+        rf"(?<!\w)(?:(?P<fz>{fuzzy})\s+)?(?:{'|'.join(parts)})(?!\d)",
+        re.IGNORECASE,
+    )
+
+
+def _lower(text: str) -> str:
+    """Lowercase ``text`` without changing any character offsets."""
+    low = text.lower()
+    if len(low) == len(text):
+        return low
+    # A few characters lowercase to several (e.g. "İ"); keep those as is
+    return "".join(c.lower() if len(c.lower()) == 1 else c for c in text)
+
+
+def _convert(m: Match[str], spec: LanguageSpec) -> Optional[Period]:
+    """Period for an extraction match, or None if it does not convert."""
+    kind = m.lastgroup
+    fz = m.group("fz")
+    fuzzy = fuzzy_from_hits(spec.keywords.scan(fz)) if fz else 0
+    sub = m.group(kind)
+    if kind == "century":
+        # The fuzzy prefix may mark the century itself as approximate
+        return parse_century(m.group(0), spec, fuzzy)
+    if kind == "day_month_year":
+        return parse_day_month_year(sub, spec.patterns, spec, fuzzy)
+    if kind == "month_year":
+        return parse_month_year(sub, spec.patterns, spec, fuzzy)
+    if kind == "season_year":
+        return parse_season(sub, spec.patterns, spec, fuzzy)
+    if kind == "decade":
+        return parse_decade(sub, sub, spec, fuzzy)
+    if kind == "interval":
+        return parse_year_interval(sub, fuzzy)
+    if kind == "year":
+        p = period_for_year(int(sub))
+    else:
+        p = multi_date_period(m, spec)
+        if p is None:
+            return None
+    p.fuzzy = fuzzy
+    return p
+
+
+def iter_dates(
+    text: str, language: Optional[str] = None, scheme: str = "time-span"
+) -> Iterator[DateMatch]:
+    """Yield every date expression in ``text`` with its character offsets.
+
+    Recognises centuries (and their parts), decades, seasons, month and
+    day-month dates, before/after expressions, year intervals and plain
+    years, each optionally preceded by a fuzzy marker such as "ca.".
+    Matches do not overlap and are yielded in text order; at any position
+    the most specific form wins ("1840s" is a decade, not the year 1840).
+
+    Args:
+        text: Text to scan
+        language: Language code; guessed from ``text`` if None
+        scheme: Output format of each :attr:`DateMatch.result`
+
+    Returns:
+        Iterator of :class:`DateMatch`
+    """
+    _check_language(language, scheme)
+    if language is None:
+        try:
+            gl = guess_language([text], verbose=False)
+            language = gl if isinstance(gl, str) else gl[0]
+        except Exception:
+            language = "en"
+    spec = get_language_spec(language) or get_language_spec("en")
+    return _iter_matches(text, spec, scheme)
+
+
+def _iter_matches(text: str, spec: LanguageSpec, scheme: str) -> Iterator[DateMatch]:
+    for m in spec.extraction.finditer(_lower(text)):
+        p = _convert(m, spec)
+        if p is not None:
+            # Century patterns also consume trailing whitespace
+            start = m.start()
+            found = text[start : m.end()].rstrip()
+            yield DateMatch(start, start + len(found), found, _emit(p, scheme))
+
+
+def extract_dates(
+    text: str, language: Optional[str] = None, scheme: str = "time-span"
+) -> List[DateMatch]:
+    """List of all date expressions in ``text``; see :func:`iter_dates`."""
+    return list(iter_dates(text, language, scheme))
@@ -0,0 +1,306 @@
+"""Interval index over parsed time spans for fast range queries.
+
+Typical use after parsing a large column::
+
+    spans = unstruwwel(texts, "de")
+    index = IntervalIndex.from_results(spans)
+    index.overlapping(1750, 1760)   # positions in ``spans``
+    index.before(1600)
+
+Closed spans are grouped into buckets of similar length (a year, a decade,
+a century, ...) and each bucket is sorted by end year. Within a bucket a
+start year bound becomes an end year bound give or take the bucket's
+length range, so a query is a few binary searches per bucket: most matches
+come out as one list slice and only the records in a narrow band of end
+years are checked one by one. Open-ended spans ("nach 1800", "vor 1600")
+are kept in two more lists, sorted by start and by end respectively.
+Records without a date (``None``/``nan``) are left out.
+"""
+
+from __future__ import annotations
+
+import math
+from bisect import bisect_left, bisect_right
+from itertools import count
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from .columnar import TimeSpanArrays
+
+    # Query results: a list, or an intp array for indexes built from arrays
+    Ids = Union[List[int], np.ndarray]
+
+_INF = float("inf")
+
+# Bucket keys of the open-ended spans; closed spans use their length's
+# bit length (0 for a single year, 4 for a decade, 7 for a century)
+_OPEN_END = -1
+_OPEN_START = -2
+
+# Per bucket key: starts, ends and ids, sorted by (end, start)
+_Groups = Dict[int, Tuple[List[float], List[float], Sequence[int]]]
+
+
+def _span(result: Any) -> Tuple[Optional[float], Optional[float]]:
+    """``(start, end)`` of a time-span tuple, Parsed or Period result."""
+    if result is None:
+        return (None, None)
+    if isinstance(result, tuple):
+        return result
+    return result.time_span
+
+
+def _is_missing(x: Optional[float]) -> bool:
+    return x is None or x != x
+
+
+def _bucket_key(start: float, end: float) -> int:
+    if end == _INF:
+        return _OPEN_END
+    if start == -_INF:
+        return _OPEN_START
+    return int(end - start).bit_length()
+
+
+class _Bucket(NamedTuple):
+    """Closed spans with lengths in ``[min_len, max_len]``, sorted by end."""
+
+    starts: List[float]
+    ends: List[float]
+    ids: Sequence[int]
+    min_len: float
+    max_len: float
+
+
+class IntervalIndex:
+    """Immutable index answering overlap, containment and stabbing queries.
+
+    All bounds are inclusive years, as in ``scheme="time-span"``. Queries
+    return the ids of the matching records in ascending order; by default
+    a record's id is its position in the input. An index built with
+    :meth:`from_arrays` returns them as a NumPy ``intp`` array, otherwise
+    as a list.
+
+    A query costs a few binary searches plus time proportional to the
+    number of records it returns (mostly sorting them). A NumPy mask over
+    all records is therefore still competitive for queries that match a
+    large share of them, and for list-returning indexes it is faster once
+    a query matches more than a few percent of the records.
+    """
+
+    __slots__ = (
+        "_buckets",
+        "_open_end_starts",
+        "_open_end_ids",
+        "_open_start_ends",
+        "_open_start_ids",
+        "_size",
+        "_np",
+    )
+
+    def __init__(
+        self,
+        starts: Iterable[Optional[float]],
+        ends: Iterable[Optional[float]],
+        ids: Optional[Iterable[int]] = None,
+    ) -> None:
+        records: Dict[int, List[Tuple[float, float, int]]] = {}
+        for s, e, i in zip(starts, ends, count() if ids is None else ids):
+            if _is_missing(s) or _is_missing(e):
+                continue
+            s, e = float(s), float(e)
+            _check_range(s, e)
+            records.setdefault(_bucket_key(s, e), []).append((e, s, i))
+        groups: _Groups = {}
+        for key, recs in records.items():
+            recs.sort()
+            groups[key] = (
+                [r[1] for r in recs],
+                [r[0] for r in recs],
+                [r[2] for r in recs],
+            )
+        self._init_groups(groups)
+
+    def _init_groups(self, groups: _Groups, np: Any = None) -> None:
+        empty: Tuple[List[float], List[float], Sequence[int]] = ([], [], [])
+        if np is not None:
+            empty = ([], [], np.empty(0, dtype=np.intp))
+        open_starts, _, open_ids = groups.pop(_OPEN_END, empty)
+        _, lower_ends, lower_ids = groups.pop(_OPEN_START, empty)
+        buckets = []
+        for key in sorted(groups):
+            starts, ends, ids = groups[key]
+            lengths = [e - s for s, e in zip(starts, ends)]
+            buckets.append(_Bucket(starts, ends, ids, min(lengths), max(lengths)))
+        self._buckets = buckets
+        self._open_end_starts = open_starts
+        self._open_end_ids = open_ids
+        self._open_start_ends = lower_ends
+        self._open_start_ids = lower_ids
+        self._size = len(open_ids) + len(lower_ids) + sum(len(b.ids) for b in buckets)
+        self._np = np
+
+    @classmethod
+    def from_results(cls, results: Sequence[Any]) -> IntervalIndex:
+        """Index the output of :func:`~unstruwwel_py.core.unstruwwel`.
+
+        Accepts time-span tuples, ``Parsed`` objects or ``Period`` values;
+        ids are positions in ``results``.
+        """
+        spans = [_span(r) for r in results]
+        return cls((s for s, _ in spans), (e for _, e in spans))
+
+    @classmethod
+    def from_arrays(cls, arrays: TimeSpanArrays) -> IntervalIndex:
+        """Index the columnar output of :func:`~unstruwwel_py.unstruwwel_array`.
+
+        Sorted and bucketed with NumPy. Queries return NumPy arrays of
+        positions in ``arrays`` (map them to input rows with
+        ``arrays.row[ids]``).
+        """
+        import numpy as np
+
+        start = np.asarray(arrays.start, dtype=np.float64)
+        end = np.asarray(arrays.end, dtype=np.float64)
+        keep = np.flatnonzero(~(np.isnan(start) | np.isnan(end)))
+        start, end = start[keep], end[keep]
+        if np.any(start > end):
+            raise ValueError("start must be <= end")
+        with np.errstate(invalid="ignore"):
+            length = end - start
+        # int(length).bit_length() for the closed spans
+        key = np.frexp(np.floor(np.where(np.isfinite(length), length, 0)))[1]
+        key[start == -np.inf] = _OPEN_START
+        key[end == np.inf] = _OPEN_END
+        order = np.lexsort((start, end, key))
+        key, start, end, keep = key[order], start[order], end[order], keep[order]
+        bounds = np.flatnonzero(np.diff(key)) + 1
+        groups: _Groups = {}
+        edges = [0, *bounds.tolist(), len(key)] if len(key) else []
+        for lo, hi in zip(edges, edges[1:]):
+            groups[int(key[lo])] = (
+                start[lo:hi].tolist(),
+                end[lo:hi].tolist(),
+                keep[lo:hi],
+            )
+        index = cls.__new__(cls)
+        index._init_groups(groups, np)
+        return index
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _sorted(self, pieces: List[Sequence[int]]) -> Ids:
+        """Concatenate the id slices of a query and sort them."""
+        np = self._np
+        if np is not None:
+            if not pieces:
+                return np.empty(0, dtype=np.intp)
+            return np.sort(np.concatenate(pieces))
+        out: List[int] = []
+        for piece in pieces:
+            out += piece
+        out.sort()
+        return out
+
+    def _reaching(self, last_start: float, first_end: float) -> Ids:
+        """Ids of the records with ``start <= last_start`` and ``end >= first_end``."""
+        lo = bisect_left(self._open_start_ends, first_end)
+        hi = bisect_right(self._open_end_starts, last_start)
+        pieces = [self._open_start_ids[lo:], self._open_end_ids[:hi]]
+        for b in self._buckets:
+            # start <= last_start  <=>  end <= last_start + length
+            lo = bisect_left(b.ends, first_end)
+            mid = max(lo, bisect_right(b.ends, last_start + b.min_len))
+            hi = bisect_right(b.ends, last_start + b.max_len)
+            ids, starts = b.ids, b.starts
+            pieces.append(ids[lo:mid])
+            band = [j for j in range(mid, hi) if starts[j] <= last_start]
+            if band:
+                pieces.append(_take(ids, band))
+        return self._sorted(pieces)
+
+    def overlapping(self, start: float, end: float) -> Ids:
+        """Records sharing at least one year with ``[start, end]``."""
+        _check_range(start, end)
+        return self._reaching(end, start)
+
+    def containing(self, start: float, end: float) -> Ids:
+        """Records that cover all of ``[start, end]``."""
+        _check_range(start, end)
+        return self._reaching(start, end)
+
+    def within(self, start: float, end: float) -> Ids:
+        """Records lying entirely inside ``[start, end]``."""
+        _check_range(start, end)
+        pieces = []
+        if start == -_INF:
+            hi = bisect_right(self._open_start_ends, end)
+            pieces.append(self._open_start_ids[:hi])
+        if end == _INF:
+            lo = bisect_left(self._open_end_starts, start)
+            pieces.append(self._open_end_ids[lo:])
+        for b in self._buckets:
+            # start >= bound  <=>  end >= bound + length
+            hi = bisect_right(b.ends, end)
+            lo = bisect_left(b.ends, start + b.min_len)
+            mid = min(hi, max(lo, bisect_left(b.ends, start + b.max_len)))
+            ids, starts = b.ids, b.starts
+            pieces.append(ids[mid:hi])
+            band = [j for j in range(lo, mid) if starts[j] >= start]
+            if band:
+                pieces.append(_take(ids, band))
+        return self._sorted(pieces)
+
+    def at(self, year: float) -> Ids:
+        """Records whose span includes ``year`` (a stabbing query)."""
+        return self.containing(year, year)
+
+    def before(self, year: float) -> Ids:
+        """Records ending before ``year``."""
+        _check_range(year, year)
+        pieces = [self._open_start_ids[: bisect_left(self._open_start_ends, year)]]
+        for b in self._buckets:
+            pieces.append(b.ids[: bisect_left(b.ends, year)])
+        return self._sorted(pieces)
+
+    def after(self, year: float) -> Ids:
+        """Records starting after ``year``."""
+        _check_range(year, year)
+        pieces = [self._open_end_ids[bisect_right(self._open_end_starts, year) :]]
+        for b in self._buckets:
+            # start > year  <=>  end > year + length
+            lo = bisect_right(b.ends, year + b.min_len)
+            mid = max(lo, bisect_right(b.ends, year + b.max_len))
+            ids, starts = b.ids, b.starts
+            pieces.append(ids[mid:])
+            band = [j for j in range(lo, mid) if starts[j] > year]
+            if band:
+                pieces.append(_take(ids, band))
+        return self._sorted(pieces)
+
+
+def _take(ids: Sequence[int], positions: List[int]) -> Sequence[int]:
+    if isinstance(ids, list):
+        return [ids[j] for j in positions]
+    return ids[positions]
+
+
+def _check_range(start: float, end: float) -> None:
+    if math.isnan(start) or math.isnan(end):
+        raise ValueError("query bounds must not be nan")
+    if start > end:
+        raise ValueError("start must be <= end")
@@ -0,0 +1,139 @@
+"""Single-pass keyword scanning (Aho–Corasick).
+
+Fuzzy markers, before/after keywords and "last" tokens are looked up in
+every parsed string. Instead of one substring search per keyword, each
+language gets one automaton over all of them, and one pass over the text
+reports every keyword class found together with its leftmost position.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import TYPE_CHECKING, Dict, Iterable, List, Mapping, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .resources import LanguageSpec
+
+# Keyword classes
+APPROXIMATE = "approximate"
+UNCERTAIN = "uncertain"
+APPROXIMATE_DEFAULT = "approximate_default"
+UNCERTAIN_DEFAULT = "uncertain_default"
+BEFORE = "before"
+AFTER = "after"
+LAST = "last"
+
+# Markers recognised in every language, on top of the language's own
+DEFAULT_APPROXIMATE = ("circa", "ca", "ca.")
+DEFAULT_UNCERTAIN = ("uncertain", "perhaps", "probably")
+
+# Class -> offset of its leftmost occurrence in the scanned text
+KeywordHits = Dict[str, int]
+
+
+class KeywordScanner:
+    """Aho–Corasick automaton over classified keywords.
+
+    Matching is plain substring matching, so overlapping and nested
+    keywords are all found, exactly as ``keyword in text`` would.
+    """
+
+    __slots__ = ("_delta", "_out", "_always")
+
+    def __init__(self, keywords: Mapping[str, Iterable[str]]) -> None:
+        goto: List[Dict[str, int]] = [{}]
+        out: List[List[Tuple[str, int]]] = [[]]
+        always: Dict[str, int] = {}
+        for cls, words in keywords.items():
+            for word in words:
+                if not word:
+                    # The empty string is a substring of everything
+                    always[cls] = 0
+                    continue
+                state = 0
+                for ch in word:
+                    nxt = goto[state].get(ch)
+                    if nxt is None:
+                        nxt = goto[state][ch] = len(goto)
+                        goto.append({})
+                        out.append([])
+                    state = nxt
+                out[state].append((cls, len(word)))
+
+        # Breadth-first failure links, folded into a complete transition
+        # table so scanning never follows them
+        delta: List[Dict[str, int]] = [dict(goto[0])] + [{} for _ in goto[1:]]
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            out[state].extend(out[fail[state]])
+            trans = delta[state]
+            trans.update(delta[fail[state]])
+            for ch, nxt in goto[state].items():
+                fail[nxt] = delta[fail[state]].get(ch, 0)
+                trans[ch] = nxt
+                queue.append(nxt)
+
+        self._delta = tuple(delta)
+        self._out = tuple(tuple(o) for o in out)
+        self._always = always
+
+    def scan(self, text: str) -> KeywordHits:
+        """Classes found in ``text``, mapped to their leftmost offset."""
+        hits = dict(self._always)
+        delta = self._delta
+        out = self._out
+        state = 0
+        for end, ch in enumerate(text, 1):
+            state = delta[state].get(ch, 0)
+            if out[state]:
+                for cls, length in out[state]:
+                    start = end - length
+                    if hits.get(cls, start + 1) > start:
+                        hits[cls] = start
+        return hits
+
+
+def build_scanner(spec: Optional[LanguageSpec]) -> KeywordScanner:
+    """Scanner for ``spec``'s keywords, or the English fallbacks without one."""
+    if spec is None:
+        return KeywordScanner(
+            {
+                APPROXIMATE_DEFAULT: DEFAULT_APPROXIMATE,
+                UNCERTAIN_DEFAULT: DEFAULT_UNCERTAIN,
+                BEFORE: ("before",),
+                AFTER: ("after",),
+            }
+        )
+    return KeywordScanner(
+        {
+            APPROXIMATE: spec.approximate,
+            UNCERTAIN: spec.uncertain,
+            APPROXIMATE_DEFAULT: DEFAULT_APPROXIMATE,
+            UNCERTAIN_DEFAULT: DEFAULT_UNCERTAIN,
+            BEFORE: spec.before,
+            AFTER: spec.after,
+            LAST: spec.last_tokens,
+        }
+    )
+
+
+_DEFAULT_SCANNER: Optional[KeywordScanner] = None
+
+
+def default_scanner() -> KeywordScanner:
+    """Scanner used when parsing without a language spec."""
+    global _DEFAULT_SCANNER
+    if _DEFAULT_SCANNER is None:
+        _DEFAULT_SCANNER = build_scanner(None)
+    return _DEFAULT_SCANNER
+
+
+def fuzzy_from_hits(hits: KeywordHits) -> int:
+    """Fuzzy marker: 1 if uncertain, else -1 if approximate, else 0."""
+    if UNCERTAIN in hits or UNCERTAIN_DEFAULT in hits:
+        return 1
+    if APPROXIMATE in hits or APPROXIMATE_DEFAULT in hits:
+        return -1
+    return 0
@@ -1,8 +1,11 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Iterable, List, Set
+from typing import FrozenSet, Iterable, List, Optional, Set, Tuple, Union
+import os
 import re
+import threading
 from . import resources as _res
+from .cache import DEFAULT_CACHE_SIZE, MISSING, LRUCache
 
 
 @dataclass
@@ -11,69 +14,180 @@ class LanguageData:
 
 
 _detector = None
+_detector_lock = threading.Lock()
 
+# "No-lingua" mode keeps guessing on the JSON-token and keyword heuristics and
+# never imports lingua or loads its language models.
+_use_lingua = os.environ.get("UNSTRUWWEL_NO_LINGUA", "").lower() not in {
+    "1",
+    "true",
+    "yes",
+}
 
-def _get_detector():
+
+def set_lingua_enabled(enabled: bool) -> None:
+    """Enable or disable the lingua detector fallback in :func:`guess_language`."""
+    global _use_lingua
+    if bool(enabled) == _use_lingua:
+        return
+    _use_lingua = bool(enabled)
+    # Results parsed with language=None depend on the detector
+    from .cache import PARSE_CACHE
+
+    PARSE_CACHE.clear()
+
+
+def lingua_enabled() -> bool:
+    return _use_lingua
+
+
+def _get_detector(preload: bool = False):
     global _detector
     if _detector is not None:
         return _detector
-    try:
-        # Use lingua for robust detection, restricted to en/de/fr
-        from lingua import Language, LanguageDetectorBuilder
+    # Serialise construction so a background preload and a first guess
+    # never both build the (large) detector
+    with _detector_lock:
+        if _detector is not None:
+            return _detector
+        try:
+            # Use lingua for robust detection, restricted to en/de/fr
+            from lingua import Language, LanguageDetectorBuilder
 
-        _detector = (
-            LanguageDetectorBuilder.from_languages(
+            builder = LanguageDetectorBuilder.from_languages(
                 Language.ENGLISH, Language.GERMAN, Language.FRENCH
-            )
-            .with_minimum_relative_distance(0.05)
-            .build()
-        )
-        return _detector
-    except Exception:
-        _detector = False  # marker to use fallback
+            ).with_minimum_relative_distance(0.05)
+            if preload:
+                builder = builder.with_preloaded_language_models()
+            _detector = builder.build()
+        except Exception:
+            _detector = False  # marker to use fallback
         return _detector
 
 
-def guess_language(values: Iterable[str], verbose: bool = False) -> List[str] | str:
+def preload_detector(background: bool = False) -> Optional[threading.Thread]:
+    """Build the lingua detector and load its models ahead of first use.
+
+    With ``background=True`` this happens in a daemon thread, which is
+    returned; a guess that needs the detector meanwhile waits for it.
+    Does nothing in no-lingua mode.
+    """
+    if not _use_lingua:
+        return None
+    if not background:
+        _get_detector(preload=True)
+        return None
+    thread = threading.Thread(
+        target=_get_detector,
+        kwargs={"preload": True},
+        name="unstruwwel-lingua-preload",
+        daemon=True,
+    )
+    thread.start()
+    return thread
+
+
+_TOKEN_RE = re.compile(r"[\w\u00C0-\u024F\-\.]+")
+
+# Guesses keyed on ("json", token signature) or ("text", joined values, lingua)
+_GUESS_CACHE = LRUCache(DEFAULT_CACHE_SIZE)
+
+
+def clear_guess_cache() -> None:
+    """Forget cached language guesses."""
+    _GUESS_CACHE.clear()
+
+
+def _token_signature(vals: List[str]) -> FrozenSet[str]:
+    """Tokens that can identify a language (drops short and numeric ones)."""
+    tokenized_raw: Set[str] = set()
+    for v in vals:
+        tokenized_raw.update(_TOKEN_RE.findall(v.lower()))
+    # Drop very short/ambiguous tokens (e.g., 'jan', 'avr', 'okt')
+    return frozenset(t for t in tokenized_raw if len(t) >= 4 and not t.isdigit())
+
+
+def _json_languages(signature: FrozenSet[str]) -> Tuple[str, ...]:
+    """Languages whose JSON resources contain any token of ``signature``."""
+    key = ("json", signature)
+    present = _GUESS_CACHE.get(key)
+    if present is MISSING:
+        present = []
+        if signature:
+            for code in ("en", "de", "fr"):
+                spec = _res.get_language_spec(code)
+                if spec is not None and not signature.isdisjoint(spec.tokens):
+                    present.append(code)
+        present = tuple(present)
+        _GUESS_CACHE.put(key, present)
+    return present
+
+
+def guess_language(
+    values: Iterable[str], verbose: bool = False, use_lingua: Optional[bool] = None
+) -> List[str] | str:
     """Guess language for the given values.
 
     Prefers lingua-language-detector when available; falls back to a heuristic.
     Returns a single code ('en'|'de'|'fr') when clear, else a sorted list.
+    Guesses are cached, so repeated values are cheap. ``use_lingua``
+    overrides :func:`set_lingua_enabled` for this call.
     """
+    if use_lingua is None:
+        use_lingua = _use_lingua
     vals = [v for v in values if isinstance(v, str) and v.strip()]
     if not vals:
         raise ValueError("Could not guess language")
 
     # 1) Prefer explicit token presence from our language JSONs to allow multi-results
-    def _json_tokens(lang: str) -> Set[str]:
-        try:
-            obj = _res._load_json(lang)  # type: ignore[attr-defined]
-        except Exception:
-            obj = None
-        toks: Set[str] = set()
-        if isinstance(obj, dict):
-            for v in obj.values():
-                if isinstance(v, list):
-                    for s in v:
-                        if isinstance(s, str):
-                            toks.add(s.lower())
-        return toks
-
-    tokenized_raw: Set[str] = set()
-    for v in vals:
-        tokenized_raw.update(re.findall(r"[\w\u00C0-\u024F\-\.]+", v.lower()))
-    # Drop very short/ambiguous tokens (e.g., 'jan', 'avr', 'okt')
-    tokenized = {t for t in tokenized_raw if len(t) >= 4 and not t.isdigit()}
-    hits = {code: (tokenized & _json_tokens(code)) for code in ("en", "de", "fr")}
-    present = [code for code, hs in hits.items() if hs]
+    present = _json_languages(_token_signature(vals))
     if present:
         if verbose:
             print(f"Guessed languages (json): {', '.join(sorted(present))}")
         return present[0] if len(present) == 1 else sorted(set(present))
 
-    # 2) Fallback to lingua if available
-    det = _get_detector()
     text = "\n".join(vals)
+    key = ("text", text, use_lingua)
+    cached = _GUESS_CACHE.get(key)
+    if cached is MISSING:
+        cached = _guess_text(text, use_lingua)
+        _GUESS_CACHE.put(key, cached)
+    source, langs, result = cached
+    if verbose:
+        print(f"Guessed languages ({source}): {', '.join(langs) if langs else 'none'}")
+    if result is None:
+        raise ValueError("Could not guess language")
+    return list(result) if isinstance(result, tuple) else result
+
+
+def guess_column_language(
+    values: Iterable[Optional[str]], default: str = "en"
+) -> Tuple[str, bool]:
+    """Guess one language for a whole column.
+
+    Returns ``(code, confident)``. ``confident`` is False when the guess was
+    ambiguous (the first candidate is returned) or failed (``default`` is
+    returned), so callers can fall back to per-row detection.
+    """
+    try:
+        gl = guess_language(values, verbose=False)
+    except Exception:
+        return default, False
+    if isinstance(gl, str):
+        return gl, True
+    return gl[0], False
+
+
+def _guess_text(
+    text: str, use_lingua: bool = True
+) -> Tuple[str, List[str], Union[str, Tuple[str, ...], None]]:
+    """Detect the language of ``text`` without the JSON token shortcut.
+
+    Returns ``(source, candidates, result)``; ``result`` is None when the
+    language cannot be guessed.
+    """
+    # 2) Fallback to lingua if available
+    det = _get_detector() if use_lingua else None
     if det not in (None, False):
         try:
             result = det.compute_language_confidence_values(text)
@@ -82,23 +196,20 @@ def guess_language(values: Iterable[str], verbose: bool = False) -> List[str] |
             mapping = {"GERMAN": "de", "ENGLISH": "en", "FRENCH": "fr"}
             langs = [mapping.get(r.language.name, "") for r in ranked if r.value > 0]
             langs = [lang for lang in langs if lang]
-            if verbose:
-                print(
-                    f"Guessed languages (lingua): {', '.join(langs) if langs else 'none'}"
+            if langs:
+                return (
+                    "lingua",
+                    langs,
+                    langs[0]
+                    if (len(langs) == 1 or ranked[0].value - ranked[1].value >= 0.15)
+                    else tuple(sorted(set(langs[:2]))),
                 )
-            if not langs:
-                raise ValueError("Could not guess language")
-            return (
-                langs[0]
-                if (len(langs) == 1 or ranked[0].value - ranked[1].value >= 0.15)
-                else sorted(set(langs[:2]))
-            )
         except Exception:
             # fall through to heuristic
             pass
 
     # Heuristic fallback
-    tokens = set(re.findall(r"[\w\u00C0-\u024F\-\.]+", text.lower()))
+    tokens = set(_TOKEN_RE.findall(text.lower()))
     scores = {"de": 0, "en": 0, "fr": 0}
     de_keys = {"januar", "jahrhundert", "jh", "vor", "und", "de"}
     en_keys = {"january", "century", "bc", "after", "and", "en"}
@@ -108,8 +219,10 @@ def guess_language(values: Iterable[str], verbose: bool = False) -> List[str] |
     scores["fr"] = len(tokens & fr_keys)
     best = max(scores.values())
     langs = [k for k, v in scores.items() if v == best and v > 0]
-    if verbose:
-        print(f"Guessed languages (fallback): {', '.join(langs) if langs else 'none'}")
     if not langs:
-        raise ValueError("Could not guess language")
-    return langs[0] if len(langs) == 1 else sorted(set(langs))
+        return ("fallback", langs, None)
+    return (
+        "fallback",
+        langs,
+        langs[0] if len(langs) == 1 else tuple(sorted(set(langs))),
+    )
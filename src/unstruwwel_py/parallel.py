@@ -0,0 +1,138 @@
+"""Multi-process parsing for very large inputs."""
+
+from __future__ import annotations
+
+import math
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Any, Deque, Iterable, Iterator, List, Optional, Sequence
+
+from .core import (
+    InputLimits,
+    Result,
+    _parse_single,
+    _rows_to_list,
+    get_input_limits,
+    set_input_limits,
+)
+from .lang import lingua_enabled, set_lingua_enabled
+from .resources import (
+    SUPPORTED_LANGUAGES,
+    get_language_spec,
+    get_regex_engine,
+    set_regex_engine,
+)
+
+# Chunks are kept large enough to amortise pickling, and small enough to
+# keep every worker busy until the end.
+MIN_CHUNKSIZE = 256
+MAX_CHUNKSIZE = 10_000
+
+
+def _warm_up(
+    languages: Iterable[str], engine: str, limits: InputLimits, use_lingua: bool
+) -> None:
+    """Worker initializer: load specs and compile patterns once per process.
+
+    Also applies the parent's regex engine, input limits and lingua mode,
+    which spawned workers would not inherit.
+    """
+    if engine != get_regex_engine():
+        set_regex_engine(engine)
+    set_input_limits(*limits)
+    set_lingua_enabled(use_lingua)
+    for lang in languages:
+        spec = get_language_spec(lang)
+        if spec is not None:
+            spec.patterns
+
+
+def _parse_chunk(
+    texts: Sequence[Optional[str]], language: Optional[str], scheme: str
+) -> List[List[Result]]:
+    """Parse a chunk, returning the results of each input row."""
+    return [_rows_to_list(_parse_single(t, language, scheme)) for t in texts]
+
+
+def default_chunksize(n: int, workers: int) -> int:
+    """Aim for about four chunks per worker."""
+    size = math.ceil(n / (workers * 4)) if n else MIN_CHUNKSIZE
+    return max(MIN_CHUNKSIZE, min(MAX_CHUNKSIZE, size))
+
+
+def _languages(language: Optional[str]) -> tuple:
+    return (language,) if language else tuple(sorted(SUPPORTED_LANGUAGES))
+
+
+def _initargs(language: Optional[str]) -> tuple:
+    return (
+        _languages(language),
+        get_regex_engine(),
+        get_input_limits(),
+        lingua_enabled(),
+    )
+
+
+def process_pool(
+    workers: Optional[int] = None, language: Optional[str] = None, **kwargs: Any
+) -> ProcessPoolExecutor:
+    """Process pool whose workers parse like the current process.
+
+    Each worker applies the current regex engine, input limits and lingua
+    mode (as of this call) and loads the resources of ``language`` (all languages if
+    None) once on start-up. Pass it as the ``executor`` of
+    :func:`~unstruwwel_py.aio.aunstruwwel`; further keyword arguments go to
+    ``ProcessPoolExecutor``.
+    """
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_warm_up,
+        initargs=_initargs(language),
+        **kwargs,
+    )
+
+
+def parse_rows_parallel(
+    texts: Sequence[Optional[str]],
+    language: Optional[str],
+    scheme: str,
+    workers: int,
+    chunksize: Optional[int] = None,
+) -> List[List[Result]]:
+    """Parse ``texts`` on a process pool, keeping per-row results in order."""
+    if chunksize is None:
+        chunksize = default_chunksize(len(texts), workers)
+    if chunksize < 1:
+        raise ValueError("chunksize must be >= 1")
+    chunks = [texts[i : i + chunksize] for i in range(0, len(texts), chunksize)]
+    rows: List[List[Result]] = []
+    with process_pool(workers, language) as executor:
+        # map() yields in submission order, so rows stay aligned with texts
+        for part in executor.map(
+            _parse_chunk, chunks, repeat(language), repeat(scheme)
+        ):
+            rows.extend(part)
+    return rows
+
+
+def iter_chunks_parallel(
+    chunks: Iterable[Sequence[Optional[str]]],
+    language: Optional[str],
+    scheme: str,
+    workers: int,
+) -> Iterator[List[List[Result]]]:
+    """Parse a stream of chunks on a process pool, yielding each chunk's rows.
+
+    Unlike :func:`parse_rows_parallel` the input is not materialised: at
+    most ``2 * workers`` chunks are in flight, and chunks are yielded in
+    input order.
+    """
+    pending: Deque = deque()
+    with process_pool(workers, language) as executor:
+        for chunk in chunks:
+            pending.append(executor.submit(_parse_chunk, chunk, language, scheme))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
@@ -2,7 +2,7 @@
 
 from .centuries import parse_century
 from .decades import parse_decade
-from .dates import parse_date, parse_month_year, parse_day_month_year
+from .dates import parse_date, parse_month_year, parse_day_month_year, parse_numeric
 from .intervals import parse_before_after, parse_year_interval
 from .seasons import parse_season
 
@@ -10,6 +10,7 @@ __all__ = [
     "parse_century",
     "parse_decade",
     "parse_date",
+    "parse_numeric",
     "parse_month_year",
     "parse_day_month_year",
     "parse_before_after",
@@ -1,11 +1,12 @@
 """Century parsing logic."""
 
 from __future__ import annotations
-import re
 from typing import Optional, Tuple
 
 from ..dates import Period
+from ..keywords import APPROXIMATE, LAST
 from ..resources import LanguageSpec
+from ..scan import TextScan, scan_text
 
 
 def _compute_century_span(
@@ -64,7 +65,10 @@ def _compute_century_span(
 
 
 def parse_century(
-    low: str, spec: Optional[LanguageSpec], fuzzy: int
+    low: str,
+    spec: Optional[LanguageSpec],
+    fuzzy: int,
+    scan: Optional[TextScan] = None,
 ) -> Optional[Period]:
     """Try to parse a century expression using language spec patterns.
 
@@ -72,6 +76,7 @@ def parse_century(
         low: Lowercase input text
         spec: Language specification
         fuzzy: Fuzzy marker (-1 = approximate, 0 = exact, 1 = uncertain)
+        scan: Pre-scan of ``low``, computed if not given
 
     Returns:
         Period if matched, None otherwise
@@ -79,32 +84,19 @@ def parse_century(
     if not spec:
         return None
 
-    century_pat = spec.century_pattern()
-    if not century_pat:
+    patterns = spec.patterns
+    if patterns.century is None:
         return None
 
-    bc_pat = spec.bc_pattern()
-    ordinal_pat = spec.ordinal_pattern()
-    half_pat = spec.half_pattern()
-    third_pat = spec.third_pattern()
-    quarter_pat = spec.quarter_pattern()
-
+    if scan is None:
+        scan = scan_text(low, spec)
+    hits = scan.hits
     # Check for approximate marker
-    is_approx = any(k in low for k in spec.approximate)
+    is_approx = APPROXIMATE in hits
 
     # Try fractional century pattern
-    frac_patterns = []
-    if half_pat:
-        frac_patterns.append((half_pat, "half", 2))
-    if third_pat:
-        frac_patterns.append((third_pat, "third", 3))
-    if quarter_pat:
-        frac_patterns.append((quarter_pat, "quarter", 4))
-
-    for frac_pat, frac_type, max_part in frac_patterns:
-        # Pattern: [approx] [ordinal] [fraction] [ordinal] [century] [bc]
-        pattern = rf"(?:ca\.?\s+)?({ordinal_pat})?\s*({frac_pat})\s+({ordinal_pat})\s*\.?\s*({century_pat})\.?\s*({bc_pat})?"
-        m = re.search(pattern, low, re.IGNORECASE)
+    for frac_re, frac_type, max_part in patterns.century_fractions:
+        m = frac_re.search(low)
         if m:
             part_str = m.group(1)
             century_str = m.group(3)
@@ -115,10 +107,8 @@ def parse_century(
 
             if century and part and 1 <= part <= max_part:
                 # Check for "last" modifier
-                for last_tok in spec.last_tokens:
-                    if last_tok in low:
-                        part = max_part
-                        break
+                if LAST in hits:
+                    part = max_part
 
                 start, end = _compute_century_span(century, part, frac_type, bce)
                 if bce:
@@ -129,8 +119,7 @@ def parse_century(
                 return p
 
     # Try simple century pattern: "[ordinal] century [bc]"
-    pattern = rf"({ordinal_pat})\s*\.?\s*({century_pat})\.?\s*({bc_pat})?"
-    m = re.search(pattern, low, re.IGNORECASE)
+    m = patterns.century.search(low)
     if m:
         century_str = m.group(1)
         bce = bool(m.group(3))
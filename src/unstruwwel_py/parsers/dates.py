@@ -5,11 +5,19 @@ import re
 from typing import List, Optional, Tuple
 
 from ..dates import Period, period_for_month, period_for_year, MONTHS
-from ..resources import LanguageSpec
+from ..resources import LanguagePatterns, LanguageSpec
+from ..scan import TextScan
+from .intervals import year_interval_period
+
+_YEAR_RE = re.compile(r"(-?\d{3,4})")
 
 
 def parse_date(
-    low: str, txt: str, spec: Optional[LanguageSpec], fuzzy: int
+    low: str,
+    txt: str,
+    spec: Optional[LanguageSpec],
+    fuzzy: int,
+    scan: Optional[TextScan] = None,
 ) -> Optional[Period]:
     """Try to parse a plain year.
 
@@ -18,34 +26,75 @@ def parse_date(
         txt: Original (stripped) input text
         spec: Language specification
         fuzzy: Fuzzy marker
+        scan: Pre-scan of ``low``; the regex is used if not given
 
     Returns:
         Period if matched, None otherwise
     """
-    m = re.fullmatch(r"(-?\d{3,4})", txt)
-    if m:
-        y = int(m.group(1))
+    if scan is not None:
+        year = scan.fullmatch_year()
+    else:
+        m = _YEAR_RE.fullmatch(txt)
+        year = m.group(1) if m else None
+    if year is not None:
+        y = int(year)
         p = period_for_year(y)
         p.fuzzy = fuzzy
         return p
     return None
 
 
+def parse_numeric(txt: str) -> Optional[Period]:
+    """Fast path for bare years ("1752", "-450") and intervals ("1752/60").
+
+    Uses string methods only, so it is much cheaper than the regex parsers.
+    Matches exactly what :func:`parse_date` and
+    :func:`~unstruwwel_py.parsers.intervals.parse_year_interval` accept;
+    anything else returns None and goes through the regular parsers.
+
+    Args:
+        txt: Original (stripped) input text
+
+    Returns:
+        Period if matched, None otherwise
+    """
+    if not txt or not txt.isascii():
+        return None
+    if txt.isdigit():
+        if 3 <= len(txt) <= 4:
+            return period_for_year(int(txt))
+        return None
+    if txt[0] == "-":
+        if 4 <= len(txt) <= 5 and txt[1:].isdigit():
+            return period_for_year(int(txt))
+        return None
+    head, sep, tail = txt.partition("/")
+    if (
+        sep
+        and 3 <= len(head) <= 4
+        and 1 <= len(tail) <= 4
+        and head.isdigit()
+        and tail.isdigit()
+    ):
+        return year_interval_period(head, tail)
+    return None
+
+
 def parse_month_year(
-    low: str, mon_pat_cap: str, spec: Optional[LanguageSpec], fuzzy: int
+    low: str, patterns: LanguagePatterns, spec: Optional[LanguageSpec], fuzzy: int
 ) -> Optional[Period]:
     """Try to parse month + year expression.
 
     Args:
         low: Lowercase input text
-        mon_pat_cap: Capturing month pattern regex
+        patterns: Compiled patterns for the language
         spec: Language specification
         fuzzy: Fuzzy marker
 
     Returns:
         Period if matched, None otherwise
     """
-    m = re.fullmatch(rf"{mon_pat_cap}\s+(\d{{3,4}})", low)
+    m = patterns.month_year.fullmatch(low)
     if m:
         y = int(m.group(2))
         tok = m.group(1)
@@ -58,20 +107,20 @@ def parse_month_year(
 
 
 def parse_day_month_year(
-    low: str, mon_pat_cap: str, spec: Optional[LanguageSpec], fuzzy: int
+    low: str, patterns: LanguagePatterns, spec: Optional[LanguageSpec], fuzzy: int
 ) -> Optional[Period]:
     """Try to parse exact day Month D, YYYY (English style).
 
     Args:
         low: Lowercase input text
-        mon_pat_cap: Capturing month pattern regex
+        patterns: Compiled patterns for the language
         spec: Language specification
         fuzzy: Fuzzy marker
 
     Returns:
         Period if matched, None otherwise
     """
-    m = re.fullmatch(rf"{mon_pat_cap}\s+(\d{{1,2}}),\s*(\d{{3,4}})", low)
+    m = patterns.day_month_year.fullmatch(low)
     if m:
         y = int(m.group(3))
         d = int(m.group(2))
@@ -85,13 +134,13 @@ def parse_day_month_year(
 
 
 def parse_german_date(
-    low: str, mon_pat_cap: str, spec: Optional[LanguageSpec], fuzzy: int
+    low: str, patterns: LanguagePatterns, spec: Optional[LanguageSpec], fuzzy: int
 ) -> List[Tuple[Period, Tuple[int, int]]]:
     """Parse German-style dates: "15. januar 1750".
 
     Args:
         low: Lowercase input text
-        mon_pat_cap: Capturing month pattern regex
+        patterns: Compiled patterns for the language
         spec: Language specification
         fuzzy: Fuzzy marker
 
@@ -99,7 +148,7 @@ def parse_german_date(
         List of (Period, (start, end)) tuples for matched spans
     """
     results = []
-    for m in re.finditer(rf"(\d{{1,2}})\.\s*{mon_pat_cap}\s+(\d{{3,4}})", low):
+    for m in patterns.de_date.finditer(low):
         d = int(m.group(1))
         month_tok = m.group(2)
         mm = spec.months.get(month_tok) if spec else MONTHS.get(month_tok)
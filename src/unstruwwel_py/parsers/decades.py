@@ -6,10 +6,19 @@ from typing import Optional
 
 from ..dates import Period
 from ..resources import LanguageSpec
+from ..scan import TextScan
+
+_DECADE_EN_RE = re.compile(r"(\d{3})0s")
+_DECADE_DE_RE = re.compile(r"er\s+jahre$")
+_FOUR_DIGITS_RE = re.compile(r"(\d{4})")
 
 
 def parse_decade(
-    low: str, txt: str, spec: Optional[LanguageSpec], fuzzy: int
+    low: str,
+    txt: str,
+    spec: Optional[LanguageSpec],
+    fuzzy: int,
+    scan: Optional[TextScan] = None,
 ) -> Optional[Period]:
     """Try to parse a decade expression.
 
@@ -22,23 +31,39 @@ def parse_decade(
         txt: Original (stripped) input text
         spec: Language specification
         fuzzy: Fuzzy marker
+        scan: Pre-scan of ``low``; regexes are used if not given
 
     Returns:
         Period if matched, None otherwise
     """
     # decade: 1840s (en)
-    m = re.fullmatch(r"(\d{3})0s", low)
-    if m:
-        y = int(m.group(1) + "0")
+    if scan is not None:
+        is_en = (
+            scan.digit_runs == ((0, 4),)
+            and len(low) == 5
+            and low[3] == "0"
+            and low[4] == "s"
+        )
+    else:
+        is_en = _DECADE_EN_RE.fullmatch(low) is not None
+    if is_en:
+        y = int(low[:4])
         p = Period(start=(y, 1, 1), end=(y + 9, 12, 31))
         p.fuzzy = fuzzy
         return p
 
     # decade (de): 1760er Jahre
-    if re.search(r"er\s+jahre$", low):
-        num = re.search(r"(\d{4})", low)
-        if num:
-            y = int(num.group(1))
+    if _DECADE_DE_RE.search(low):
+        if scan is not None:
+            # First four digits of the first run of four or more
+            year = next(
+                (low[s : s + 4] for s, e in scan.digit_runs if e - s >= 4), None
+            )
+        else:
+            num = _FOUR_DIGITS_RE.search(low)
+            year = num.group(1) if num else None
+        if year is not None:
+            y = int(year)
             p = Period(start=(y, 1, 1), end=(y + 9, 12, 31))
             p.fuzzy = fuzzy
             return p
@@ -2,42 +2,86 @@
 
 from __future__ import annotations
 import re
-from typing import List, Optional, Set, Tuple
+from typing import List, Match, Optional, Tuple
 
 from ..dates import Period, period_for_year, MONTHS, MONTH_DAYS
-from ..resources import LanguageSpec
+from ..keywords import AFTER, BEFORE
+from ..resources import LanguagePatterns, LanguageSpec
+from ..scan import TextScan, scan_text
 
+_INTERVAL_RE = re.compile(r"(\d{3,4})\/(\d{1,4})")
 
-def parse_year_interval(txt: str, fuzzy: int) -> Optional[Period]:
+# First month of each season; anything else counts as winter
+_SEASON_START = {"spring": 3, "summer": 6, "autumn": 9}
+
+# Emit order of the multi-date kinds (named branches of ``multi_date``)
+_MULTI_DATE_RANK = {
+    "de_date": 0,
+    "before_season": 1,
+    "after_season": 2,
+    "before_month": 3,
+    "after_month": 4,
+    "before_year": 5,
+    "after_year": 6,
+}
+
+
+def parse_year_interval(
+    txt: str, fuzzy: int, scan: Optional[TextScan] = None
+) -> Optional[Period]:
     """Try to parse year interval like 1752/60.
 
     Args:
         txt: Original (stripped) input text
         fuzzy: Fuzzy marker
+        scan: Pre-scan of the text; the regex is used if not given
 
     Returns:
         Period if matched, None otherwise
     """
-    m = re.fullmatch(r"(\d{3,4})\/(\d{1,4})", txt)
-    if m:
-        y1 = int(m.group(1))
-        tail = m.group(2)
-        if len(tail) < len(m.group(1)):
-            y2 = int(str(y1)[: len(m.group(1)) - len(tail)] + tail)
-        else:
-            y2 = int(tail)
-        p = Period(start=(y1, 1, 1), end=(y2, 12, 31))
-        p.fuzzy = fuzzy
-        return p
+    if scan is None:
+        m = _INTERVAL_RE.fullmatch(txt)
+        if m:
+            return year_interval_period(m.group(1), m.group(2), fuzzy)
+        return None
+    # Exactly "<3-4 digits>/<1-4 digits>"
+    runs = scan.digit_runs
+    if len(runs) != 2:
+        return None
+    (s1, e1), (s2, e2) = runs
+    low = scan.low
+    if (
+        s1 == 0
+        and 3 <= e1 <= 4
+        and s2 == e1 + 1
+        and low[e1] == "/"
+        and e2 == len(low)
+        and e2 - s2 <= 4
+    ):
+        return year_interval_period(low[:e1], low[s2:], fuzzy)
     return None
 
 
+def year_interval_period(head: str, tail: str, fuzzy: int = 0) -> Period:
+    """Build the period for ``head/tail``, where a short tail such as the
+    "60" of "1752/60" replaces the last digits of ``head``.
+    """
+    y1 = int(head)
+    if len(tail) < len(head):
+        y2 = int(str(y1)[: len(head) - len(tail)] + tail)
+    else:
+        y2 = int(tail)
+    p = Period(start=(y1, 1, 1), end=(y2, 12, 31))
+    p.fuzzy = fuzzy
+    return p
+
+
 def parse_before_after(
     low: str,
-    mon_pat_cap: str,
-    season_pat: str,
+    patterns: LanguagePatterns,
     spec: Optional[LanguageSpec],
     fuzzy: int,
+    scan: Optional[TextScan] = None,
 ) -> Optional[Period]:
     """Try to parse before/after expressions.
 
@@ -48,37 +92,30 @@ def parse_before_after(
 
     Args:
         low: Lowercase input text
-        mon_pat_cap: Capturing month pattern regex
-        season_pat: Season pattern regex
+        patterns: Compiled patterns for the language
         spec: Language specification
         fuzzy: Fuzzy marker
+        scan: Pre-scan of ``low``, computed if not given
 
     Returns:
         Period if matched, None otherwise
     """
-    # Check if text starts with a before/after keyword
-    before_keywords: Set[str] = spec.before if spec else {"before"}
-    after_keywords: Set[str] = spec.after if spec else {"after"}
-
-    expr = 0
-    for kw in before_keywords:
-        if low.startswith(kw):
-            expr = -1
-            break
-    if expr == 0:
-        for kw in after_keywords:
-            if low.startswith(kw):
-                expr = 1
-                break
-
-    if expr == 0:
+    if scan is None:
+        scan = scan_text(low, spec)
+    hits = scan.hits
+    # The text must start with a before/after keyword
+    if hits.get(BEFORE) == 0:
+        expr = -1
+    elif hits.get(AFTER) == 0:
+        expr = 1
+    else:
         return None
 
-    ym = re.findall(mon_pat_cap, low)
-    m_season = re.search(rf"({season_pat})", low) if spec else None
+    ym = patterns.month_any.findall(low)
+    m_season = patterns.season_any.search(low) if spec else None
     season_tok = m_season.group(1) if m_season else None
     season_name = spec.seasons.get(season_tok) if spec and season_tok else None
-    yx = re.findall(r"(-?\d{3,4})", low)
+    yx = scan.years()
 
     if not yx:
         return None
@@ -146,104 +183,43 @@ def parse_before_after(
     return p
 
 
-def parse_multi_dates(
-    low: str,
-    mon_pat_base: str,
-    mon_pat_cap: str,
-    before_pat: str,
-    after_pat: str,
-    season_pat: str,
-    spec: Optional[LanguageSpec],
-    fuzzy: int,
-) -> Optional[List[Tuple[Period, Tuple[int, int]]]]:
-    """Parse multiple date expressions from complex input.
-
-    Used when input contains parentheses, dashes, or multiple dates.
+def multi_date_period(m: Match[str], spec: Optional[LanguageSpec]) -> Optional[Period]:
+    """Period for a match of :attr:`LanguagePatterns.multi_date`.
 
     Args:
-        low: Lowercase input text
-        mon_pat_base: Non-capturing month pattern regex
-        mon_pat_cap: Capturing month pattern regex
-        before_pat: Before pattern regex
-        after_pat: After pattern regex
-        season_pat: Season pattern regex
+        m: Match; its ``lastgroup`` names the kind of expression
         spec: Language specification
-        fuzzy: Fuzzy marker
 
     Returns:
-        List of (Period, (start, end)) tuples, or None if not multi-mode
+        Period (without fuzzy marker), or None for an unknown month
     """
-    # Check if multi-mode parsing is needed
-    de_date_pat = rf"(\d{{1,2}})\.\s*{mon_pat_base}\s+(\d{{3,4}})"
-
-    multi_mode = False
-    if re.search(de_date_pat, low):
-        multi_mode = True
-    if "(" in low or ")" in low or " - " in low:
-        multi_mode = True
-
-    if not multi_mode:
-        return None
-
-    emit_list: List[Tuple[Period, Tuple[int, int]]] = []
-    used_spans: List[Tuple[int, int]] = []
-
-    # German-style dates: "15. januar 1750"
-    for m in re.finditer(rf"(\d{{1,2}})\.\s*{mon_pat_cap}\s+(\d{{3,4}})", low):
-        d = int(m.group(1))
-        month_tok = m.group(2)
-        mm = spec.months.get(month_tok) if spec else MONTHS.get(month_tok)
+    months = spec.months if spec else MONTHS
+    seasons = spec.seasons if spec else None
+    kind = m.lastgroup
+    if kind == "de_date":
+        # German-style dates: "15. januar 1750"
+        mm = months.get(m.group("de_tok"))
         if mm is None:
-            continue
-        y = int(m.group(3))
+            return None
+        d = int(m.group("de_day"))
+        y = int(m.group("de_y"))
         p = Period(start=(y, mm, d), end=(y, mm, d))
-        p.fuzzy = fuzzy
-        emit_list.append((p, (m.start(), m.end())))
-        used_spans.append((m.start(), m.end()))
-
-    # Before + season
-    for m in re.finditer(
-        rf"({before_pat})\s+(?:dem\s+)?({season_pat})\s+(-?\d{{3,4}})", low
-    ):
-        season_tok = m.group(2)
-        season_name = spec.seasons.get(season_tok) if spec else season_tok
-        y = int(m.group(3))
-        start_m = (
-            3
-            if season_name == "spring"
-            else 6
-            if season_name == "summer"
-            else 9
-            if season_name == "autumn"
-            else 12
-        )
+    elif kind == "before_season":
+        season_tok = m.group("bs_tok")
+        season_name = seasons.get(season_tok) if seasons else season_tok
+        y = int(m.group("bs_y"))
+        start_m = _SEASON_START.get(season_name, 12)
         if start_m == 12:
             end_y, end_m, end_d = (y - 1, 11, 30)
         else:
             end_y, end_m, end_d = (y, start_m - 1, MONTH_DAYS[start_m - 1])
         p = Period(start=(y, 1, 1), end=(end_y, end_m, end_d))
         p.express = -1
-        p.fuzzy = fuzzy
-        emit_list.append((p, (m.start(), m.end())))
-        used_spans.append((m.start(), m.end()))
-
-    # After + season
-    for m in re.finditer(
-        rf"({after_pat})\s+(?:dem\s+)?({season_pat})\s+(-?\d{{3,4}})", low
-    ):
-        season_tok = m.group(2)
-        season_name = spec.seasons.get(season_tok) if spec else season_tok
-        y = int(m.group(3))
-        start_m = (
-            3
-            if season_name == "spring"
-            else 6
-            if season_name == "summer"
-            else 9
-            if season_name == "autumn"
-            else 12
-        )
-        end_m = start_m + 2
+    elif kind == "after_season":
+        season_tok = m.group("as_tok")
+        season_name = seasons.get(season_tok) if seasons else season_tok
+        y = int(m.group("as_y"))
+        end_m = _SEASON_START.get(season_name, 12) + 2
         if season_name == "winter":
             sy, sm, sd = (y + 1, 3, 1)
         elif end_m >= 12:
@@ -252,64 +228,96 @@ def parse_multi_dates(
             sy, sm, sd = (y, end_m + 1, 1)
         p = Period(start=(sy, sm, sd), end=(y, 12, 31))
         p.express = 1
-        p.fuzzy = fuzzy
-        emit_list.append((p, (m.start(), m.end())))
-        used_spans.append((m.start(), m.end()))
-
-    # Before + month
-    for m in re.finditer(rf"before\s+{mon_pat_cap}\s+(\d{{3,4}})", low):
-        tok = m.group(1)
-        mnum = spec.months.get(tok) if spec else MONTHS.get(tok)
+    elif kind == "before_month":
+        mnum = months.get(m.group("bm_tok"))
         if mnum is None:
-            continue
-        y = int(m.group(2))
+            return None
+        y = int(m.group("bm_y"))
         if mnum == 1:
             end_y, end_m, end_d = (y - 1, 12, 31)
         else:
             end_y, end_m, end_d = (y, mnum - 1, MONTH_DAYS[mnum - 1])
         p = Period(start=(y, 1, 1), end=(end_y, end_m, end_d))
         p.express = -1
-        p.fuzzy = fuzzy
-        emit_list.append((p, (m.start(), m.end())))
-        used_spans.append((m.start(), m.end()))
-
-    # After + month
-    for m in re.finditer(rf"after\s+{mon_pat_cap}\s+(\d{{3,4}})", low):
-        tok = m.group(1)
-        mnum = spec.months.get(tok) if spec else MONTHS.get(tok)
+    elif kind == "after_month":
+        mnum = months.get(m.group("am_tok"))
         if mnum is None:
-            continue
-        y = int(m.group(2))
+            return None
+        y = int(m.group("am_y"))
         sm = mnum + 1 if mnum < 12 else 12
         p = Period(start=(y, sm, 1), end=(y, 12, 31))
         p.express = 1
-        p.fuzzy = fuzzy
-        emit_list.append((p, (m.start(), m.end())))
-        used_spans.append((m.start(), m.end()))
-
-    # Before + year
-    for m in re.finditer(rf"({before_pat})\s+(-?\d{{3,4}})", low):
-        y = int(m.group(2))
+    elif kind == "before_year":
+        y = int(m.group("by_y"))
         p = Period(start=(y, 1, 1), end=(y - 1, 12, 31))
         p.express = -1
-        p.fuzzy = fuzzy
-        emit_list.append((p, (m.start(), m.end())))
-        used_spans.append((m.start(), m.end()))
-
-    # After + year
-    for m in re.finditer(rf"({after_pat})\s+(-?\d{{3,4}})", low):
-        y = int(m.group(2))
+    else:
+        y = int(m.group("ay_y"))
         p = Period(start=(y + 1, 1, 1), end=(y, 12, 31))
         p.express = 1
+    return p
+
+
+def parse_multi_dates(
+    low: str,
+    patterns: LanguagePatterns,
+    spec: Optional[LanguageSpec],
+    fuzzy: int,
+    scan: Optional[TextScan] = None,
+) -> Optional[List[Tuple[Period, Tuple[int, int]]]]:
+    """Parse multiple date expressions from complex input.
+
+    Used when input contains parentheses, dashes, or multiple dates.
+
+    Args:
+        low: Lowercase input text
+        patterns: Compiled patterns for the language
+        spec: Language specification
+        fuzzy: Fuzzy marker
+        scan: Pre-scan of ``low``, computed if not given
+
+    Returns:
+        List of (Period, (start, end)) tuples, or None if not multi-mode
+    """
+    if scan is None:
+        scan = scan_text(low, spec)
+    # Every multi-date form contains a year
+    if not scan.has_year:
+        return None
+    # Check if multi-mode parsing is needed
+    if not (
+        scan.has_parens
+        or scan.has_range_dash
+        or (scan.has_dot and patterns.de_date.search(low))
+    ):
+        return None
+
+    # One pass over all keyword and German date forms. Matches come out
+    # in text order and never overlap, so their spans are already sorted.
+    found: List[Tuple[int, Period, Tuple[int, int]]] = []
+    for m in patterns.multi_date.finditer(low):
+        p = multi_date_period(m, spec)
+        if p is None:
+            continue
         p.fuzzy = fuzzy
-        emit_list.append((p, (m.start(), m.end())))
-        used_spans.append((m.start(), m.end()))
-
-    # Plain years not covered by keywords
-    kw = rf"(?:{before_pat}|{after_pat})"
-    for m in re.finditer(rf"(?:(?P<kw>{kw})\s+)?(?P<year>-?\d{{3,4}})", low):
-        s, e = m.start(), m.end()
-        if any(not (e <= a or s >= b) for a, b in used_spans):
+        found.append((_MULTI_DATE_RANK[m.lastgroup], p, m.span()))
+
+    used_spans = [span for _, _, span in found]
+    # Emitted grouped by kind, in text order within each kind
+    found.sort(key=lambda f: (f[0], f[2][0]))
+    emit_list: List[Tuple[Period, Tuple[int, int]]] = [
+        (p, span) for _, p, span in found
+    ]
+
+    # Plain years not covered by keywords. Both these matches and the used
+    # spans are in text order, so one forward pointer finds the overlaps.
+    i = 0
+    n_used = len(used_spans)
+    for m in patterns.plain_year.finditer(low):
+        s, e = m.span()
+        while i < n_used and used_spans[i][1] <= s:
+            i += 1
+        if i < n_used and used_spans[i][0] < e:
             continue
         if m.group("kw"):
             continue
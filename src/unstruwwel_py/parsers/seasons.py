@@ -1,28 +1,27 @@
 """Season parsing logic."""
 
 from __future__ import annotations
-import re
 from typing import Optional
 
 from ..dates import Period, period_for_season
-from ..resources import LanguageSpec
+from ..resources import LanguagePatterns, LanguageSpec
 
 
 def parse_season(
-    low: str, sp_cap: str, spec: Optional[LanguageSpec], fuzzy: int
+    low: str, patterns: LanguagePatterns, spec: Optional[LanguageSpec], fuzzy: int
 ) -> Optional[Period]:
     """Try to parse season + year expression.
 
     Args:
         low: Lowercase input text
-        sp_cap: Capturing season pattern regex
+        patterns: Compiled patterns for the language
         spec: Language specification
         fuzzy: Fuzzy marker
 
     Returns:
         Period if matched, None otherwise
     """
-    m = re.fullmatch(rf"{sp_cap}\s+(\d{{3,4}})", low)
+    m = patterns.season_year.fullmatch(low)
     if m:
         season_tok = m.group(1)
         season = spec.seasons.get(season_tok) if spec else season_tok
@@ -1,33 +1,243 @@
 from __future__ import annotations
 
 import json
+import os
 import re
+import threading
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, Optional, Set
+from typing import Dict, FrozenSet, Optional, Pattern, Tuple
 
+from .keywords import KeywordScanner, build_scanner
 
-@dataclass
+# English fallbacks used when no language spec is available
+DEFAULT_MONTH_PATTERN = r"(?:january|february|march|april|may|june|july|august|september|october|november|december)"
+DEFAULT_SEASON_PATTERN = r"(?:spring|summer|autumn|winter)"
+DEFAULT_BEFORE_PATTERN = r"(?:before)"
+DEFAULT_AFTER_PATTERN = r"(?:after)"
+
+_NUMERIC_ORDINAL_RE = re.compile(r"(\d+)(?:\.|st|nd|rd|th)?$")
+
+# Engine compiling the language patterns: Python's backtracking ``re`` or
+# the linear-time RE2 (``google-re2`` package); see set_regex_engine()
+REGEX_ENGINES = ("re", "re2")
+_regex_engine = os.environ.get("UNSTRUWWEL_REGEX_ENGINE", "re").lower()
+if _regex_engine not in REGEX_ENGINES:
+    _regex_engine = "re"
+
+
+@dataclass(frozen=True)
+class LanguagePatterns:
+    """Compiled regular expressions used by the parsers for one language.
+
+    Built once per language (see :attr:`LanguageSpec.patterns`) so that no
+    parser has to assemble or compile a pattern per input string.
+    """
+
+    month: str  # non-capturing month alternation
+    season: str  # non-capturing season alternation
+    before: str  # non-capturing before-keyword alternation
+    after: str  # non-capturing after-keyword alternation
+    month_any: Pattern[str]  # (month)
+    season_any: Pattern[str]  # (season)
+    month_year: Pattern[str]  # (month) yyyy
+    day_month_year: Pattern[str]  # (month) d, yyyy
+    season_year: Pattern[str]  # (season) yyyy
+    de_date: Pattern[str]  # d. (month) yyyy
+    # German dates and before/after + season/month/year in one alternation;
+    # the outer group of each branch is named after its kind
+    multi_date: Pattern[str]
+    plain_year: Pattern[str]  # [keyword] year
+    century: Optional[Pattern[str]]  # ordinal century [bc]
+    century_fractions: Tuple[Tuple[Pattern[str], str, int], ...]
+    # First characters of month/season/before-after tokens, used to route
+    # strings to the parsers that can match them
+    month_initials: FrozenSet[str]
+    season_initials: FrozenSet[str]
+    keyword_initials: FrozenSet[str]
+
+
+def _compile(pattern: str, ignore_case: bool = False) -> Pattern[str]:
+    """Compile ``pattern`` with the selected regex engine."""
+    if _regex_engine == "re2":
+        import re2
+
+        options = re2.Options()
+        options.case_sensitive = not ignore_case
+        return re2.compile(pattern, options)
+    return re.compile(pattern, re.IGNORECASE if ignore_case else 0)
+
+
+def build_patterns(spec: Optional[LanguageSpec]) -> LanguagePatterns:
+    """Compile the parser patterns for ``spec`` (English fallbacks if None)."""
+    if spec:
+        mon = spec.month_pattern()
+        season = spec.season_pattern()
+        before = spec.before_pattern()
+        after = spec.after_pattern()
+        month_tokens = spec.months.keys()
+        season_tokens = spec.seasons.keys()
+        keyword_tokens = spec.before | spec.after
+    else:
+        mon = DEFAULT_MONTH_PATTERN
+        season = DEFAULT_SEASON_PATTERN
+        before = DEFAULT_BEFORE_PATTERN
+        after = DEFAULT_AFTER_PATTERN
+        month_tokens = DEFAULT_MONTH_PATTERN[3:-1].split("|")
+        season_tokens = DEFAULT_SEASON_PATTERN[3:-1].split("|")
+        keyword_tokens = ["before", "after"]
+    mon_cap = f"({mon})"
+    kw = rf"(?:{before}|{after})"
+
+    century = None
+    fractions = []
+    century_pat = spec.century_pattern() if spec else ""
+    if spec and century_pat:
+        bc_pat = spec.bc_pattern()
+        ordinal_pat = spec.ordinal_pattern()
+        for frac_pat, frac_type, max_part in (
+            (spec.half_pattern(), "half", 2),
+            (spec.third_pattern(), "third", 3),
+            (spec.quarter_pattern(), "quarter", 4),
+        ):
+            if not frac_pat:
+                continue
+            # Pattern: [approx] [ordinal] [fraction] [ordinal] [century] [bc]
+            pattern = rf"(?:ca\.?\s+)?({ordinal_pat})?\s*({frac_pat})\s+({ordinal_pat})\s*\.?\s*({century_pat})\.?\s*({bc_pat})?"
+            fractions.append((_compile(pattern, ignore_case=True), frac_type, max_part))
+        century = _compile(
+            rf"({ordinal_pat})\s*\.?\s*({century_pat})\.?\s*({bc_pat})?",
+            ignore_case=True,
+        )
+
+    return LanguagePatterns(
+        month=mon,
+        season=season,
+        before=before,
+        after=after,
+        month_any=_compile(mon_cap),
+        season_any=_compile(rf"({season})"),
+        month_year=_compile(rf"{mon_cap}\s+(\d{{3,4}})"),
+        day_month_year=_compile(rf"{mon_cap}\s+(\d{{1,2}}),\s*(\d{{3,4}})"),
+        season_year=_compile(rf"({season})\s+(\d{{3,4}})"),
+        de_date=_compile(rf"(\d{{1,2}})\.\s*{mon_cap}\s+(\d{{3,4}})"),
+        multi_date=_compile(
+            "|".join(
+                [
+                    rf"(?P<de_date>(?P<de_day>\d{{1,2}})\.\s*(?P<de_tok>{mon})\s+(?P<de_y>\d{{3,4}}))",
+                    rf"(?P<before_season>(?:{before})\s+(?:dem\s+)?(?P<bs_tok>{season})\s+(?P<bs_y>-?\d{{3,4}}))",
+                    rf"(?P<after_season>(?:{after})\s+(?:dem\s+)?(?P<as_tok>{season})\s+(?P<as_y>-?\d{{3,4}}))",
+                    rf"(?P<before_month>before\s+(?P<bm_tok>{mon})\s+(?P<bm_y>\d{{3,4}}))",
+                    rf"(?P<after_month>after\s+(?P<am_tok>{mon})\s+(?P<am_y>\d{{3,4}}))",
+                    rf"(?P<before_year>(?:{before})\s+(?P<by_y>-?\d{{3,4}}))",
+                    rf"(?P<after_year>(?:{after})\s+(?P<ay_y>-?\d{{3,4}}))",
+                ]
+            )
+        ),
+        plain_year=_compile(rf"(?:(?P<kw>{kw})\s+)?(?P<year>-?\d{{3,4}})"),
+        century=century,
+        century_fractions=tuple(fractions),
+        month_initials=frozenset(t[:1] for t in month_tokens if t),
+        season_initials=frozenset(t[:1] for t in season_tokens if t),
+        keyword_initials=frozenset(t[:1] for t in keyword_tokens if t),
+    )
+
+
+_DEFAULT_PATTERNS: Optional[LanguagePatterns] = None
+
+
+def default_patterns() -> LanguagePatterns:
+    """Pattern bundle used when parsing without a language spec."""
+    global _DEFAULT_PATTERNS
+    if _DEFAULT_PATTERNS is None:
+        _DEFAULT_PATTERNS = build_patterns(None)
+    return _DEFAULT_PATTERNS
+
+
+def set_regex_engine(engine: str) -> None:
+    """Select the engine for the language patterns: ``"re"`` or ``"re2"``.
+
+    ``"re2"`` needs the ``google-re2`` package. It matches in time linear
+    in the input length, so no input can trigger catastrophic backtracking.
+    Unlike ``re`` it treats only ASCII characters as digits (``\\d``) and
+    whitespace (``\\s``). The environment variable
+    ``UNSTRUWWEL_REGEX_ENGINE`` sets the initial engine. Patterns compiled
+    so far are dropped and rebuilt lazily, and the parse cache is cleared.
+    """
+    global _regex_engine, _DEFAULT_PATTERNS
+    engine = engine.lower()
+    if engine not in REGEX_ENGINES:
+        raise ValueError(f"regex engine must be one of {', '.join(REGEX_ENGINES)}")
+    if engine == "re2":
+        try:
+            import re2  # noqa: F401
+        except ImportError as e:
+            raise ImportError(
+                "the re2 engine requires google-re2 (pip install google-re2)"
+            ) from e
+    _regex_engine = engine
+    _DEFAULT_PATTERNS = None
+    with _SPEC_LOCK:
+        specs = list(_SPEC_CACHE.values())
+    for spec in specs:
+        # Drop the cached_property value of the frozen instance
+        spec.__dict__.pop("patterns", None)
+    from .cache import PARSE_CACHE
+
+    PARSE_CACHE.clear()
+
+
+def get_regex_engine() -> str:
+    """Name of the engine compiling the language patterns."""
+    return _regex_engine
+
+
+@dataclass(frozen=True)
 class LanguageSpec:
+    """Immutable token tables for one language.
+
+    Instances are shared process-wide through :func:`get_language_spec`,
+    so they must never be mutated.
+    """
+
     name: str
     months: Dict[str, int]  # token -> month number
     seasons: Dict[str, str]  # token -> canonical season (spring/summer/autumn/winter)
-    before: Set[str]
-    after: Set[str]
-    uncertain: Set[str]
-    approximate: Set[str]
-    decade_suffixes: Set[str]
-    bc_markers: Set[str]
-    and_tokens: Set[str]
-    century_tokens: Set[str]  # e.g., {"century", "cent", "jh", "jahrhundert"}
-    half_tokens: Set[str]  # e.g., {"half", "hälfte"}
-    third_tokens: Set[str]  # e.g., {"third", "drittel"}
-    quarter_tokens: Set[str]  # e.g., {"quarter", "viertel"}
-    last_tokens: Set[str]  # e.g., {"last", "letztes"}
+    before: FrozenSet[str]
+    after: FrozenSet[str]
+    uncertain: FrozenSet[str]
+    approximate: FrozenSet[str]
+    decade_suffixes: FrozenSet[str]
+    bc_markers: FrozenSet[str]
+    and_tokens: FrozenSet[str]
+    century_tokens: FrozenSet[str]  # e.g., {"century", "cent", "jh", "jahrhundert"}
+    half_tokens: FrozenSet[str]  # e.g., {"half", "hälfte"}
+    third_tokens: FrozenSet[str]  # e.g., {"third", "drittel"}
+    quarter_tokens: FrozenSet[str]  # e.g., {"quarter", "viertel"}
+    last_tokens: FrozenSet[str]  # e.g., {"last", "letztes"}
     ordinals: Dict[str, int]  # e.g., {"first": 1, "erste": 1, ...}
-    early_tokens: Set[str]  # e.g., {"early", "anfang"}
-    mid_tokens: Set[str]  # e.g., {"mid", "mitte"}
-    late_tokens: Set[str]  # e.g., {"late", "ende"}
+    early_tokens: FrozenSet[str]  # e.g., {"early", "anfang"}
+    mid_tokens: FrozenSet[str]  # e.g., {"mid", "mitte"}
+    late_tokens: FrozenSet[str]  # e.g., {"late", "ende"}
+    tokens: FrozenSet[str] = frozenset()  # every token in the JSON, for guessing
+
+    @cached_property
+    def patterns(self) -> LanguagePatterns:
+        """Compiled parser patterns, built lazily on first access."""
+        return build_patterns(self)
+
+    @cached_property
+    def keywords(self) -> KeywordScanner:
+        """Keyword automaton (fuzzy, before/after, last), built lazily."""
+        return build_scanner(self)
+
+    @cached_property
+    def extraction(self) -> Pattern[str]:
+        """Combined free-text extraction pattern, built lazily."""
+        from .extract import build_extraction_pattern
+
+        return build_extraction_pattern(self)
 
     def month_pattern(self) -> str:
         if not self.months:
@@ -121,7 +331,7 @@ class LanguageSpec:
         if tok in self.ordinals:
             return self.ordinals[tok]
         # Try numeric forms: "1.", "2nd", etc.
-        m = re.match(r"(\d+)(?:\.|st|nd|rd|th)?$", tok)
+        m = _NUMERIC_ORDINAL_RE.match(tok)
         if m:
             return int(m.group(1))
         return None
@@ -132,14 +342,18 @@ def _base_dir() -> Path:
     return Path(__file__).resolve().parents[2]
 
 
-def _load_json(name: str) -> Optional[dict]:
-    path = _base_dir() / "data-raw" / f"{name}.json"
+def _read_json(path: Path) -> Optional[dict]:
     if not path.exists():
         return None
     with path.open("r", encoding="utf-8") as f:
         return json.load(f)
 
 
+def _load_json(name: str) -> Optional[dict]:
+    # Only available in source checkouts; wheels ship the snapshot instead
+    return _read_json(_base_dir() / "data-raw" / f"{name}.json")
+
+
 def _build_spec_from_json(obj: dict) -> LanguageSpec:
     months: Dict[str, int] = {}
     month_order = [
@@ -163,23 +377,23 @@ def _build_spec_from_json(obj: dict) -> LanguageSpec:
     for sname in ["winter", "spring", "summer", "autumn"]:
         for tok in obj.get(sname, []):
             seasons[tok.lower()] = sname
-    before = set(t.lower() for t in obj.get("before", []))
-    after = set(t.lower() for t in obj.get("after", []))
-    uncertain = set(t.lower() for t in obj.get("uncertain", []))
-    approximate = set(t.lower() for t in obj.get("approximate", [])) or set(
+    before = frozenset(t.lower() for t in obj.get("before", []))
+    after = frozenset(t.lower() for t in obj.get("after", []))
+    uncertain = frozenset(t.lower() for t in obj.get("uncertain", []))
+    approximate = frozenset(t.lower() for t in obj.get("approximate", [])) or frozenset(
         obj.get("circa", [])
     )
-    decade_suffixes = set(t.lower() for t in obj.get("s", []))
-    bc_markers = set(t.lower() for t in obj.get("bc", []))
-    and_tokens = set(t.lower() for t in obj.get("and", []))
-    century_tokens = set(t.lower() for t in obj.get("century", []))
-    half_tokens = set(t.lower() for t in obj.get("half", []))
-    third_tokens = set(t.lower() for t in obj.get("third", []))
-    quarter_tokens = set(t.lower() for t in obj.get("quarter", []))
-    last_tokens = set(t.lower() for t in obj.get("last", []))
-    early_tokens = set(t.lower() for t in obj.get("early", []))
-    mid_tokens = set(t.lower() for t in obj.get("mid", []))
-    late_tokens = set(t.lower() for t in obj.get("late", []))
+    decade_suffixes = frozenset(t.lower() for t in obj.get("s", []))
+    bc_markers = frozenset(t.lower() for t in obj.get("bc", []))
+    and_tokens = frozenset(t.lower() for t in obj.get("and", []))
+    century_tokens = frozenset(t.lower() for t in obj.get("century", []))
+    half_tokens = frozenset(t.lower() for t in obj.get("half", []))
+    third_tokens = frozenset(t.lower() for t in obj.get("third", []))
+    quarter_tokens = frozenset(t.lower() for t in obj.get("quarter", []))
+    last_tokens = frozenset(t.lower() for t in obj.get("last", []))
+    early_tokens = frozenset(t.lower() for t in obj.get("early", []))
+    mid_tokens = frozenset(t.lower() for t in obj.get("mid", []))
+    late_tokens = frozenset(t.lower() for t in obj.get("late", []))
     # Build ordinals from simplifications
     ordinals: Dict[str, int] = {}
     for word, num in obj.get("simplifications", {}).items():
@@ -187,6 +401,13 @@ def _build_spec_from_json(obj: dict) -> LanguageSpec:
             ordinals[word.lower()] = int(num)
         except (ValueError, TypeError):
             pass
+    tokens = frozenset(
+        s.lower()
+        for v in obj.values()
+        if isinstance(v, list)
+        for s in v
+        if isinstance(s, str)
+    )
     return LanguageSpec(
         name=obj.get("name", ""),
         months=months,
@@ -207,14 +428,82 @@ def _build_spec_from_json(obj: dict) -> LanguageSpec:
         early_tokens=early_tokens,
         mid_tokens=mid_tokens,
         late_tokens=late_tokens,
+        tokens=tokens,
     )
 
 
+SUPPORTED_LANGUAGES = frozenset({"de", "fr", "en"})
+
+# Process-wide registry: each language is loaded at most once until it is
+# explicitly invalidated.
+_SPEC_CACHE: Dict[str, LanguageSpec] = {}
+_SPEC_LOCK = threading.Lock()
+_SNAPSHOT: Optional[Dict[str, LanguageSpec]] = None
+
+
+def _snapshot_spec(lang: str) -> Optional[LanguageSpec]:
+    global _SNAPSHOT
+    if _SNAPSHOT is None:
+        from .snapshot import load_snapshot
+
+        _SNAPSHOT = load_snapshot() or {}
+    return _SNAPSHOT.get(lang)
+
+
 def get_language_spec(lang: str) -> Optional[LanguageSpec]:
+    """Return the cached :class:`LanguageSpec` for ``lang``.
+
+    Specs come from the packaged snapshot (see :mod:`unstruwwel_py.snapshot`)
+    when it covers ``lang``, else from ``data-raw/<lang>.json``; either is
+    loaded on first use only, and later calls return the same immutable
+    instance. Use :func:`reload_language_spec` after editing the JSON files.
+    """
+    lang = lang.lower()
+    spec = _SPEC_CACHE.get(lang)
+    if spec is not None:
+        return spec
+    if not lang.isalpha():
+        return None
+    with _SPEC_LOCK:
+        spec = _SPEC_CACHE.get(lang)
+        if spec is None:
+            spec = _snapshot_spec(lang)
+            if spec is None:
+                obj = _load_json(lang)
+                if obj is None:
+                    return None
+                spec = _build_spec_from_json(obj)
+            _SPEC_CACHE[lang] = spec
+    return spec
+
+
+def clear_spec_cache(lang: Optional[str] = None) -> None:
+    """Drop cached specs (all languages, or only ``lang``)."""
+    from .lang import clear_guess_cache
+
+    with _SPEC_LOCK:
+        if lang is None:
+            _SPEC_CACHE.clear()
+        else:
+            _SPEC_CACHE.pop(lang.lower(), None)
+    # Cached language guesses and parse results came from the old specs
+    clear_guess_cache()
+    from .cache import PARSE_CACHE
+
+    PARSE_CACHE.clear()
+
+
+def reload_language_spec(lang: str) -> Optional[LanguageSpec]:
+    """Re-read ``data-raw/<lang>.json``, bypassing the snapshot, and cache it.
+
+    Falls back to the snapshot when the JSON file is not available.
+    """
+    clear_spec_cache(lang)
     lang = lang.lower()
-    if lang in {"de", "fr", "en"}:
-        obj = _load_json(lang)
-        if obj is None:
-            return None
-        return _build_spec_from_json(obj)
-    return None
+    obj = _load_json(lang) if lang.isalpha() else None
+    if obj is None:
+        return get_language_spec(lang)
+    spec = _build_spec_from_json(obj)
+    with _SPEC_LOCK:
+        _SPEC_CACHE[lang] = spec
+    return spec
@@ -0,0 +1,108 @@
+"""Per-string lexical pre-scan shared by the parsers.
+
+The parsers used to re-derive the same facts from every string (year-like
+digit runs, keyword positions, separators). :class:`TextScan` collects them
+once per parsed string and is handed to each parser in turn.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import List, Optional, Tuple
+
+from .keywords import KeywordHits, default_scanner
+from .resources import LanguageSpec
+
+# \d, like the parser patterns: any Unicode decimal digit
+_DIGITS_RE = re.compile(r"\d+")
+_YEAR_HINT_RE = re.compile(r"\d{3}")
+_ALPHA_RE = re.compile(r"[^\W\d_]")
+
+
+class TextScan:
+    """Lexical facts about one lowercased input string.
+
+    Attributes:
+        low: The lowercased, stripped text
+        hits: Keyword classes found, mapped to their leftmost offset
+        has_year: Whether any run of three or more digits (a possible
+            year) exists
+
+    Digit runs and year tokens are derived on first use and then kept.
+    """
+
+    __slots__ = ("low", "hits", "has_year", "_runs", "_years")
+
+    def __init__(self, low: str, hits: KeywordHits) -> None:
+        self.low = low
+        self.hits = hits
+        self.has_year = _YEAR_HINT_RE.search(low) is not None
+        self._runs: Optional[Tuple[Tuple[int, int], ...]] = None
+        self._years: Optional[List[str]] = None
+
+    @property
+    def digit_runs(self) -> Tuple[Tuple[int, int], ...]:
+        """``(start, end)`` of every maximal run of digits."""
+        if self._runs is None:
+            self._runs = tuple(m.span() for m in _DIGITS_RE.finditer(self.low))
+        return self._runs
+
+    @property
+    def has_alpha(self) -> bool:
+        return _ALPHA_RE.search(self.low) is not None
+
+    @property
+    def has_parens(self) -> bool:
+        return "(" in self.low or ")" in self.low
+
+    @property
+    def has_range_dash(self) -> bool:
+        return " - " in self.low
+
+    @property
+    def has_dot(self) -> bool:
+        return "." in self.low
+
+    def years(self) -> List[str]:
+        """Year tokens, exactly as ``re.findall(r"-?\\d{3,4}", low)``.
+
+        Runs longer than four digits are split into leading groups of four
+        (plus a final group of three); a ``-`` directly before a run signs
+        its first group.
+        """
+        if self._years is None:
+            low = self.low
+            years: List[str] = []
+            if not self.has_year:
+                self._years = years
+                return years
+            for s, e in self.digit_runs:
+                pos = s
+                while e - pos >= 3:
+                    size = 4 if e - pos >= 4 else 3
+                    if pos == s and s and low[s - 1] == "-":
+                        years.append(low[s - 1 : pos + size])
+                    else:
+                        years.append(low[pos : pos + size])
+                    pos += size
+            self._years = years
+        return self._years
+
+    def fullmatch_year(self) -> Optional[str]:
+        """The text if it is a single ``-?\\d{3,4}`` token, else None."""
+        runs = self.digit_runs
+        if len(runs) != 1:
+            return None
+        s, e = runs[0]
+        low = self.low
+        if e != len(low) or not 3 <= e - s <= 4:
+            return None
+        if s == 0 or (s == 1 and low[0] == "-"):
+            return low
+        return None
+
+
+def scan_text(low: str, spec: Optional[LanguageSpec]) -> TextScan:
+    """Pre-scan ``low`` with the keyword automaton of ``spec``."""
+    scanner = spec.keywords if spec else default_scanner()
+    return TextScan(low, scanner.scan(low))
@@ -0,0 +1,80 @@
+"""Packaged, precompiled snapshot of the language resources.
+
+The JSON files in ``data-raw/`` are the source of truth, but they are not
+part of installed wheels and would have to be parsed on every start-up.
+This module compiles them into one pickle of ready-made
+:class:`~unstruwwel_py.resources.LanguageSpec` instances, shipped as
+``unstruwwel_py/data/languages.pickle``. Regenerate it after editing the
+JSON files::
+
+    python -m unstruwwel_py.snapshot
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import pickle
+import sys
+from importlib import resources as importlib_resources
+from pathlib import Path
+from typing import Dict, Optional
+
+# Bump when the snapshot layout changes; older snapshots are then ignored
+SNAPSHOT_FORMAT = 1
+SNAPSHOT_FILE = "languages.pickle"
+SNAPSHOT_LANGUAGES = ("en", "de", "fr", "nl")
+
+
+def _spec_fields() -> tuple:
+    from .resources import LanguageSpec
+
+    return tuple(f.name for f in dataclasses.fields(LanguageSpec))
+
+
+def build_snapshot(source_dir: Path, target: Path) -> Dict[str, object]:
+    """Compile ``<source_dir>/<lang>.json`` for every snapshot language."""
+    from .resources import _build_spec_from_json, _read_json
+
+    specs = {}
+    for lang in SNAPSHOT_LANGUAGES:
+        obj = _read_json(source_dir / f"{lang}.json")
+        if obj is not None:
+            specs[lang] = _build_spec_from_json(obj)
+    payload = {"format": SNAPSHOT_FORMAT, "fields": _spec_fields(), "specs": specs}
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_bytes(pickle.dumps(payload, protocol=4))
+    return specs
+
+
+def load_snapshot() -> Optional[Dict[str, object]]:
+    """Specs from the packaged snapshot, or None if missing or outdated."""
+    try:
+        data = (
+            importlib_resources.files("unstruwwel_py")
+            .joinpath("data")
+            .joinpath(SNAPSHOT_FILE)
+            .read_bytes()
+        )
+        payload = pickle.loads(data)
+    except (OSError, pickle.UnpicklingError, AttributeError, EOFError):
+        return None
+    if (
+        not isinstance(payload, dict)
+        or payload.get("format") != SNAPSHOT_FORMAT
+        or payload.get("fields") != _spec_fields()
+    ):
+        return None
+    return payload["specs"]
+
+
+def main() -> int:
+    from .resources import _base_dir
+
+    target = Path(__file__).resolve().parent / "data" / SNAPSHOT_FILE
+    specs = build_snapshot(_base_dir() / "data-raw", target)
+    print(f"wrote {target} ({', '.join(specs)})", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,204 @@
+"""Opt-in instrumentation of the parsing hot path.
+
+Disabled by default, and then costs nothing: :func:`enable` swaps timed
+wrappers into :mod:`unstruwwel_py.core` and :func:`disable` puts the
+original functions back. Typical use::
+
+    from unstruwwel_py import stats, unstruwwel
+
+    with stats.collect() as s:
+        unstruwwel(texts, "de")
+    print(s.report())
+
+Counters are per process (worker processes of ``workers=`` keep their
+own) and are not synchronised between threads.
+"""
+
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from . import core
+from .cache import PARSE_CACHE
+from .dates import DATACLASS_SLOTS
+
+
+@dataclass(**DATACLASS_SLOTS)
+class ParserStats:
+    """Calls, matches and cumulative time of one parser."""
+
+    attempts: int = 0
+    hits: int = 0
+    ns: int = 0
+
+
+@dataclass
+class ParseStats:
+    """Counters collected while instrumentation is enabled.
+
+    ``parsers`` has an entry for the numeric fast path (``"numeric"``),
+    :func:`~unstruwwel_py.parsers.intervals.parse_multi_dates`
+    (``"multi_dates"``) and each routed parser, keyed by name.
+    ``fallbacks`` counts parsed inputs that ended as NA, ``guesses`` the
+    per-row language guesses. Both only see inputs actually parsed, not
+    parse cache hits; the cache counters are the parse cache's hits and
+    misses since :func:`enable`.
+    """
+
+    parsers: Dict[str, ParserStats] = field(default_factory=dict)
+    fallbacks: int = 0
+    guesses: int = 0
+    guess_ns: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+
+    def reset(self) -> None:
+        # Zero in place: the installed wrappers hold the ParserStats entries
+        for s in self.parsers.values():
+            s.attempts = s.hits = s.ns = 0
+        self.fallbacks = self.guesses = self.guess_ns = 0
+        self.cache_hits = self.cache_misses = 0
+        if self is _STATS:
+            global _CACHE_BASE
+            _CACHE_BASE = (PARSE_CACHE.hits, PARSE_CACHE.misses)
+
+    def as_dict(self) -> Dict[str, Any]:
+        _sync_cache()
+        return {
+            "parsers": {
+                name: {"attempts": s.attempts, "hits": s.hits, "ns": s.ns}
+                for name, s in self.parsers.items()
+            },
+            "fallbacks": self.fallbacks,
+            "guesses": self.guesses,
+            "guess_ns": self.guess_ns,
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+        }
+
+    def report(self) -> str:
+        """Table of the parsers by cumulative time, plus the other counters."""
+        _sync_cache()
+        lines = [
+            f"{'parser':<16}{'attempts':>10}{'hits':>10}{'hit %':>8}"
+            f"{'total ms':>10}{'ns/call':>9}"
+        ]
+        ranked = sorted(self.parsers.items(), key=lambda kv: kv[1].ns, reverse=True)
+        for name, s in ranked:
+            rate = s.hits / s.attempts if s.attempts else 0.0
+            per_call = s.ns // s.attempts if s.attempts else 0
+            lines.append(
+                f"{name:<16}{s.attempts:>10}{s.hits:>10}{rate:>8.1%}"
+                f"{s.ns / 1e6:>10.2f}{per_call:>9}"
+            )
+        lines.append(
+            f"fallbacks {self.fallbacks}, language guesses {self.guesses} "
+            f"({self.guess_ns / 1e6:.2f} ms), cache hits {self.cache_hits}, "
+            f"misses {self.cache_misses}"
+        )
+        return "\n".join(lines)
+
+
+_STATS: Optional[ParseStats] = None
+_ORIGINALS: Dict[str, Any] = {}
+_CACHE_BASE = (0, 0)
+
+
+def _sync_cache() -> None:
+    if _STATS is not None:
+        _STATS.cache_hits = PARSE_CACHE.hits - _CACHE_BASE[0]
+        _STATS.cache_misses = PARSE_CACHE.misses - _CACHE_BASE[1]
+
+
+def _timed(entry: ParserStats, fn: Callable[..., Any]) -> Callable[..., Any]:
+    clock = time.perf_counter_ns
+
+    def wrapper(*args: Any) -> Any:
+        t0 = clock()
+        result = fn(*args)
+        entry.ns += clock() - t0
+        entry.attempts += 1
+        if result is not None:
+            entry.hits += 1
+        return result
+
+    return wrapper
+
+
+def enable() -> ParseStats:
+    """Start collecting into a fresh :class:`ParseStats` and return it."""
+    global _STATS, _CACHE_BASE
+    if _STATS is not None:
+        disable()
+    stats = ParseStats()
+
+    _ORIGINALS["parsers"] = dict(core._PARSERS)
+    for name in ("parse_numeric", "parse_multi_dates", "_na", "guess_language"):
+        _ORIGINALS[name] = getattr(core, name)
+
+    core.parse_numeric = _timed(
+        stats.parsers.setdefault("numeric", ParserStats()),
+        _ORIGINALS["parse_numeric"],
+    )
+    core.parse_multi_dates = _timed(
+        stats.parsers.setdefault("multi_dates", ParserStats()),
+        _ORIGINALS["parse_multi_dates"],
+    )
+    for name, fn in _ORIGINALS["parsers"].items():
+        core._PARSERS[name] = _timed(stats.parsers.setdefault(name, ParserStats()), fn)
+
+    na = _ORIGINALS["_na"]
+    guess = _ORIGINALS["guess_language"]
+
+    def counting_na(*args: Any, **kwargs: Any) -> Any:
+        stats.fallbacks += 1
+        return na(*args, **kwargs)
+
+    def timed_guess(*args: Any, **kwargs: Any) -> Any:
+        t0 = time.perf_counter_ns()
+        try:
+            return guess(*args, **kwargs)
+        finally:
+            stats.guess_ns += time.perf_counter_ns() - t0
+            stats.guesses += 1
+
+    core._na = counting_na
+    core.guess_language = timed_guess
+
+    _CACHE_BASE = (PARSE_CACHE.hits, PARSE_CACHE.misses)
+    _STATS = stats
+    return stats
+
+
+def disable() -> Optional[ParseStats]:
+    """Restore the uninstrumented functions; returns the final statistics."""
+    global _STATS
+    stats = _STATS
+    if stats is None:
+        return None
+    _sync_cache()
+    core._PARSERS.update(_ORIGINALS.pop("parsers"))
+    for name, fn in _ORIGINALS.items():
+        setattr(core, name, fn)
+    _ORIGINALS.clear()
+    _STATS = None
+    return stats
+
+
+def get_stats() -> Optional[ParseStats]:
+    """The statistics being collected, or None when disabled."""
+    _sync_cache()
+    return _STATS
+
+
+@contextmanager
+def collect() -> Iterator[ParseStats]:
+    """Enable instrumentation for the duration of a ``with`` block."""
+    stats = enable()
+    try:
+        yield stats
+    finally:
+        disable()
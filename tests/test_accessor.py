@@ -0,0 +1,63 @@
+import math
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from unstruwwel_py import unstruwwel  # noqa: E402
+from unstruwwel_py.accessor import parse_arrow, parse_series  # noqa: E402
+
+DATES = [
+    "1856",
+    "before April 1755",
+    None,
+    "1897 (before 1906)",
+    "1856",
+    "unknown",
+    "last third 17th cent",
+]
+
+
+def test_series_accessor_matches_unstruwwel():
+    s = pd.Series(DATES, index=list("abcdefg"))
+    df = s.unstruwwel.parse(language="en")
+    assert list(df.columns) == ["start", "end", "iso", "fuzzy", "express"]
+    assert list(df.index) == list(s.index)
+    objects = unstruwwel(DATES, "en", scheme="object")
+    # "1897 (before 1906)" keeps its first date
+    expected = objects[:4] + objects[5:]
+    for (_, row), obj in zip(df.iterrows(), expected):
+        start, end = obj.time_span
+        if start is None:
+            assert math.isnan(row.start) and math.isnan(row.end)
+            assert pd.isna(row.iso)
+        else:
+            assert (row.start, row.end, row.iso) == (start, end, obj.iso_format)
+        assert row.fuzzy == obj.fuzzy
+
+
+def test_series_explode_repeats_index():
+    s = pd.Series(["1897 (before 1906)", "1800"], index=[10, 20])
+    df = parse_series(s, "en", explode=True)
+    assert list(df.index) == [10, 10, 20]
+    assert df.start.tolist() == [-math.inf, 1897, 1800]
+    assert df.express.tolist() == [-1, 0, 0]
+
+
+def test_series_guesses_language_once():
+    df = pd.Series(["19. Jh.", "vor 1900", "1760er Jahre"]).unstruwwel.parse()
+    assert df.iso.tolist() == unstruwwel(
+        ["19. Jh.", "vor 1900", "1760er Jahre"], "de", scheme="iso-format"
+    )
+
+
+def test_arrow_struct_array():
+    pa = pytest.importorskip("pyarrow")
+    arr = pa.chunked_array([["19. Jh.", None], ["vor 1900", "19. Jh."]])
+    out = parse_arrow(arr, "de")
+    assert out.type.names == ["start", "end", "iso", "fuzzy", "express"]
+    assert out.field("start").to_pylist() == [1801, None, -math.inf, 1801]
+    assert out.field("iso").to_pylist()[:2] == ["1801-01-01/1900-12-31", None]
+
+    exploded = parse_arrow(pa.array(["1897 (before 1906)", "1800"]), "en", explode=True)
+    assert exploded.field("row").to_pylist() == [0, 0, 1]
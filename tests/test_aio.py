@@ -0,0 +1,91 @@
+import asyncio
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from unstruwwel_py import set_input_limits, unstruwwel
+from unstruwwel_py.aio import aunstruwwel
+from unstruwwel_py.lang import set_lingua_enabled
+from unstruwwel_py.parallel import process_pool
+
+DATES = ["1856", "(Guss vor 1906) 1897", None, "19. Jh.", "undatiert"]
+
+
+@pytest.mark.parametrize("scheme", ["time-span", "iso-format", "object"])
+def test_aunstruwwel_matches_unstruwwel(scheme):
+    result = asyncio.run(aunstruwwel(DATES * 3, "de", scheme=scheme, chunksize=2))
+    assert result == unstruwwel(DATES * 3, "de", scheme=scheme)
+    assert asyncio.run(aunstruwwel("1856")) == [(1856, 1856)]
+
+
+def test_aunstruwwel_validates_arguments():
+    with pytest.raises(ValueError):
+        asyncio.run(aunstruwwel(DATES, scheme="object"))
+    with pytest.raises(ValueError):
+        asyncio.run(aunstruwwel(DATES, "de", chunksize=0))
+    with pytest.raises(ValueError, match="invalid scheme"):
+        asyncio.run(aunstruwwel(DATES, None, scheme="arrays"))
+
+
+def test_aunstruwwel_yields_and_cancels():
+    class CountingExecutor(ThreadPoolExecutor):
+        submitted = 0
+
+        def submit(self, *args, **kwargs):
+            CountingExecutor.submitted += 1
+            return super().submit(*args, **kwargs)
+
+    async def main():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        with CountingExecutor(1) as executor:
+            tick_task = asyncio.create_task(ticker())
+            task = asyncio.create_task(
+                aunstruwwel(DATES * 2000, "de", chunksize=10, executor=executor)
+            )
+            while CountingExecutor.submitted < 3:
+                await asyncio.sleep(0)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            tick_task.cancel()
+        return ticks
+
+    assert asyncio.run(main()) > 0
+    assert CountingExecutor.submitted < 1000
+
+
+def test_process_pool_workers_get_input_limits():
+    set_input_limits(max_length=12)
+    try:
+        # Spawned workers start from a fresh interpreter
+        spawn = multiprocessing.get_context("spawn")
+        with process_pool(1, "de", mp_context=spawn) as executor:
+            result = asyncio.run(
+                aunstruwwel(["März 1755", "19. Jahrhundert"], "de", executor=executor)
+            )
+    finally:
+        set_input_limits()
+    assert result == [(1755, 1755), (None, None)]
+
+
+def test_process_pool_workers_get_lingua_mode():
+    pytest.importorskip("lingua")
+    set_lingua_enabled(False)
+    try:
+        spawn = multiprocessing.get_context("spawn")
+        with process_pool(1, mp_context=spawn) as executor:
+            result = asyncio.run(
+                aunstruwwel(["été 1750"], scheme="iso-format", executor=executor)
+            )
+        assert result == unstruwwel(["été 1750"], scheme="iso-format")
+    finally:
+        set_lingua_enabled(True)
+    assert result == [(None, None)]
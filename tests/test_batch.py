@@ -0,0 +1,84 @@
+import pytest
+
+from unstruwwel_py import (
+    Parser,
+    extract_dates,
+    iter_unstruwwel,
+    unstruwwel,
+    unstruwwel_batch,
+)
+
+DATES_EN = [
+    "1752/60",
+    "before April 1755",
+    "Winter 1620",
+    "last third 17th cent",
+    "unknown",
+    None,
+    "1897 (before 1906)",
+]
+
+
+@pytest.mark.parametrize("scheme", ["time-span", "iso-format", "object"])
+def test_batch_matches_unstruwwel(scheme):
+    assert unstruwwel_batch(DATES_EN, "en", scheme=scheme) == unstruwwel(
+        DATES_EN, "en", scheme=scheme
+    )
+
+
+def test_batch_guesses_language_once():
+    dates = ["19. Jh.", "vor dem Sommer 1907", "1760er Jahre", "1856"]
+    assert unstruwwel_batch(dates) == unstruwwel(dates, "de")
+
+
+def test_batch_numeric_column_falls_back_to_english():
+    assert unstruwwel_batch(["1856", "1752/60"]) == [(1856, 1856), (1752, 1760)]
+
+
+def test_parser_reuse():
+    parser = Parser("de", scheme="iso-format")
+    assert parser.parse("19. Jh.") == "1801-01-01/1900-12-31"
+    assert parser.parse_many(["(Guss vor 1906) 1897"]) == [
+        "..1905-12-31",
+        "1897-01-01/1897-12-31",
+    ]
+
+
+def test_parser_invalid_language():
+    with pytest.raises(ValueError):
+        Parser("bo")
+    with pytest.raises(ValueError):
+        unstruwwel_batch(["1856"], scheme="object")
+
+
+@pytest.mark.parametrize("scheme", ["time-span", "iso-format", "object"])
+def test_dedupe_preserves_order_and_multi_results(scheme):
+    dates = DATES_EN * 3 + ["1752/60", None]
+    assert unstruwwel(dates, "en", scheme=scheme, dedupe=True) == unstruwwel(
+        dates, "en", scheme=scheme
+    )
+    assert unstruwwel_batch(dates, "en", scheme=scheme, dedupe=True) == unstruwwel(
+        dates, "en", scheme=scheme
+    )
+
+
+def test_dedupe_expands_to_distinct_objects():
+    a, b = unstruwwel(["1856", "1856"], "en", scheme="object", dedupe=True)
+    assert a == b
+    assert a is not b
+
+
+@pytest.mark.parametrize("scheme", ["arrays", "period", "timespan"])
+@pytest.mark.parametrize("language", ["en", None])
+def test_unsupported_schemes_are_rejected(scheme, language):
+    with pytest.raises(ValueError, match="invalid scheme"):
+        unstruwwel_batch(["vor 1750"], language, scheme)
+    with pytest.raises(ValueError, match="invalid scheme"):
+        iter_unstruwwel(["vor 1750"], language, scheme)
+    with pytest.raises(ValueError, match="invalid scheme"):
+        extract_dates("vor 1750", language, scheme)
+    with pytest.raises(ValueError, match="invalid scheme"):
+        Parser("en", scheme)
+    if scheme != "arrays":
+        with pytest.raises(ValueError, match="invalid scheme"):
+            unstruwwel(["vor 1750"], language, scheme)
@@ -0,0 +1,85 @@
+import pytest
+
+from unstruwwel_py import (
+    Parser,
+    cache_clear,
+    cache_info,
+    set_cache_size,
+    unstruwwel,
+)
+from unstruwwel_py.cache import DEFAULT_CACHE_SIZE, LRUCache, MISSING
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    cache_clear()
+    yield
+    set_cache_size(DEFAULT_CACHE_SIZE)
+    cache_clear()
+
+
+def test_repeated_values_hit_cache():
+    out = unstruwwel(["19. Jh.", " 19. Jh.", "undatiert", "19. Jh."], "de")
+    assert out == [(1801, 1900), (1801, 1900), (None, None), (1801, 1900)]
+    info = cache_info()
+    assert info.misses == 2
+    assert info.hits == 2
+    assert info.currsize == 2
+
+
+def test_cache_key_includes_language_and_scheme():
+    unstruwwel("Mai 1856", "de")
+    unstruwwel("Mai 1856", "en")
+    unstruwwel("Mai 1856", "en", scheme="iso-format")
+    assert cache_info().misses == 3
+
+
+def test_cached_objects_are_not_shared():
+    a = unstruwwel(["ca. 1920", "ca. 1920"], "en", scheme="object")
+    assert a[0] == a[1]
+    assert a[0] is not a[1]
+    a[0].fuzzy = 1
+    assert unstruwwel("ca. 1920", "en", scheme="object")[0].fuzzy == -1
+
+
+def test_cached_multi_date_lists_are_not_shared():
+    expected = unstruwwel("1897 (before 1906)", "en")
+    Parser("en").parse("1897 (before 1906)").append("JUNK")
+    Parser("de", "iso-format").parse("(Guss vor 1906) 1897").clear()
+    assert unstruwwel("1897 (before 1906)", "en") == expected
+    assert len(unstruwwel("(Guss vor 1906) 1897", "de", scheme="iso-format")) == 2
+
+
+def test_cached_na_keeps_input_text():
+    a, b = unstruwwel(["unknown", " unknown "], "en", scheme="object")
+    assert a.text == "unknown"
+    assert b.text == " unknown "
+    for texts in (["", "   "], ["   ", ""]):
+        out = unstruwwel(texts, "de", scheme="object")
+        assert [p.text for p in out] == texts
+
+
+def test_disable_cache():
+    set_cache_size(0)
+    unstruwwel(["May 1856", "May 1856"], "en")
+    info = cache_info()
+    assert info.hits == 0
+    assert info.currsize == 0
+
+
+def test_numeric_inputs_bypass_cache():
+    unstruwwel(["1856", "1752/60", "1856"], "en")
+    assert cache_info().currsize == 0
+
+
+def test_lru_eviction():
+    cache = LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert cache.get("b") is MISSING
+    assert cache.get("a") == 1
+    assert cache.info().currsize == 2
+    with pytest.raises(ValueError):
+        LRUCache(-1)
@@ -0,0 +1,105 @@
+import io
+import json
+
+import pytest
+
+from unstruwwel_py import cli
+
+CSV = "id,date\n1,19. Jh.\n2,(Guss vor 1906) 1897\n3,\n4,undatiert\n"
+
+
+def test_parse_csv_file(tmp_path, capsys):
+    src = tmp_path / "dates.csv"
+    src.write_text(CSV, encoding="utf-8")
+    out = tmp_path / "out.csv"
+    assert cli.main(["parse", str(src), "-c", "date", "-l", "de", "-o", str(out)]) == 0
+    assert out.read_text(encoding="utf-8").splitlines() == [
+        "id,date,start,end",
+        "1,19. Jh.,1801,1900",
+        "2,(Guss vor 1906) 1897,-inf,1905",
+        "2,(Guss vor 1906) 1897,1897,1897",
+        "3,,,",
+        "4,undatiert,,",
+    ]
+    assert "parsed 4 rows (5 results)" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_parse_jsonl_stdin(monkeypatch, capsys, workers):
+    lines = [{"d": "1856"}, {"d": None}, {"d": "before 1800"}] * 3
+    monkeypatch.setattr("sys.stdin", io.StringIO("\n".join(map(json.dumps, lines))))
+    argv = ["parse", "-f", "jsonl", "-c", "d", "-l", "en", "-s", "object", "-q"]
+    argv += ["--batch-size", "2"]
+    if workers:
+        argv += ["--workers", str(workers)]
+    assert cli.main(argv) == 0
+    out = capsys.readouterr()
+    rows = [json.loads(line) for line in out.out.splitlines()]
+    assert len(rows) == 9 and not out.err
+    assert rows[0] == {
+        "d": "1856",
+        "start": 1856,
+        "end": 1856,
+        "iso": "1856-01-01/1856-12-31",
+        "fuzzy": 0,
+        "express": 0,
+    }
+    assert rows[1]["iso"] is None
+    assert (rows[2]["start"], rows[2]["express"]) == ("-inf", -1)
+
+
+def test_parse_tsv_iso_and_errors(tmp_path, capsys):
+    src = tmp_path / "dates.tsv"
+    src.write_text("date\nMärz 1755\n", encoding="utf-8")
+    assert (
+        cli.main(["parse", str(src), "-c", "date", "-l", "de", "-s", "iso-format"]) == 0
+    )
+    assert capsys.readouterr().out.splitlines() == [
+        "date\tiso",
+        "März 1755\t1755-03-01/1755-03-31",
+    ]
+    assert cli.main(["parse", str(src), "-c", "nope", "-q"]) == 2
+    assert cli.main(["parse", str(src), "-c", "date", "-s", "object"]) == 2
+    assert "language is required" in capsys.readouterr().err
+
+
+def test_jsonl_numbers_and_missing_column(monkeypatch, capsys):
+    lines = [{"d": 1750}, {"d": "1856"}]
+    jsonl = "\n".join(map(json.dumps, lines))
+    monkeypatch.setattr("sys.stdin", io.StringIO(jsonl))
+    assert cli.main(["parse", "-f", "jsonl", "-c", "d", "-l", "en", "-q"]) == 0
+    rows = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [(r["start"], r["end"]) for r in rows] == [
+        (1750, 1750),
+        (1856, 1856),
+    ]
+    # A zero is a value, not an empty cell
+    assert cli._cell(0) == "0" and cli._cell("") is None
+    monkeypatch.setattr("sys.stdin", io.StringIO(jsonl))
+    assert cli.main(["parse", "-f", "jsonl", "-c", "date", "-l", "en", "-q"]) == 2
+    captured = capsys.readouterr()
+    assert not captured.out and "no column 'date'" in captured.err
+
+
+def test_jsonl_line_must_be_an_object(monkeypatch, capsys):
+    monkeypatch.setattr("sys.stdin", io.StringIO('{"d": "1750"}\n[1, 2]\n'))
+    assert cli.main(["parse", "-f", "jsonl", "-c", "d", "-l", "en", "-q"]) == 2
+    assert "line 2: expected a JSON object" in capsys.readouterr().err
+
+
+def test_csv_header_without_rows(tmp_path, capsys):
+    src = tmp_path / "empty.csv"
+    src.write_text("id,date\n", encoding="utf-8")
+    assert cli.main(["parse", str(src), "-c", "date", "-l", "de", "-q"]) == 0
+    assert capsys.readouterr().out.splitlines() == ["id,date,start,end"]
+    assert cli.main(["parse", str(src), "-c", "datum", "-l", "de", "-q"]) == 2
+    assert "no column 'datum'" in capsys.readouterr().err
+
+
+def test_csv_stdin_keeps_line_breaks_in_quoted_cells(monkeypatch, tmp_path):
+    data = b'date,note\r\n19. Jh.,"a\r\nb"\r\n'
+    monkeypatch.setattr("sys.stdin", io.TextIOWrapper(io.BytesIO(data), "utf-8"))
+    out = tmp_path / "out.csv"
+    assert cli.main(["parse", "-c", "date", "-l", "de", "-o", str(out), "-q"]) == 0
+    with open(out, newline="", encoding="utf-8") as f:
+        assert f.read() == 'date,note,start,end\n19. Jh.,"a\r\nb",1801,1900\n'
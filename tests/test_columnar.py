@@ -0,0 +1,53 @@
+import math
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from unstruwwel_py import unstruwwel  # noqa: E402
+from unstruwwel_py.columnar import TimeSpanArrays, unstruwwel_array  # noqa: E402
+
+DATES = [
+    "1856",
+    "before April 1755",
+    "after 1900",
+    "Winter 1620",
+    "last third 17th cent",
+    "unknown",
+    None,
+    "1897 (before 1906)",
+    "1752/60",
+]
+
+
+def _spans(arrays):
+    return [
+        (None if math.isnan(s) else s, None if math.isnan(e) else e)
+        for s, e in zip(arrays.start.tolist(), arrays.end.tolist())
+    ]
+
+
+@pytest.mark.parametrize("dedupe", [False, True])
+def test_arrays_match_time_span(dedupe):
+    arrays = unstruwwel_array(DATES * 3, "en", dedupe=dedupe)
+    assert isinstance(arrays, TimeSpanArrays)
+    assert arrays.start.dtype == np.float64
+    assert arrays.fuzzy.dtype == np.int8
+    assert _spans(arrays) == unstruwwel(DATES * 3, "en")
+
+
+def test_arrays_row_index_and_missing_values():
+    arrays = unstruwwel_array(DATES, "en")
+    # "1897 (before 1906)" yields two results for the same row
+    assert arrays.row.tolist() == [0, 1, 2, 3, 4, 5, 6, 7, 7, 8]
+    assert math.isnan(arrays.start[5]) and math.isnan(arrays.end[6])
+    assert arrays.start[1] == -np.inf and arrays.end[2] == np.inf
+    assert arrays.express.tolist()[:3] == [0, -1, 1]
+
+
+def test_arrays_scheme_and_generators():
+    arrays = unstruwwel(DATES, "en", scheme="arrays")
+    assert _spans(arrays) == unstruwwel(DATES, "en")
+    from_gen = unstruwwel_array((d for d in ["1856", "circa 18th century"]), "en")
+    assert from_gen.row.tolist() == [0, 1]
+    assert from_gen.fuzzy.tolist() == [0, -1]
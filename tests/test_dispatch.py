@@ -0,0 +1,35 @@
+from unstruwwel_py.core import _route
+from unstruwwel_py.parsers import parse_numeric
+from unstruwwel_py.resources import get_language_spec
+from unstruwwel_py.scan import scan_text
+
+
+def _names(text, lang):
+    spec = get_language_spec(lang)
+    return _route(text, spec.patterns, scan_text(text.lower(), spec))
+
+
+def test_plain_year_goes_straight_to_date():
+    assert _names("1856", "en") == ["date"]
+    assert _names("-450", "en") == ["date"]
+
+
+def test_interval_and_decade_routes():
+    assert _names("1752/60", "en") == ["year_interval", "date"]
+    assert _names("1840s", "en") == ["decade", "century"]
+    assert _names("1760er Jahre", "de") == ["decade", "century"]
+
+
+def test_keyword_routes_keep_priority():
+    assert _names("before April 1755", "en") == ["before_after", "century"]
+    assert _names("March 1755", "en") == ["month_year", "day_month_year", "century"]
+    assert _names("Herbst 1750", "de") == ["season", "century"]
+
+
+def test_parse_numeric_fast_path():
+    assert parse_numeric("1752").time_span == (1752, 1752)
+    assert parse_numeric("-450").time_span == (-450, -450)
+    assert parse_numeric("1752/60").time_span == (1752, 1760)
+    assert parse_numeric("1701/1702").time_span == (1701, 1702)
+    for txt in ["", "12", "12345", "-12", "1752-60", "1752/", "/60", "1460?", "١٧٥٢"]:
+        assert parse_numeric(txt) is None
@@ -0,0 +1,72 @@
+import pytest
+
+from unstruwwel_py import extract_dates, iter_dates, unstruwwel
+
+NOTE = (
+    "Das Gebäude wurde ca. 1750 errichtet, im 19. Jh. umgebaut und nach dem "
+    "Sommer 1820 erweitert. Akten: 13. Juli 1882 - März 1890; Fotos der "
+    "1920er Jahre, vor 1906, 1752/60."
+)
+
+
+def test_extracts_every_form_with_offsets():
+    found = extract_dates(NOTE, "de")
+    assert [d.text for d in found] == [
+        "ca. 1750",
+        "19. Jh.",
+        "nach dem Sommer 1820",
+        "13. Juli 1882",
+        "März 1890",
+        "1920er Jahre",
+        "vor 1906",
+        "1752/60",
+    ]
+    for d in found:
+        assert NOTE[d.start : d.end] == d.text
+    assert [d.result for d in found] == [
+        (1750, 1750),
+        (1801, 1900),
+        (1820, float("inf")),
+        (1882, 1882),
+        (1890, 1890),
+        (1920, 1929),
+        (float("-inf"), 1905),
+        (1752, 1760),
+    ]
+
+
+@pytest.mark.parametrize(
+    "text, lang",
+    [
+        ("last third 17th cent", "en"),
+        ("August 11, 1958", "en"),
+        ("1840s", "en"),
+        ("ca. 1. Hälfte 2. Jh.", "de"),
+        ("5. Jh. v. Chr", "de"),
+        ("vor dem Winter 1700", "de"),
+        ("avant 1800", "fr"),
+    ],
+)
+def test_agrees_with_field_parser(text, lang):
+    (d,) = extract_dates(f"({text}).", lang, scheme="iso-format")
+    assert (d.start, d.text) == (1, text)
+    assert d.result == unstruwwel(text, lang, scheme="iso-format")[0]
+
+
+def test_numbers_are_not_split():
+    found = extract_dates("Inv. 12345, Nr. 17 - 1750-1760 und -450", "de")
+    assert [d.text for d in found] == ["1750", "1760", "-450"]
+
+
+def test_fuzzy_prefix_and_offsets_after_wide_lowercase():
+    found = extract_dates("İstanbul, probably 1750", "en", scheme="object")
+    (d,) = found
+    assert (d.start, d.text) == (10, "probably 1750")
+    assert d.result.fuzzy == 1
+
+
+def test_iter_dates_is_lazy():
+    it = iter_dates("1750 " * 100_000, "en")
+    assert next(it).end == 4
+    with pytest.raises(ValueError):
+        iter_dates("1750", "xx")
@@ -0,0 +1,81 @@
+import math
+import random
+
+import pytest
+
+from unstruwwel_py import IntervalIndex, unstruwwel, unstruwwel_array
+
+INF = float("inf")
+
+
+def _random_spans(rng, n):
+    spans = []
+    for _ in range(n):
+        kind = rng.random()
+        s = rng.randint(1500, 1900)
+        if kind < 0.1:
+            spans.append((None, None))
+        elif kind < 0.2:
+            spans.append((-INF, s))
+        elif kind < 0.3:
+            spans.append((s, INF))
+        else:
+            spans.append((s, s + rng.choice([0, 0, 9, 99, rng.randint(0, 300)])))
+    return spans
+
+
+def _brute(spans, keep):
+    return [i for i, (s, e) in enumerate(spans) if s is not None and keep(s, e)]
+
+
+def test_queries_match_brute_force():
+    rng = random.Random(3)
+    spans = _random_spans(rng, 2_000)
+    index = IntervalIndex.from_results(spans)
+    assert len(index) == sum(s is not None for s, _ in spans)
+    for _ in range(200):
+        a = rng.randint(1450, 1950)
+        b = a + rng.choice([0, 5, 50, 300])
+        assert index.overlapping(a, b) == _brute(spans, lambda s, e: s <= b and e >= a)
+        assert index.containing(a, b) == _brute(spans, lambda s, e: s <= a and e >= b)
+        assert index.within(a, b) == _brute(spans, lambda s, e: a <= s and e <= b)
+        assert index.at(a) == _brute(spans, lambda s, e: s <= a <= e)
+        assert index.before(a) == _brute(spans, lambda s, e: e < a)
+        assert index.after(a) == _brute(spans, lambda s, e: s > a)
+    assert index.overlapping(-INF, INF) == _brute(spans, lambda s, e: True)
+    assert index.within(-INF, INF) == _brute(spans, lambda s, e: True)
+
+
+def test_from_arrays_matches_from_results():
+    pytest.importorskip("numpy")
+    texts = ["1750", "vor 1600", "nach 1800", "undatiert", "18. Jh.", "1760er Jahre"]
+    texts *= 50
+    by_arrays = IntervalIndex.from_arrays(unstruwwel_array(texts, "de"))
+    by_results = IntervalIndex.from_results(unstruwwel(texts, "de"))
+    for a, b in [(1750, 1760), (1599, 1599), (1700, 1800), (1801, 1801)]:
+        assert by_arrays.overlapping(a, b).tolist() == by_results.overlapping(a, b)
+        assert by_arrays.within(a, b).tolist() == by_results.within(a, b)
+        assert by_arrays.before(a).tolist() == by_results.before(a)
+        assert by_arrays.after(a).tolist() == by_results.after(a)
+    assert by_arrays.before(1600).tolist() == list(range(1, 300, 6))
+    assert by_arrays.containing(2000, 2001).dtype.kind == "i"
+    empty = IntervalIndex.from_arrays(unstruwwel_array([], "de"))
+    assert len(empty) == 0 and empty.at(1750).tolist() == []
+
+
+def test_results_objects_and_edge_cases():
+    parsed = unstruwwel(["1750", "undatiert", "nach 1800"], "de", scheme="object")
+    index = IntervalIndex.from_results(parsed)
+    assert index.at(1750) == [0]
+    assert index.after(1800) == [2]
+    assert index.containing(1900, 2000) == [2]
+
+    empty = IntervalIndex([], [])
+    assert len(empty) == 0 and empty.overlapping(0, 1) == [] and empty.after(0) == []
+    assert IntervalIndex([1, math.nan], [2, 3], ids=[10, 20]).at(1) == [10]
+    with pytest.raises(ValueError):
+        index.overlapping(1760, 1750)
+    with pytest.raises(ValueError):
+        index.at(math.nan)
+    with pytest.raises(ValueError):
+        IntervalIndex([1760], [1750])
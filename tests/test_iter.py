@@ -0,0 +1,30 @@
+import itertools
+
+import pytest
+
+from unstruwwel_py import iter_unstruwwel, unstruwwel
+
+DATES = ["1856", "1897 (before 1906)", None, "Winter 1620", "unknown"]
+
+
+@pytest.mark.parametrize("scheme", ["time-span", "iso-format", "object"])
+def test_iter_matches_unstruwwel(scheme):
+    pairs = list(iter_unstruwwel(DATES, "en", scheme=scheme))
+    assert [r for _, r in pairs] == unstruwwel(DATES, "en", scheme=scheme)
+    assert [i for i, _ in pairs] == [0, 1, 1, 2, 3, 4]
+
+
+def test_iter_is_lazy_on_unbounded_input():
+    rows = iter_unstruwwel(itertools.cycle(["1856", "19. Jh."]), "de")
+    assert list(itertools.islice(rows, 4)) == [
+        (0, (1856, 1856)),
+        (1, (1801, 1900)),
+        (2, (1856, 1856)),
+        (3, (1801, 1900)),
+    ]
+
+
+def test_iter_validates_eagerly():
+    with pytest.raises(ValueError):
+        iter_unstruwwel(["1856"], scheme="object")
+    assert list(iter_unstruwwel("1856")) == [(0, (1856, 1856))]
@@ -0,0 +1,42 @@
+from unstruwwel_py import unstruwwel
+from unstruwwel_py.keywords import (
+    AFTER,
+    APPROXIMATE,
+    APPROXIMATE_DEFAULT,
+    BEFORE,
+    LAST,
+    UNCERTAIN,
+    KeywordScanner,
+    fuzzy_from_hits,
+)
+from unstruwwel_py.parsers import parse_before_after
+from unstruwwel_py.resources import get_language_spec
+
+
+def test_scanner_matches_substring_semantics():
+    scanner = KeywordScanner({"a": ["he", "she", "hers"], "b": ["is", "his"]})
+    assert scanner.scan("ushers") == {"a": 1}
+    assert scanner.scan("this") == {"b": 1}
+    assert scanner.scan("sheis") == {"a": 0, "b": 3}
+    assert scanner.scan("xyz") == {}
+    assert KeywordScanner({"a": [""]}).scan("xyz") == {"a": 0}
+
+
+def test_language_scanner_classes():
+    spec = get_language_spec("de")
+    assert spec.keywords is spec.keywords
+    hits = spec.keywords.scan("vor dem letzten drittel, ca. 1750")
+    assert hits[BEFORE] == 0
+    assert LAST in hits and APPROXIMATE in hits and APPROXIMATE_DEFAULT in hits
+    assert AFTER not in hits
+    assert fuzzy_from_hits(hits) == -1
+    assert fuzzy_from_hits(spec.keywords.scan("vermutlich um 1750")) == 1
+    assert UNCERTAIN not in get_language_spec("en").keywords.scan("before 1750")
+
+
+def test_keyword_driven_parsers():
+    spec = get_language_spec("de")
+    assert unstruwwel(["nach 1750"], "de") == [(1751, float("inf"))]
+    # before/after keywords only count at the start of the text
+    assert parse_before_after("in 1750 vor", spec.patterns, spec, 0) is None
+    assert unstruwwel(["last third 17th cent"], "en") == [(1667, 1700)]
@@ -1,6 +1,14 @@
 import pytest
 
-from unstruwwel_py.lang import guess_language
+from unstruwwel_py import unstruwwel, unstruwwel_batch
+from unstruwwel_py.lang import (
+    clear_guess_cache,
+    guess_column_language,
+    guess_language,
+    lingua_enabled,
+    preload_detector,
+    set_lingua_enabled,
+)
 
 
 @pytest.mark.parametrize("lang", ["en", "de", "fr"])
@@ -35,3 +43,63 @@ def test_guess_language_message(lang_jsons, capsys):
     guess_language(data, verbose=True)
     captured = capsys.readouterr()
     assert captured.out
+
+
+def test_guess_language_is_cached(monkeypatch):
+    from unstruwwel_py import lang
+
+    clear_guess_cache()
+    calls = []
+    original = lang._guess_text
+
+    def counting(text, use_lingua=True):
+        calls.append(text)
+        return original(text, use_lingua)
+
+    monkeypatch.setattr(lang, "_guess_text", counting)
+    for _ in range(3):
+        assert guess_language(["Jahrhundert"]) == "de"
+        guess_language(["ca 1750"])
+    assert calls == ["ca 1750"]
+
+
+def test_guess_column_language():
+    assert guess_column_language(["19. Jh.", "1760er Jahre"]) == ("de", True)
+    code, confident = guess_column_language(["century", "siècle"])
+    assert code == "en"
+    assert not confident
+    assert guess_column_language(["1750", "1760"], default="de") == ("de", False)
+
+
+def test_batch_row_fallback():
+    dates = ["18th century", "19e siècle"]
+    assert unstruwwel_batch(dates, row_fallback=True) == unstruwwel(dates)
+
+
+def test_no_lingua_mode(monkeypatch):
+    from unstruwwel_py import lang
+
+    def fail(*args, **kwargs):
+        raise AssertionError("lingua must not be used")
+
+    monkeypatch.setattr(lang, "_get_detector", fail)
+    set_lingua_enabled(False)
+    try:
+        assert not lingua_enabled()
+        assert preload_detector(background=True) is None
+        assert guess_language(["vor 1750"]) == "de"
+        assert guess_language(["vor 1750 und 1760"], use_lingua=False) == "de"
+        with pytest.raises(ValueError):
+            guess_language(["1750"])
+    finally:
+        set_lingua_enabled(True)
+
+
+def test_switching_lingua_mode_drops_cached_results():
+    pytest.importorskip("lingua")
+    assert unstruwwel("été 1750", scheme="iso-format") == ["1750-06-01/1750-08-31"]
+    set_lingua_enabled(False)
+    try:
+        assert unstruwwel("été 1750", scheme="iso-format") == [(None, None)]
+    finally:
+        set_lingua_enabled(True)
@@ -0,0 +1,89 @@
+import time
+
+import pytest
+
+from unstruwwel_py import (
+    get_input_limits,
+    get_regex_engine,
+    set_input_limits,
+    set_regex_engine,
+    unstruwwel,
+)
+from unstruwwel_py.cli import main
+from unstruwwel_py.core import _PARSERS
+
+SAMPLE = [
+    "1750",
+    "März 1755",
+    "vor dem Winter 1700",
+    "ca. 1. Hälfte 2. Jh.",
+    "5. Jh. v. Chr",
+    "1760er Jahre",
+    "(guss vor 1906) 1897",
+    "13. juli 1882 - 15. juli 1882",
+    "undatiert",
+]
+
+
+@pytest.fixture(autouse=True)
+def _reset():
+    yield
+    set_input_limits()
+    set_regex_engine("re")
+
+
+def test_max_length():
+    set_input_limits(max_length=12)
+    assert get_input_limits() == (12, None)
+    assert unstruwwel(["März 1755", "19. Jahrhundert"], "de") == [
+        (1755, 1755),
+        (None, None),
+    ]
+    (na,) = unstruwwel("19. Jahrhundert", "de", scheme="object")
+    assert na.text == "19. Jahrhundert" and na.time_span == (None, None)
+    with pytest.raises(ValueError):
+        set_input_limits(max_length=-1)
+
+
+def test_time_budget_is_checked_between_parsers(monkeypatch):
+    slow = _PARSERS["before_after"]
+
+    def before_after(*args):
+        time.sleep(0.02)
+        return slow(*args)
+
+    monkeypatch.setitem(_PARSERS, "before_after", before_after)
+    set_input_limits(time_budget=0.01)
+    # The parser after the slow one is skipped
+    assert unstruwwel("sommer 1750", "de") == [(None, None)]
+    set_input_limits()
+    assert unstruwwel("sommer 1750", "de") == [(1750, 1750)]
+    with pytest.raises(ValueError):
+        set_input_limits(time_budget=0)
+
+
+def test_unknown_engine():
+    with pytest.raises(ValueError):
+        set_regex_engine("pcre")
+    assert get_regex_engine() == "re"
+
+
+def test_re2_engine_gives_the_same_results():
+    pytest.importorskip("re2")
+    expected = unstruwwel(SAMPLE, "de", scheme="iso-format")
+    set_regex_engine("re2")
+    assert get_regex_engine() == "re2"
+    assert unstruwwel(SAMPLE, "de", scheme="iso-format") == expected
+    # Linear time: this takes seconds with backtracking
+    assert unstruwwel("1." + " " * 20_000 + "x", "de") == [(None, None)]
+
+
+def test_cli_max_length(tmp_path, capsys):
+    src = tmp_path / "in.csv"
+    src.write_text("date\nMärz 1755\n19. Jahrhundert\n", encoding="utf-8")
+    assert (
+        main(["parse", str(src), "-c", "date", "-l", "de", "--max-length", "12", "-q"])
+        == 0
+    )
+    out = capsys.readouterr().out.splitlines()
+    assert out[1:] == ["März 1755,1755,1755", "19. Jahrhundert,,"]
@@ -0,0 +1,42 @@
+from unstruwwel_py import unstruwwel
+from unstruwwel_py.parsers.intervals import parse_multi_dates
+from unstruwwel_py.resources import get_language_spec
+
+
+def _multi(text, lang="de"):
+    spec = get_language_spec(lang)
+    found = parse_multi_dates(text, spec.patterns, spec, 0)
+    return [(p.time_span, span) for p, span in found]
+
+
+def test_emitted_by_kind_then_position():
+    assert _multi("1. januar 1750 (vor 1800) 1820 - nach 1900 - 2. mai 1760") == [
+        ((1750, 1750), (0, 14)),
+        ((1760, 1760), (45, 56)),
+        ((float("-inf"), 1799), (16, 24)),
+        ((1901, float("inf")), (33, 42)),
+        ((1820, 1820), (26, 30)),
+    ]
+    assert _multi("before june 1860 (after winter 1700)", "en") == [
+        # after + season is emitted before before + month
+        ((1701, float("inf")), (18, 35)),
+        ((float("-inf"), 1860), (0, 16)),
+    ]
+
+
+def test_plain_years_skip_covered_spans():
+    # 1882 and 1750 sit inside keyword matches; 1897 does not
+    assert _multi("(guss vor 1906) 13. juli 1882 - nach dem sommer 1750 1897") == [
+        ((1882, 1882), (16, 29)),
+        ((1750, float("inf")), (32, 52)),
+        ((float("-inf"), 1905), (6, 14)),
+        ((1897, 1897), (53, 57)),
+    ]
+
+
+def test_long_notes():
+    note = " - ".join(["(vor 1750) 13. juli 1882", "1801"] * 2_000)
+    result = unstruwwel([note], "de")
+    assert len(result) == 6_000
+    assert result[0] == (1882, 1882)
+    assert result[-1] == (1801, 1801)
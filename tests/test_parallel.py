@@ -0,0 +1,36 @@
+import pytest
+
+from unstruwwel_py import unstruwwel
+from unstruwwel_py.parallel import default_chunksize
+
+DATES_DE = [
+    "19. Jh.",
+    "(Guss vor 1906) 1897",
+    "undatiert",
+    None,
+    "1760er Jahre",
+    "13. Juli 1882 - 15. Juli 1882",
+    "vor dem Sommer 1907",
+]
+
+
+@pytest.mark.parametrize("scheme", ["time-span", "iso-format", "object"])
+def test_workers_keep_order_and_multi_results(scheme):
+    dates = DATES_DE * 5
+    expected = unstruwwel(dates, "de", scheme=scheme)
+    assert unstruwwel(dates, "de", scheme=scheme, workers=2, chunksize=3) == expected
+    assert (
+        unstruwwel(dates, "de", scheme=scheme, workers=2, chunksize=2, dedupe=True)
+        == expected
+    )
+
+
+def test_workers_with_language_guessing():
+    dates = ["19. Jh.", "before 1856", "1752/60"]
+    assert unstruwwel(dates, workers=2, chunksize=1) == unstruwwel(dates)
+
+
+def test_default_chunksize_bounds():
+    assert default_chunksize(0, 4) == 256
+    assert default_chunksize(100_000, 4) == 6250
+    assert default_chunksize(10**8, 4) == 10_000
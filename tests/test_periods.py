@@ -1,6 +1,11 @@
+import pickle
+import sys
+
 import pytest
 from dataclasses import FrozenInstanceError
 
+from unstruwwel_py.core import Parsed
+from unstruwwel_py.dates import Period
 from unstruwwel_py.periods import Periods
 
 
@@ -13,3 +18,14 @@ def test_invalid_period():
         x.iso_format = "1760-01-01?/1760-12-31?"
     with pytest.raises(FrozenInstanceError):
         x.time_span = (1760, 1760)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="slots=True needs 3.10")
+def test_results_are_slotted():
+    p = Period(start=(1750, 1, 1), end=(1750, 12, 31))
+    x = Parsed(text="", time_span=p.time_span, iso_format=p.iso_format)
+    for obj in (p, x):
+        assert not hasattr(obj, "__dict__")
+    with pytest.raises(AttributeError):
+        p.note = "x"
+    assert pickle.loads(pickle.dumps(x)) == x
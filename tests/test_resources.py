@@ -0,0 +1,111 @@
+import re
+
+import pytest
+from dataclasses import FrozenInstanceError
+
+from unstruwwel_py import resources, unstruwwel
+from unstruwwel_py.resources import (
+    clear_spec_cache,
+    default_patterns,
+    get_language_spec,
+    reload_language_spec,
+)
+from unstruwwel_py.snapshot import SNAPSHOT_LANGUAGES, load_snapshot
+
+
+@pytest.fixture
+def count_loads(monkeypatch):
+    calls = []
+    original = resources._load_json
+
+    def counting(name):
+        calls.append(name)
+        return original(name)
+
+    monkeypatch.setattr(resources, "_load_json", counting)
+    clear_spec_cache()
+    yield calls
+    clear_spec_cache()
+
+
+def test_spec_is_loaded_once(count_loads):
+    first = get_language_spec("de")
+    for _ in range(10):
+        assert get_language_spec("DE") is first
+    # Packaged languages come from the snapshot, without reading JSON
+    assert count_loads == []
+
+
+def test_spec_reload_and_clear(count_loads):
+    first = get_language_spec("en")
+    second = reload_language_spec("en")
+    assert second is not first
+    assert second == first
+    assert get_language_spec("en") is second
+    clear_spec_cache("en")
+    assert get_language_spec("en") == first
+    assert count_loads == ["en"]
+
+
+def test_reload_drops_cached_results(monkeypatch):
+    original = resources._load_json
+
+    def with_zuvor(name):
+        obj = original(name)
+        if name == "de":
+            obj["before"] = obj["before"] + ["zuvor"]
+        return obj
+
+    assert unstruwwel("zuvor 1750", "de") == [(None, None)]
+    monkeypatch.setattr(resources, "_load_json", with_zuvor)
+    try:
+        reload_language_spec("de")
+        assert unstruwwel("zuvor 1750", "de") == [(float("-inf"), 1749)]
+    finally:
+        clear_spec_cache()
+
+
+def test_snapshot_is_up_to_date():
+    specs = load_snapshot()
+    assert specs is not None, "run python -m unstruwwel_py.snapshot"
+    assert sorted(specs) == sorted(SNAPSHOT_LANGUAGES)
+    for lang, spec in specs.items():
+        assert spec == resources._build_spec_from_json(resources._load_json(lang))
+
+
+def test_json_fallback_without_snapshot(monkeypatch, count_loads):
+    monkeypatch.setattr(resources, "_SNAPSHOT", {})
+    spec = get_language_spec("fr")
+    assert spec is not None and spec.months["mars"] == 3
+    assert count_loads == ["fr"]
+    assert get_language_spec("nl").name
+
+
+def test_spec_is_immutable():
+    spec = get_language_spec("fr")
+    with pytest.raises(FrozenInstanceError):
+        spec.before = frozenset()
+    assert isinstance(spec.before, frozenset)
+
+
+def test_unknown_language_spec():
+    assert get_language_spec("bo") is None
+    assert get_language_spec("../en") is None
+
+
+def test_patterns_are_compiled_once():
+    spec = get_language_spec("de")
+    patterns = spec.patterns
+    assert spec.patterns is patterns
+    assert isinstance(patterns.month_year, re.Pattern)
+    assert patterns.month_year.fullmatch("märz 1755")
+    assert patterns.de_date.search("13. juli 1882")
+    assert patterns.century is not None
+    assert patterns.century.search("19. jh.")
+
+
+def test_default_patterns_without_spec():
+    patterns = default_patterns()
+    assert default_patterns() is patterns
+    assert patterns.month_year.fullmatch("june 1963")
+    assert patterns.century is None
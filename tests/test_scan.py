@@ -0,0 +1,49 @@
+import random
+import re
+
+from unstruwwel_py import unstruwwel
+from unstruwwel_py.keywords import BEFORE
+from unstruwwel_py.parsers import parse_date, parse_decade, parse_year_interval
+from unstruwwel_py.resources import get_language_spec
+from unstruwwel_py.scan import scan_text
+
+
+def test_scan_facts():
+    spec = get_language_spec("de")
+    scan = scan_text("vor 1750 (ca. 12345)", spec)
+    assert scan.hits[BEFORE] == 0
+    assert scan.digit_runs == ((4, 8), (14, 19))
+    assert scan.has_year and scan.has_alpha and scan.has_parens and scan.has_dot
+    assert not scan.has_range_dash
+    assert not scan_text("12. jh.", spec).has_year
+    assert not scan_text("1750", spec).has_alpha
+
+
+def test_years_match_regex():
+    rng = random.Random(7)
+    alphabet = "0123456789-/ a"
+    for _ in range(5_000):
+        low = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 14)))
+        assert scan_text(low, None).years() == re.findall(r"-?\d{3,4}", low)
+
+
+def test_fullmatch_year():
+    assert scan_text("1750", None).fullmatch_year() == "1750"
+    assert scan_text("-500", None).fullmatch_year() == "-500"
+    assert scan_text("17500", None).fullmatch_year() is None
+    assert scan_text("a1750", None).fullmatch_year() is None
+    assert scan_text("--750", None).fullmatch_year() is None
+
+
+def test_parsers_agree_with_and_without_scan():
+    spec = get_language_spec("en")
+    for text in ["1750", "-750", "1840s", "1752/60", "1752/", "17500", "750s"]:
+        low = text.lower()
+        scan = scan_text(low, spec)
+        for with_scan, without in [
+            (parse_date(low, text, spec, 0, scan), parse_date(low, text, spec, 0)),
+            (parse_decade(low, text, spec, 0, scan), parse_decade(low, text, spec, 0)),
+            (parse_year_interval(text, 0, scan), parse_year_interval(text, 0)),
+        ]:
+            assert with_scan == without
+    assert unstruwwel(["1760er Jahre"], "de") == [(1760, 1769)]
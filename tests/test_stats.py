@@ -0,0 +1,42 @@
+from unstruwwel_py import core, stats, unstruwwel
+from unstruwwel_py.cache import cache_clear
+
+DATES = ["1856", "vor 1856", "März 1755", "19. Jh.", "undatiert", "xyz 12"]
+
+
+def test_collect_counts_parsers_and_restores():
+    originals = (core.parse_numeric, core._na, dict(core._PARSERS))
+    cache_clear()
+    with stats.collect() as s:
+        assert stats.get_stats() is s
+        unstruwwel(DATES, "de")
+        unstruwwel(DATES, "de")
+    assert stats.get_stats() is None
+    assert (core.parse_numeric, core._na, core._PARSERS) == originals
+
+    assert s.parsers["numeric"].attempts == 12
+    assert s.parsers["numeric"].hits == 2
+    assert s.parsers["before_after"].hits == 1
+    assert s.parsers["month_year"].hits == 1
+    assert s.parsers["century"].hits == 1
+    # undatiert and "xyz 12" fall back to NA; the second call hits the cache
+    assert s.fallbacks == 2
+    assert (s.cache_hits, s.cache_misses) == (5, 5)
+    assert s.parsers["multi_dates"].ns > 0
+    assert "before_after" in s.report()
+
+
+def test_results_unchanged_and_reset():
+    expected = unstruwwel(DATES, "de")
+    s = stats.enable()
+    try:
+        cache_clear()
+        assert unstruwwel(DATES, "de") == expected
+        unstruwwel(["vor 1900"])
+        assert s.guesses == 1
+        s.reset()
+        assert s.as_dict()["parsers"]["century"]["attempts"] == 0
+        unstruwwel(["20. Jh."], "de")
+        assert s.parsers["century"].hits == 1
+    finally:
+        stats.disable()